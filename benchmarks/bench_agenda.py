@@ -0,0 +1,47 @@
+"""
+Compara las consultas de agenda por médico contra el recorrido completo de
+Clinica.obtener_turnos().
+
+Uso: python -m benchmarks.bench_agenda [cantidad_turnos]
+"""
+
+import sys
+from datetime import timedelta
+from .comun import crear_clinica_sintetica, inicio_de_manana, medir
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    clinica = crear_clinica_sintetica(cantidad_turnos)
+    dia = inicio_de_manana() + timedelta(days=1)
+    desde = dia.replace(hour=9)
+    hasta = dia.replace(hour=13)
+
+    def por_recorrido():
+        return [
+            t
+            for t in clinica.obtener_turnos()
+            if t.obtener_medico().obtener_matricula() == "m7"
+            and desde <= t.obtener_fecha_hora() < hasta
+        ]
+
+    def por_agenda():
+        return clinica.obtener_turnos_medico_en_rango("m7", desde, hasta)
+
+    assert por_recorrido() == por_agenda()
+    repeticiones = 20
+    print(f"Turnos: {cantidad_turnos}")
+    print(f"Rango por recorrido:      {medir(por_recorrido, repeticiones):12.1f} us")
+    print(f"Rango por agenda:         {medir(por_agenda, repeticiones):12.1f} us")
+    print(
+        "Día completo por agenda:  "
+        f"{medir(lambda: clinica.obtener_turnos_medico_del_dia('m7', dia.date()), repeticiones):12.1f} us"
+    )
+    print(
+        "Próximo horario libre:    "
+        f"{medir(lambda: clinica.obtener_proximo_horario_libre('m7', desde), repeticiones):12.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
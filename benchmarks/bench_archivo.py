@@ -0,0 +1,114 @@
+"""
+Latencia de agendar turnos a medida que crece el historial, con todos los turnos
+pasados en memoria contra archivándolos por mes en disco. También mide cuánto
+tarda una recolección completa de basura, que crece con los objetos vivos.
+
+Uso: python -m benchmarks.bench_archivo [cantidad_maxima_turnos]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.archivo_turnos import ArchivoTurnos
+from src.utils.reloj import RelojCongelado
+from .comun import TODOS_LOS_DIAS
+
+CANTIDAD_PACIENTES = 5_000
+CANTIDAD_MEDICOS = 50
+TURNOS_POR_DIA = CANTIDAD_MEDICOS * 16
+MEDICIONES = 2_000
+
+
+def crear_clinica(cantidad_turnos: int, directorio: str | None) -> Clinica:
+    """
+    Agenda `cantidad_turnos` turnos día por día y avanza el reloj hasta dejarlos
+    todos en el pasado; con `directorio`, los archiva al terminar cada mes.
+    """
+    reloj = RelojCongelado(datetime(2020, 1, 1, 0, 0))
+    clinica = Clinica({}, {}, [], {}, reloj=reloj)
+    clinica.importar_pacientes(
+        Paciente(f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+        for i in range(CANTIDAD_PACIENTES)
+    )
+    for i in range(CANTIDAD_MEDICOS):
+        medico = Medico(f"Medico {i}", f"m{i}")
+        medico.agregar_especialidad(Especialidad("clinica", list(TODOS_LOS_DIAS)))
+        clinica.agregar_medico(medico)
+    if directorio is not None:
+        clinica.habilitar_archivo(ArchivoTurnos(directorio))
+    for n in range(cantidad_turnos):
+        dia, resto = divmod(n, TURNOS_POR_DIA)
+        inicio = datetime(2020, 1, 1, 8, 0) + timedelta(days=dia)
+        if reloj.ahora() < inicio - timedelta(hours=8):
+            if directorio is not None and inicio.day == 1:
+                clinica.archivar_turnos()
+            reloj.avanzar(inicio - timedelta(hours=8) - reloj.ahora())
+        clinica.agendar_turno(
+            str(10_000_000 + n % CANTIDAD_PACIENTES),
+            f"m{resto % CANTIDAD_MEDICOS}",
+            "clinica",
+            inicio + timedelta(minutes=30 * (resto // CANTIDAD_MEDICOS)),
+        )
+    reloj.avanzar(timedelta(days=2))
+    if directorio is not None:
+        clinica.archivar_turnos()
+    return clinica
+
+
+def medir_agendar(clinica: Clinica) -> tuple[float, float]:
+    """
+    Agenda turnos nuevos de a uno y devuelve la mediana y el percentil 99 de la
+    latencia, en microsegundos.
+    """
+    inicio = clinica.obtener_reloj().ahora() + timedelta(days=1)
+    latencias = []
+    for n in range(MEDICIONES):
+        fecha_hora = inicio + timedelta(minutes=30 * (n // CANTIDAD_MEDICOS))
+        comienzo = time.perf_counter()
+        clinica.agendar_turno(
+            str(10_000_000 + n % CANTIDAD_PACIENTES),
+            f"m{n % CANTIDAD_MEDICOS}",
+            "clinica",
+            fecha_hora,
+        )
+        latencias.append((time.perf_counter() - comienzo) * 1_000_000)
+    latencias.sort()
+    return latencias[len(latencias) // 2], latencias[len(latencias) * 99 // 100]
+
+
+def main():
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    cantidades = [maximo // 16, maximo // 4, maximo]
+    print(
+        f"{'historial':>10} {'modo':>10} {'en memoria':>11} "
+        f"{'p50 µs':>8} {'p99 µs':>8} {'gc ms':>8}"
+    )
+    for cantidad in cantidades:
+        for archivar in (False, True):
+            with tempfile.TemporaryDirectory() as directorio:
+                clinica = crear_clinica(
+                    cantidad, os.path.join(directorio, "archivo") if archivar else None
+                )
+                gc.collect()
+                p50, p99 = medir_agendar(clinica)
+                comienzo = time.perf_counter()
+                gc.collect()
+                recoleccion = (time.perf_counter() - comienzo) * 1000
+                print(
+                    f"{cantidad:>10} {'archivo' if archivar else 'memoria':>10} "
+                    f"{len(clinica.ver_turnos()):>11} {p50:>8.1f} {p99:>8.1f} "
+                    f"{recoleccion:>8.1f}"
+                )
+                del clinica
+                gc.collect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Mide la latencia de buscar pacientes por nombre (prefijo, nombre completo y con un
+error de tipeo) sobre una clínica con muchos pacientes.
+
+Uso: python -m benchmarks.bench_busqueda [cantidad_pacientes]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from .comun import medir
+
+NOMBRES = [
+    "Juan",
+    "María",
+    "José",
+    "Ana",
+    "Luis",
+    "Carmen",
+    "Carlos",
+    "Laura",
+    "Jorge",
+    "Lucía",
+    "Miguel",
+    "Sofía",
+    "Pedro",
+    "Marta",
+    "Diego",
+    "Paula",
+    "Pablo",
+    "Elena",
+    "Andrés",
+    "Julia",
+    "Tomás",
+    "Valentina",
+    "Martín",
+    "Camila",
+    "Federico",
+]
+APELLIDOS = [
+    "González",
+    "Rodríguez",
+    "Gómez",
+    "Fernández",
+    "López",
+    "Díaz",
+    "Martínez",
+    "Pérez",
+    "García",
+    "Sánchez",
+    "Romero",
+    "Sosa",
+    "Álvarez",
+    "Torres",
+    "Ruiz",
+    "Ramírez",
+    "Flores",
+    "Acosta",
+    "Benítez",
+    "Medina",
+    "Herrera",
+    "Suárez",
+    "Aguirre",
+    "Giménez",
+    "Gutiérrez",
+    "Pereyra",
+    "Rojas",
+    "Molina",
+    "Castro",
+]
+
+
+def nombre_aleatorio(azar: random.Random) -> str:
+    # Un sufijo numérico simula la variedad de apellidos de una base real.
+    return (
+        f"{azar.choice(NOMBRES)} {azar.choice(APELLIDOS)} "
+        f"{azar.choice(APELLIDOS)}{azar.randrange(5000)}"
+    )
+
+
+def main():
+    cantidad_pacientes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    azar = random.Random(42)
+    clinica = Clinica({}, {}, [], {})
+    comienzo = time.perf_counter()
+    clinica.importar_pacientes(
+        Paciente(nombre_aleatorio(azar), str(10_000_000 + i), datetime(1990, 1, 1))
+        for i in range(cantidad_pacientes)
+    )
+    print(
+        f"Pacientes: {cantidad_pacientes} - importados e indexados en "
+        f"{time.perf_counter() - comienzo:.1f} s"
+    )
+    consultas = {
+        "prefijo corto": "ma",
+        "prefijo de apellido": "gonz",
+        "nombre y apellido": "juan perez",
+        "apellido con sufijo": "rojas1234",
+        "error de tipeo": "fernadez",
+        "tipeo y prefijo": "lucia gomes",
+        "sin resultados": "zzzz",
+    }
+    for nombre, texto in consultas.items():
+        microsegundos = medir(lambda: clinica.buscar_pacientes(texto), 200)
+        resultados = len(clinica.buscar_pacientes(texto))
+        print(
+            f"{nombre:22} '{texto}': {microsegundos:8.1f} µs ({resultados} resultados)"
+        )
+
+
+if __name__ == "__main__":
+    main()
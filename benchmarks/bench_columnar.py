@@ -0,0 +1,51 @@
+"""
+Compara reportes sobre el almacén columnar contra el recorrido de objetos Turno.
+
+Uso: python -m benchmarks.bench_columnar [cantidad_turnos]
+"""
+
+import sys
+from collections import Counter
+from src.models import almacen_columnar
+from .comun import crear_clinica_sintetica, medir
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    clinica = crear_clinica_sintetica(cantidad_turnos)
+    almacen = clinica.habilitar_almacen_columnar()
+    motor = "NumPy" if almacen_columnar.np is not None else "Python puro"
+    print(f"Turnos: {cantidad_turnos} - agregación columnar con {motor}")
+
+    def por_medico_objetos():
+        return Counter(
+            t.obtener_medico().obtener_matricula() for t in clinica.ver_turnos()
+        )
+
+    def por_medico_y_dia_objetos():
+        return Counter(
+            (t.obtener_medico().obtener_matricula(), t.obtener_fecha_hora().date())
+            for t in clinica.ver_turnos()
+        )
+
+    def por_especialidad_objetos():
+        return Counter(t.obtener_especialidad() for t in clinica.ver_turnos())
+
+    assert dict(por_medico_y_dia_objetos()) == almacen.contar_por_medico_y_dia()
+    casos = [
+        ("Por médico", por_medico_objetos, almacen.contar_por_medico),
+        ("Por médico y día", por_medico_y_dia_objetos, almacen.contar_por_medico_y_dia),
+        ("Por especialidad", por_especialidad_objetos, almacen.contar_por_especialidad),
+    ]
+    for nombre, objetos, columnar in casos:
+        print(
+            f"{nombre:18} objetos: {medir(objetos, 5) / 1000:9.1f} ms - "
+            f"columnar: {medir(columnar, 5) / 1000:9.1f} ms"
+        )
+    print(
+        f"Histograma por hora columnar: {medir(almacen.histograma_por_hora, 5) / 1000:9.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
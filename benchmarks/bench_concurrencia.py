@@ -0,0 +1,93 @@
+"""
+Mide turnos agendados por segundo desde varios hilos, cada uno con sus propios
+médicos, usando un único lock global alrededor de la clínica contra el modo
+concurrente con un lock por médico. Se repite con la clínica en memoria y
+persistiendo en un archivo SQLite.
+
+Uso: python -m benchmarks.bench_concurrencia [turnos_por_hilo]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from threading import Barrier, Lock, Thread
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from .comun import TODOS_LOS_DIAS, inicio_de_manana
+
+MEDICOS_POR_HILO = 4
+
+
+def crear_clinica(cantidad_medicos: int, repositorio) -> Clinica:
+    clinica = Clinica({}, {}, [], {}, repositorio)
+    clinica.agregar_paciente(Paciente("Paciente", "10000000", datetime(1990, 1, 1)))
+    for i in range(cantidad_medicos):
+        medico = Medico(f"Medico {i}", f"m{i}")
+        medico.agregar_especialidad(Especialidad("clinica", list(TODOS_LOS_DIAS)))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def medir_hilos(cantidad_hilos: int, turnos_por_hilo: int, global_: bool, ruta):
+    repositorio = RepositorioSQLite(ruta) if ruta is not None else None
+    clinica = crear_clinica(cantidad_hilos * MEDICOS_POR_HILO, repositorio)
+    bloqueo = Lock()
+    if not global_:
+        clinica.habilitar_concurrencia()
+    inicio = inicio_de_manana()
+    barrera = Barrier(cantidad_hilos + 1)
+
+    def agendar(hilo: int):
+        barrera.wait()
+        for i in range(turnos_por_hilo):
+            matricula = f"m{hilo * MEDICOS_POR_HILO + i % MEDICOS_POR_HILO}"
+            fecha_hora = inicio + timedelta(minutes=30 * (i // MEDICOS_POR_HILO))
+            if global_:
+                with bloqueo:
+                    clinica.agendar_turno("10000000", matricula, "clinica", fecha_hora)
+            else:
+                clinica.agendar_turno("10000000", matricula, "clinica", fecha_hora)
+
+    hilos = [Thread(target=agendar, args=(h,)) for h in range(cantidad_hilos)]
+    for hilo in hilos:
+        hilo.start()
+    barrera.wait()
+    comienzo = time.perf_counter()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - comienzo
+    assert len(clinica.obtener_turnos()) == cantidad_hilos * turnos_por_hilo
+    if repositorio is not None:
+        repositorio.cerrar()
+    return cantidad_hilos * turnos_por_hilo / segundos
+
+
+def main():
+    turnos_por_hilo = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre, en_disco in (("memoria", False), ("sqlite", True)):
+            for cantidad_hilos in (1, 2, 4, 8):
+                resultados = []
+                for global_ in (True, False):
+                    ruta = None
+                    if en_disco:
+                        ruta = os.path.join(
+                            directorio, f"{cantidad_hilos}-{global_}.db"
+                        )
+                    resultados.append(
+                        medir_hilos(cantidad_hilos, turnos_por_hilo, global_, ruta)
+                    )
+                print(
+                    f"{nombre:8} - hilos: {cantidad_hilos} - lock global: "
+                    f"{resultados[0]:10.0f} turnos/s - lock por médico: "
+                    f"{resultados[1]:10.0f} turnos/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compara cuántos modelos por segundo se crean con el constructor validado contra
+el constructor confiable (desde_datos_confiables) que usa la carga desde el
+almacenamiento propio.
+
+Uso: python -m benchmarks.bench_construccion [cantidad]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.models.turno import Turno
+from src.models.receta import Receta
+from src.models.historia_clinica import HistoriaClinica
+from .comun import TODOS_LOS_DIAS, inicio_de_manana
+
+
+def por_segundo(crear, argumentos: list[tuple]) -> float:
+    comienzo = time.perf_counter()
+    for args in argumentos:
+        crear(*args)
+    return len(argumentos) / (time.perf_counter() - comienzo)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    paciente = Paciente("Paciente 0", "10000000", datetime(1990, 1, 1))
+    medico = Medico("Medico 0", "m0")
+    medico.agregar_especialidad(Especialidad("clinica", list(TODOS_LOS_DIAS)))
+    inicio = inicio_de_manana()
+    casos = {
+        "Paciente": (
+            Paciente,
+            [
+                (f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+                for i in range(cantidad)
+            ],
+        ),
+        "Medico": (Medico, [(f"Medico {i}", f"m{i}") for i in range(cantidad)]),
+        "Turno": (
+            Turno,
+            [
+                (paciente, medico, inicio + timedelta(minutes=30 * i), "clinica")
+                for i in range(cantidad)
+            ],
+        ),
+    }
+    print(f"Elementos: {cantidad}")
+    for nombre, (clase, argumentos) in casos.items():
+        validado = por_segundo(clase, argumentos)
+        confiable = por_segundo(clase.desde_datos_confiables, argumentos)
+        print(
+            f"{nombre:10} validado: {validado:12.0f}/s - confiable: "
+            f"{confiable:12.0f}/s ({confiable / validado:.1f}x)"
+        )
+
+    argumentos = [(paciente, medico, ["Paracetamol", "Ibuprofeno"])] * cantidad
+    validado = por_segundo(Receta, argumentos)
+    confiable = por_segundo(
+        Receta.desde_datos_confiables,
+        [args + (inicio,) for args in argumentos],
+    )
+    print(
+        f"{'Receta':10} validado: {validado:12.0f}/s - confiable: "
+        f"{confiable:12.0f}/s ({confiable / validado:.1f}x)"
+    )
+
+    turnos = [Turno.desde_datos_confiables(*args) for args in casos["Turno"][1]]
+    historia = HistoriaClinica(paciente)
+    validado = por_segundo(historia.agregar_turno, [(t,) for t in turnos])
+    historia = HistoriaClinica(paciente)
+    confiable = por_segundo(historia.agregar_turno, [(t, False) for t in turnos])
+    print(
+        f"{'Historia':10} validado: {validado:12.0f}/s - confiable: "
+        f"{confiable:12.0f}/s ({confiable / validado:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
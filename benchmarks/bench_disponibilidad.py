@@ -0,0 +1,66 @@
+"""
+Compara buscar el próximo horario libre de una especialidad recorriendo la grilla
+de horarios y consultando el índice de turnos, contra el motor de disponibilidad
+con máscaras por médico y día, a medida que crece la cantidad de turnos agendados.
+
+Uso: python -m benchmarks.bench_disponibilidad [cantidad_turnos_maxima]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from src.errors.custom_exception import CustomException
+from .comun import crear_clinica_sintetica, inicio_de_manana, medir
+
+DURACION = timedelta(minutes=30)
+
+
+def por_recorrido(clinica, desde: datetime, cantidad: int) -> list:
+    """
+    Prueba cada franja del horario de atención con cada médico, día por día.
+    """
+    medicos = sorted(clinica.obtener_medicos(), key=lambda m: m.obtener_matricula())
+    resultado = []
+    dia = desde.replace(hour=8, minute=0)
+    while len(resultado) < cantidad:
+        for franja in range(20):
+            fecha_hora = dia + franja * DURACION
+            for medico in medicos:
+                try:
+                    clinica.validar_turno_no_duplicado(
+                        medico.obtener_matricula(), fecha_hora
+                    )
+                    clinica.validar_especialidad_en_dia(
+                        medico, "clinica", fecha_hora.weekday()
+                    )
+                except CustomException:
+                    continue
+                resultado.append((fecha_hora, medico))
+                if len(resultado) == cantidad:
+                    return resultado
+        dia += timedelta(days=1)
+    return resultado
+
+
+def main():
+    cantidad_maxima = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    desde = inicio_de_manana()
+    cantidad = 10
+    cantidad_turnos = cantidad_maxima // 8
+    while cantidad_turnos <= cantidad_maxima:
+        clinica = crear_clinica_sintetica(cantidad_turnos)
+        comienzo = time.perf_counter()
+        primera = clinica.buscar_horarios_libres("clinica", desde, cantidad)
+        armado = (time.perf_counter() - comienzo) * 1000
+        assert primera == por_recorrido(clinica, desde, cantidad)
+        print(
+            f"Turnos: {cantidad_turnos:8} - recorrido: "
+            f"{medir(lambda: por_recorrido(clinica, desde, cantidad), 3):10.1f} us - "
+            f"motor (primera consulta): {armado:8.1f} ms - motor: "
+            f"{medir(lambda: clinica.buscar_horarios_libres('clinica', desde, cantidad), 20):8.1f} us"
+        )
+        cantidad_turnos *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Prueba de carga de la API HTTP: levanta `python -m src.main --http` en otro proceso,
+lo puebla con un pedido a /lote y lanza clientes en hilos que alternan agendar un
+turno y consultar una historia clínica. Informa pedidos por segundo y latencias
+p50/p99, reutilizando la conexión y abriendo una nueva por pedido.
+
+Uso: python -m benchmarks.bench_http [pedidos_por_cliente] [clientes]
+"""
+
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from threading import Barrier, Thread
+from .comun import TODOS_LOS_DIAS, inicio_de_manana
+
+CANTIDAD_MEDICOS = 50
+CANTIDAD_PACIENTES = 1000
+
+
+def puerto_libre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def esperar_servidor(puerto: int) -> None:
+    limite = time.monotonic() + 10
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", puerto), timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > limite:
+                raise
+            time.sleep(0.05)
+
+
+def pedir(conexion, metodo: str, ruta: str, cuerpo) -> tuple[int, bytes]:
+    conexion.request(
+        metodo,
+        ruta,
+        body=json.dumps(cuerpo).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    respuesta = conexion.getresponse()
+    return respuesta.status, respuesta.read()
+
+
+def poblar(puerto: int) -> None:
+    solicitudes = [
+        {
+            "op": "agregar_paciente",
+            "args": {
+                "nombre": f"Paciente {i}",
+                "dni": str(10_000_000 + i),
+                "fecha_nacimiento": "1990-01-01",
+            },
+        }
+        for i in range(CANTIDAD_PACIENTES)
+    ] + [
+        {
+            "op": "agregar_medico",
+            "args": {
+                "nombre": f"Medico {i}",
+                "matricula": f"m{i}",
+                "especialidades": [{"tipo": "clinica", "dias": TODOS_LOS_DIAS}],
+            },
+        }
+        for i in range(CANTIDAD_MEDICOS)
+    ]
+    conexion = http.client.HTTPConnection("127.0.0.1", puerto)
+    estado, cuerpo = pedir(conexion, "POST", "/lote", solicitudes)
+    conexion.close()
+    assert estado == 200 and all(r["ok"] for r in json.loads(cuerpo))
+
+
+def cargar(puerto: int, clientes: int, pedidos: int, reutilizar: bool, ronda: int):
+    """
+    Devuelve (pedidos por segundo, latencias en segundos). Cada cliente agenda en
+    horarios propios, así que todos los turnos deben agendarse.
+    """
+    inicio = inicio_de_manana() + timedelta(days=ronda * 400)
+    barrera = Barrier(clientes + 1)
+    latencias: list[list[float]] = [[] for _ in range(clientes)]
+    errores = []
+
+    def cliente(numero: int):
+        conexion = http.client.HTTPConnection("127.0.0.1", puerto)
+        barrera.wait()
+        for i in range(pedidos):
+            if i % 2 == 0:
+                ruta = "/operaciones/agendar_turno"
+                cuerpo = {
+                    "dni": str(
+                        10_000_000 + (numero * pedidos + i) % CANTIDAD_PACIENTES
+                    ),
+                    "matricula": f"m{numero % CANTIDAD_MEDICOS}",
+                    "especialidad": "clinica",
+                    "fecha_hora": (
+                        inicio + timedelta(minutes=30 * (i // 2 * clientes + numero))
+                    ).isoformat(),
+                }
+            else:
+                ruta = "/operaciones/obtener_historia_clinica"
+                cuerpo = {"dni": str(10_000_000 + numero % CANTIDAD_PACIENTES)}
+            comienzo = time.perf_counter()
+            estado, _ = pedir(conexion, "POST", ruta, cuerpo)
+            latencias[numero].append(time.perf_counter() - comienzo)
+            if estado != 200:
+                errores.append(estado)
+            if not reutilizar:
+                conexion.close()
+        conexion.close()
+
+    hilos = [Thread(target=cliente, args=(n,)) for n in range(clientes)]
+    for hilo in hilos:
+        hilo.start()
+    barrera.wait()
+    comienzo = time.perf_counter()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - comienzo
+    assert not errores, f"{len(errores)} pedidos fallaron: {errores[:5]}"
+    return clientes * pedidos / segundos, sorted(l for ls in latencias for l in ls)
+
+
+def percentil(ordenadas: list[float], p: float) -> float:
+    return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p))]
+
+
+def main():
+    pedidos = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    clientes = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    puerto = puerto_libre()
+    servidor = subprocess.Popen(
+        [sys.executable, "-m", "src.main", "--http", str(puerto)],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        esperar_servidor(puerto)
+        poblar(puerto)
+        for ronda, reutilizar in enumerate((True, False)):
+            por_segundo, latencias = cargar(
+                puerto, clientes, pedidos, reutilizar, ronda
+            )
+            print(
+                f"{'conexión reutilizada' if reutilizar else 'conexión por pedido':20}"
+                f" - clientes: {clientes} - {por_segundo:8.0f} pedidos/s - "
+                f"p50: {percentil(latencias, 0.5) * 1000:6.2f} ms - "
+                f"p99: {percentil(latencias, 0.99) * 1000:6.2f} ms"
+            )
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+
+if __name__ == "__main__":
+    main()
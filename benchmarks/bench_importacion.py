@@ -0,0 +1,75 @@
+"""
+Mide el throughput de la importación masiva de pacientes y médicos (registros por
+segundo) contra la carga de a uno con agregar_paciente / agregar_medico.
+
+Uso: python -m benchmarks.bench_importacion [cantidad_registros]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from src.models.clinica import Clinica
+from src.utils.importacion import (
+    leer_registros,
+    medico_desde_registro,
+    paciente_desde_registro,
+)
+
+
+def escribir_csv_pacientes(ruta: str, cantidad: int) -> None:
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write("nombre,dni,fecha_nacimiento\n")
+        for i in range(cantidad):
+            archivo.write(f"Paciente {i},{10_000_000 + i},01-01-1990\n")
+
+
+def escribir_jsonl_medicos(ruta: str, cantidad: int) -> None:
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for i in range(cantidad):
+            archivo.write(
+                f'{{"nombre": "Medico {i}", "matricula": "m{i}", '
+                '"especialidades": "clinica:lunes,miercoles,viernes"}\n'
+            )
+
+
+def reportar(nombre: str, cantidad: int, segundos: float) -> None:
+    print(f"{nombre:32} {cantidad / segundos:12.0f} registros/s ({segundos:.3f} s)")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_pacientes = os.path.join(directorio, "pacientes.csv")
+        ruta_medicos = os.path.join(directorio, "medicos.jsonl")
+        escribir_csv_pacientes(ruta_pacientes, cantidad)
+        escribir_jsonl_medicos(ruta_medicos, cantidad)
+        print(f"Registros: {cantidad}")
+
+        clinica = Clinica({}, {}, [], {})
+        inicio = time.perf_counter()
+        for registro in leer_registros(ruta_pacientes):
+            clinica.agregar_paciente(paciente_desde_registro(registro))
+        reportar("Pacientes de a uno", cantidad, time.perf_counter() - inicio)
+
+        clinica = Clinica({}, {}, [], {})
+        inicio = time.perf_counter()
+        resultado = clinica.importar_pacientes(leer_registros(ruta_pacientes))
+        reportar("importar_pacientes", cantidad, time.perf_counter() - inicio)
+        assert resultado.obtener_cantidad_importados() == cantidad
+
+        clinica = Clinica({}, {}, [], {})
+        inicio = time.perf_counter()
+        for registro in leer_registros(ruta_medicos):
+            clinica.agregar_medico(medico_desde_registro(registro))
+        reportar("Médicos de a uno", cantidad, time.perf_counter() - inicio)
+
+        clinica = Clinica({}, {}, [], {})
+        inicio = time.perf_counter()
+        resultado = clinica.importar_medicos(leer_registros(ruta_medicos))
+        reportar("importar_medicos", cantidad, time.perf_counter() - inicio)
+        assert resultado.obtener_cantidad_importados() == cantidad
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Mide cambios por segundo de una clínica con journal bajo cada política de fsync.
+
+Uso: python -m benchmarks.bench_journal [cantidad_cambios]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.persistencia.journal import Journal, POLITICAS_FSYNC
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    print(f"Cambios por política: {cantidad}")
+    for politica in POLITICAS_FSYNC:
+        with tempfile.TemporaryDirectory() as directorio:
+            journal = Journal(directorio, politica_fsync=politica)
+            clinica = journal.recuperar()
+            clinica.agregar_medico(Medico("Ana Gómez", "m1"))
+            comienzo = time.perf_counter()
+            for i in range(cantidad // 2):
+                dni = str(10_000_000 + i)
+                clinica.agregar_paciente(
+                    Paciente(f"Paciente {i}", dni, datetime(1990, 1, 1))
+                )
+                clinica.emitir_receta(dni, "m1", ["Paracetamol"])
+            journal.cerrar()
+            segundos = time.perf_counter() - comienzo
+            comienzo = time.perf_counter()
+            recuperado = Journal(directorio)
+            recuperado.recuperar()
+            recuperacion = time.perf_counter() - comienzo
+            recuperado.cerrar()
+        print(
+            f"{politica:8} {cantidad / segundos:10.0f} cambios/s - "
+            f"recuperación: {recuperacion * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Compara agendar un cronograma recurrente con agendar_turnos_lote contra llamadas
+sucesivas a agendar_turno, sobre una clínica con historial previo.
+
+Uso: python -m benchmarks.bench_lote [cantidad_turnos_previos] [cantidad_lote]
+"""
+
+import sys
+import time
+from datetime import timedelta
+from src.utils.fechas import generar_fechas_recurrentes
+from .comun import crear_clinica_sintetica, inicio_de_manana
+
+
+def main():
+    previos = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else 3_000
+    inicio = inicio_de_manana().replace(hour=7, minute=15)
+    fechas = generar_fechas_recurrentes(
+        inicio, inicio + timedelta(days=cantidad), list(range(7))
+    )[:cantidad]
+    print(f"Turnos previos: {previos} - Turnos del lote: {len(fechas)}")
+
+    clinica = crear_clinica_sintetica(previos)
+    comienzo = time.perf_counter()
+    for fecha in fechas:
+        clinica.agendar_turno("10000000", "m0", "clinica", fecha)
+    print(f"agendar_turno sucesivos: {(time.perf_counter() - comienzo) * 1000:8.1f} ms")
+
+    clinica = crear_clinica_sintetica(previos)
+    comienzo = time.perf_counter()
+    clinica.agendar_turnos_lote("10000000", "m0", "clinica", fechas)
+    print(f"agendar_turnos_lote:     {(time.perf_counter() - comienzo) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Consultas por medicamento sobre muchas recetas repartidas en un año: pacientes a
+los que se les recetó un medicamento en los últimos 30 días y cantidad de recetas
+por medicamento, con el índice de medicamentos contra recorrer todas las
+historias clínicas.
+
+Uso: python -m benchmarks.bench_medicamentos [cantidad_recetas]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.utils.reloj import RelojCongelado
+from .comun import medir
+
+CANTIDAD_PACIENTES = 10_000
+CANTIDAD_MEDICOS = 50
+CANTIDAD_MEDICAMENTOS = 200
+DIAS = 365
+
+
+def crear_clinica(cantidad_recetas: int) -> Clinica:
+    reloj = RelojCongelado(datetime(2025, 1, 1, 9, 0))
+    clinica = Clinica({}, {}, [], {}, reloj=reloj)
+    clinica.importar_pacientes(
+        Paciente(f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+        for i in range(CANTIDAD_PACIENTES)
+    )
+    clinica.importar_medicos(
+        Medico(f"Medico {i}", f"m{i}") for i in range(CANTIDAD_MEDICOS)
+    )
+    azar = random.Random(1)
+    medicamentos = [f"Medicamento {i}" for i in range(CANTIDAD_MEDICAMENTOS)]
+    por_dia = cantidad_recetas // DIAS
+    for _ in range(DIAS):
+        clinica.emitir_recetas_lote(
+            (
+                str(10_000_000 + azar.randrange(CANTIDAD_PACIENTES)),
+                f"m{azar.randrange(CANTIDAD_MEDICOS)}",
+                azar.sample(medicamentos, 2),
+            )
+            for _ in range(por_dia)
+        )
+        reloj.avanzar(timedelta(days=1))
+    return clinica
+
+
+def main():
+    cantidad_recetas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    comienzo = time.perf_counter()
+    clinica = crear_clinica(cantidad_recetas)
+    print(
+        f"Recetas: {cantidad_recetas} - carga: "
+        f"{time.perf_counter() - comienzo:.1f} s"
+    )
+    hasta = clinica.obtener_reloj().ahora().date()
+    desde = hasta - timedelta(days=30)
+    historias = [clinica.obtener_historia_clinica(p) for p in clinica.ver_pacientes()]
+
+    def pacientes_recorriendo():
+        return {
+            r.obtener_paciente()
+            for h in historias
+            for r in h.ver_recetas()
+            if desde <= r.obtener_fecha().date() < hasta
+            and "Medicamento 7" in r.obtener_medicamentos()
+        }
+
+    def contar_recorriendo():
+        cantidades = {}
+        for h in historias:
+            for r in h.ver_recetas():
+                if desde <= r.obtener_fecha().date() < hasta:
+                    for m in r.obtener_medicamentos():
+                        cantidades[m] = cantidades.get(m, 0) + 1
+        return cantidades
+
+    assert (
+        set(clinica.obtener_pacientes_con_medicamento("medicamento 7", desde, hasta))
+        == pacientes_recorriendo()
+    )
+    assert clinica.contar_recetas_por_medicamento(desde, hasta) == contar_recorriendo()
+    for nombre, indice, recorrido in (
+        (
+            "pacientes con medicamento (30 días)",
+            lambda: clinica.obtener_pacientes_con_medicamento(
+                "Medicamento 7", desde, hasta
+            ),
+            pacientes_recorriendo,
+        ),
+        (
+            "recetas por medicamento (30 días)",
+            lambda: clinica.contar_recetas_por_medicamento(desde, hasta),
+            contar_recorriendo,
+        ),
+    ):
+        print(
+            f"{nombre:36} índice: {medir(indice, 20) / 1000:9.2f} ms - "
+            f"recorriendo: {medir(recorrido, 1) / 1000:9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Reporta bytes por objeto de cada modelo y el RSS máximo del proceso al armar una
+clínica sintética del tamaño indicado.
+
+Uso: python -m benchmarks.bench_memoria [cantidad_turnos]
+"""
+
+import resource
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.models.turno import Turno
+from src.models.receta import Receta
+from .comun import TODOS_LOS_DIAS, crear_clinica_sintetica
+
+
+def bytes_por_objeto(crear, cantidad: int = 10_000) -> float:
+    tracemalloc.start()
+    objetos = [crear(i) for i in range(cantidad)]
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Se descuenta la lista que contiene a los objetos.
+    return (actual - sys.getsizeof(objetos)) / cantidad
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    paciente = Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+    medico = Medico("Ana Gómez", "m1")
+    manana = datetime.now() + timedelta(days=1)
+    medicamentos = ["Paracetamol"]
+
+    # Las fechas y textos se crean fuera de la medición para contar solo el objeto.
+    print("Bytes por objeto (incluye contenedores propios):")
+    fechas = [manana + timedelta(minutes=i) for i in range(10_000)]
+    print(
+        f"  Turno:        {bytes_por_objeto(lambda i: Turno(paciente, medico, fechas[i], 'clinica')):8.1f}"
+    )
+    print(
+        f"  Receta:       {bytes_por_objeto(lambda i: Receta(paciente, medico, medicamentos)):8.1f}"
+    )
+    dnis = [str(10_000_000 + i) for i in range(10_000)]
+    nacimiento = datetime(1990, 1, 1)
+    print(
+        f"  Paciente:     {bytes_por_objeto(lambda i: Paciente('Juan Perez', dnis[i], nacimiento)):8.1f}"
+    )
+    print(
+        f"  Medico:       {bytes_por_objeto(lambda i: Medico('Ana Gómez', dnis[i])):8.1f}"
+    )
+    print(
+        f"  Especialidad: {bytes_por_objeto(lambda i: Especialidad('clinica', TODOS_LOS_DIAS)):8.1f}"
+    )
+
+    clinica = crear_clinica_sintetica(cantidad_turnos)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"Clínica con {len(clinica.ver_turnos())} turnos - RSS máximo: {rss:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
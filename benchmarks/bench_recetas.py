@@ -0,0 +1,98 @@
+"""
+Emisión masiva de recetas: emitir_receta una por una (una lectura del reloj por
+receta) contra emitir_recetas_lote (una lectura por lote), en memoria y en SQLite,
+con el reloj del sistema y con un reloj congelado.
+
+Uso: python -m benchmarks.bench_recetas [cantidad_recetas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.utils.reloj import RELOJ_SISTEMA, RelojCongelado
+from .comun import inicio_de_manana
+
+CANTIDAD_MEDICOS = 50
+CANTIDAD_PACIENTES = 1000
+TAMANO_LOTE = 1000
+
+
+def crear_clinica(reloj, ruta: str | None) -> tuple[Clinica, RepositorioSQLite | None]:
+    repositorio = None if ruta is None else RepositorioSQLite(ruta)
+    clinica = Clinica({}, {}, [], {}, repositorio, reloj)
+    clinica.importar_pacientes(
+        Paciente(f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+        for i in range(CANTIDAD_PACIENTES)
+    )
+    clinica.importar_medicos(
+        Medico(f"Medico {i}", f"m{i}") for i in range(CANTIDAD_MEDICOS)
+    )
+    return clinica, repositorio
+
+
+def solicitudes(cantidad: int) -> list[tuple[str, str, list[str]]]:
+    return [
+        (
+            str(10_000_000 + i % CANTIDAD_PACIENTES),
+            f"m{i % CANTIDAD_MEDICOS}",
+            ["Paracetamol", "Ibuprofeno"],
+        )
+        for i in range(cantidad)
+    ]
+
+
+def una_por_una(clinica: Clinica, pendientes) -> None:
+    for inicio in range(0, len(pendientes), TAMANO_LOTE):
+        with clinica.agrupar_escrituras():
+            for dni, matricula, medicamentos in pendientes[
+                inicio : inicio + TAMANO_LOTE
+            ]:
+                clinica.emitir_receta(dni, matricula, medicamentos)
+
+
+def en_lotes(clinica: Clinica, pendientes) -> None:
+    for inicio in range(0, len(pendientes), TAMANO_LOTE):
+        with clinica.agrupar_escrituras():
+            clinica.emitir_recetas_lote(pendientes[inicio : inicio + TAMANO_LOTE])
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    pendientes = solicitudes(cantidad)
+    print(f"Recetas: {cantidad} (lotes de {TAMANO_LOTE})")
+    with tempfile.TemporaryDirectory() as directorio:
+        for almacenamiento in ("memoria", "sqlite"):
+            for nombre_reloj in ("sistema", "congelado"):
+                resultados = []
+                for emitir in (una_por_una, en_lotes):
+                    reloj = (
+                        RELOJ_SISTEMA
+                        if nombre_reloj == "sistema"
+                        else RelojCongelado(inicio_de_manana())
+                    )
+                    ruta = None
+                    if almacenamiento == "sqlite":
+                        ruta = os.path.join(
+                            directorio, f"{nombre_reloj}-{emitir.__name__}.db"
+                        )
+                    clinica, repositorio = crear_clinica(reloj, ruta)
+                    comienzo = time.perf_counter()
+                    emitir(clinica, pendientes)
+                    resultados.append(cantidad / (time.perf_counter() - comienzo))
+                    if repositorio is not None:
+                        repositorio.cerrar()
+                print(
+                    f"{almacenamiento:8} - reloj {nombre_reloj:9} - una por una: "
+                    f"{resultados[0]:10.0f} recetas/s - lote: "
+                    f"{resultados[1]:10.0f} recetas/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
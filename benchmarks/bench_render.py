@@ -0,0 +1,67 @@
+"""
+Mide CLI.ver_todos_los_turnos() con la salida redirigida a memoria, contra el
+armado de los mismos textos sin reutilizar nada (como se hacía antes de guardar
+el texto de pacientes y médicos). Se mide la primera pasada, que arma los textos,
+y la segunda, que ya los encuentra hechos.
+
+Uso: python -m benchmarks.bench_render [cantidad_turnos]
+"""
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from src.cli.cli import CLI
+from .comun import crear_clinica_sintetica
+
+
+def texto_sin_cache(turno) -> str:
+    paciente = turno.obtener_paciente()
+    medico = turno.obtener_medico()
+    fecha_hora = turno.obtener_fecha_hora()
+    especialidades = ", ".join(
+        [esp.obtener_especialidad() for esp in medico.obtener_especialidades()]
+    )
+    return (
+        f"Turno: Paciente: Paciente: {paciente.obtener_nombre()} - "
+        f"DNI: {paciente.obtener_dni()} - "
+        f"Fecha de nacimiento: "
+        f"{paciente.obtener_fecha_nacimiento().strftime('%d/%m/%Y')} | "
+        f"Médico: Médico: {medico.obtener_nombre()} - "
+        f"Matrícula: {medico.obtener_matricula()} - "
+        f"Especialidades: {especialidades} | "
+        f"Especialidad: {turno.obtener_especialidad()} | "
+        f"Fecha y hora: {fecha_hora.strftime('%d/%m/%Y')} "
+        f"{fecha_hora.strftime('%H:%M')}"
+    )
+
+
+def medir_salida(funcion) -> tuple[float, str]:
+    salida = io.StringIO()
+    comienzo = time.perf_counter()
+    with redirect_stdout(salida):
+        funcion()
+    return time.perf_counter() - comienzo, salida.getvalue()
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    clinica = crear_clinica_sintetica(cantidad_turnos)
+    cli = CLI(clinica)
+    print(f"Turnos: {cantidad_turnos}")
+
+    def listar_sin_cache():
+        print("\n--- Todos los Turnos ---")
+        for turno in clinica.ver_turnos():
+            print(texto_sin_cache(turno))
+
+    segundos, esperado = medir_salida(listar_sin_cache)
+    print(f"{'sin cache':24} {segundos * 1000:8.1f} ms")
+    for pasada in ("con cache (1ra pasada)", "con cache (2da pasada)"):
+        segundos, obtenido = medir_salida(cli.ver_todos_los_turnos)
+        assert obtenido == esperado
+        print(f"{pasada:24} {segundos * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
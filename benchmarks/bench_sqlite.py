@@ -0,0 +1,62 @@
+"""
+Mide el tiempo de arranque de una clínica respaldada por SQLite a medida que crece
+el historial de turnos pasados guardado en la base.
+
+Uso: python -m benchmarks.bench_sqlite [cantidad_turnos_maxima]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.persistencia.hidratacion import hidratar_turno
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+
+
+def main():
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clinica.db")
+        repositorio = RepositorioSQLite(ruta)
+        pacientes = [
+            Paciente(f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+            for i in range(1000)
+        ]
+        medicos = [Medico(f"Medico {i}", f"m{i}") for i in range(50)]
+        repositorio.guardar_pacientes(pacientes)
+        repositorio.guardar_medicos(medicos)
+        inicio_historial = datetime(2000, 1, 1)
+        cantidad = 0
+        objetivo = 1000
+        while objetivo <= maximo:
+            repositorio.guardar_turnos(
+                hidratar_turno(
+                    pacientes[i % 1000],
+                    medicos[i % 50],
+                    inicio_historial + timedelta(minutes=30 * (i // 50)),
+                    "clinica",
+                )
+                for i in range(cantidad, objetivo)
+            )
+            cantidad = objetivo
+            comienzo = time.perf_counter()
+            clinica = Clinica.desde_repositorio(RepositorioSQLite(ruta))
+            arranque = (time.perf_counter() - comienzo) * 1000
+            comienzo = time.perf_counter()
+            historia = clinica.obtener_historia_clinica("10000000")
+            hidratacion = (time.perf_counter() - comienzo) * 1000
+            print(
+                f"Turnos históricos: {cantidad:8} - arranque: {arranque:7.1f} ms - "
+                f"historia de un paciente ({len(historia.obtener_turnos())} turnos): "
+                f"{hidratacion:6.1f} ms"
+            )
+            objetivo *= 10
+        repositorio.cerrar()
+
+
+if __name__ == "__main__":
+    main()
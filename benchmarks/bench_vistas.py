@@ -0,0 +1,60 @@
+"""
+Compara memoria y tiempo de recorrer los turnos con obtener_turnos() (copia) contra
+ver_turnos() e iterar_turnos() (sin copia).
+
+Uso: python -m benchmarks.bench_vistas [cantidad_turnos]
+"""
+
+import sys
+import time
+import tracemalloc
+from .comun import crear_clinica_sintetica
+
+
+def medir_memoria(nombre: str, funcion) -> None:
+    tracemalloc.start()
+    comienzo = time.perf_counter()
+    cantidad = funcion()
+    segundos = time.perf_counter() - comienzo
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{nombre:34} pico: {pico / 1024:10.1f} KiB - {segundos * 1000:8.1f} ms "
+        f"({cantidad} elementos)"
+    )
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    clinica = crear_clinica_sintetica(cantidad_turnos)
+    print(f"Turnos: {cantidad_turnos}")
+
+    def contar_copia():
+        return sum(1 for _ in clinica.obtener_turnos())
+
+    def contar_vista():
+        return sum(1 for _ in clinica.ver_turnos())
+
+    def contar_filtrado():
+        return sum(
+            1
+            for _ in clinica.iterar_turnos(
+                lambda t: t.obtener_medico().obtener_matricula() == "m7"
+            )
+        )
+
+    def contar_pacientes_copia():
+        return len(clinica.obtener_pacientes())
+
+    def contar_pacientes_vista():
+        return len(clinica.ver_pacientes())
+
+    medir_memoria("obtener_turnos()", contar_copia)
+    medir_memoria("ver_turnos()", contar_vista)
+    medir_memoria("iterar_turnos(filtro)", contar_filtrado)
+    medir_memoria("obtener_pacientes()", contar_pacientes_copia)
+    medir_memoria("ver_pacientes()", contar_pacientes_vista)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Utilidades compartidas por los benchmarks: armado de clínicas sintéticas y medición.
+"""
+
+import time
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+
+TODOS_LOS_DIAS = [
+    "lunes",
+    "martes",
+    "miercoles",
+    "jueves",
+    "viernes",
+    "sabados",
+    "domingos",
+]
+
+
+def inicio_de_manana() -> datetime:
+    return (datetime.now() + timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def crear_clinica_sintetica(
+    cantidad_turnos: int, cantidad_medicos: int = 50, cantidad_pacientes: int = 1000
+) -> Clinica:
+    """
+    Crea una clínica con médicos que atienden todos los días y turnos repartidos
+    cada 30 minutos entre ellos.
+    """
+    clinica = Clinica({}, {}, [], {})
+    for i in range(cantidad_pacientes):
+        clinica.agregar_paciente(
+            Paciente(f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+        )
+    for i in range(cantidad_medicos):
+        medico = Medico(f"Medico {i}", f"m{i}")
+        medico.agregar_especialidad(Especialidad("clinica", list(TODOS_LOS_DIAS)))
+        clinica.agregar_medico(medico)
+    inicio = inicio_de_manana()
+    for i in range(cantidad_turnos):
+        clinica.agendar_turno(
+            str(10_000_000 + i % cantidad_pacientes),
+            f"m{i % cantidad_medicos}",
+            "clinica",
+            inicio + timedelta(minutes=30 * (i // cantidad_medicos)),
+        )
+    return clinica
+
+
+def medir(funcion, repeticiones: int) -> float:
+    """
+    Ejecuta la función la cantidad de veces indicada y devuelve los microsegundos
+    promedio por llamada.
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1_000_000
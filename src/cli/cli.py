@@ -1,3 +1,4 @@
+import sys
 from datetime import datetime
 from src.models.clinica import Clinica
 from src.models.paciente import Paciente
@@ -25,6 +26,12 @@ class CLI:
         print("7) Ver todos los turnos")
         print("8) Ver todos los pacientes")
         print("9) Ver todos los médicos")
+        print("10) Ver turnos de un médico")
+        print("11) Ver turnos de una especialidad")
+        print("12) Ver turnos de un día")
+        print("13) Cancelar turno")
+        print("14) Buscar paciente por nombre")
+        print("15) Buscar horarios libres por especialidad")
         print("0) Salir")
 
     def solicitar_fecha(self, mensaje="Ingrese fecha (dd-mm-yyyy): "):
@@ -87,12 +94,24 @@ class CLI:
                     self.ver_todos_los_pacientes()
                 elif opcion == "9":
                     self.ver_todos_los_medicos()
+                elif opcion == "10":
+                    self.ver_turnos_de_medico()
+                elif opcion == "11":
+                    self.ver_turnos_de_especialidad()
+                elif opcion == "12":
+                    self.ver_turnos_de_dia()
+                elif opcion == "13":
+                    self.cancelar_turno()
+                elif opcion == "14":
+                    self.buscar_paciente()
+                elif opcion == "15":
+                    self.buscar_horarios_libres()
                 elif opcion == "0":
                     print("Hasta luego!")
                     break
                 else:
                     print(
-                        " Opción inválida. Por favor, seleccione una opción del 0 al 9."
+                        " Opción inválida. Por favor, seleccione una opción del 0 al 15."
                     )
             except CustomException as e:
                 print(f" Error: {e}")
@@ -132,7 +151,7 @@ class CLI:
 
                 dias_lista = []
                 for dia in dias.split(","):
-                    dia_limpio = dia.strip().lower()
+                    dia_limpio = dia.strip()
                     if dia_limpio:
                         dias_lista.append(dia_limpio)
 
@@ -140,7 +159,7 @@ class CLI:
                     break
                 print(" Error: No se encontraron días válidos. Intente nuevamente.")
 
-            especialidad = Especialidad(tipo.lower(), dias_lista)
+            especialidad = Especialidad(tipo, dias_lista)
             medico.agregar_especialidad(especialidad)
             print(f"✓ Especialidad '{tipo}' agregada.")
 
@@ -151,7 +170,7 @@ class CLI:
         print("\n--- Agendar Turno ---")
         dni = self.solicitar_entrada_no_vacia("DNI del paciente: ")
         matricula = self.solicitar_entrada_no_vacia("Matrícula del médico: ").lower()
-        especialidad = self.solicitar_entrada_no_vacia("Especialidad: ").lower()
+        especialidad = self.solicitar_entrada_no_vacia("Especialidad: ")
         fecha_hora = self.solicitar_fecha_hora("Fecha y hora (dd-mm-yyyy hh-mm): ")
         self.clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
         print("✓ Turno agendado correctamente.")
@@ -159,8 +178,8 @@ class CLI:
     def agregar_especialidad_a_medico(self):
         print("\n--- Agregar Especialidad a Médico ---")
         matricula = self.solicitar_entrada_no_vacia("Matrícula del médico: ").lower()
-        medico = self.clinica.obtener_medico_por_matricula(matricula)
-        tipo = self.solicitar_entrada_no_vacia("Especialidad: ").lower()
+        self.clinica.validar_existencia_medico(matricula)
+        tipo = self.solicitar_entrada_no_vacia("Especialidad: ")
 
         while True:
             dias = input(
@@ -172,7 +191,7 @@ class CLI:
 
             dias_lista = []
             for dia in dias.split(","):
-                dia_limpio = dia.strip().lower()
+                dia_limpio = dia.strip()
                 if dia_limpio:
                     dias_lista.append(dia_limpio)
 
@@ -181,7 +200,7 @@ class CLI:
             print(" Error: No se encontraron días válidos. Intente nuevamente.")
 
         especialidad = Especialidad(tipo, dias_lista)
-        medico.agregar_especialidad(especialidad)
+        self.clinica.agregar_especialidad_a_medico(matricula, especialidad)
         print("✓ Especialidad agregada correctamente.")
 
     def emitir_receta(self):
@@ -208,24 +227,62 @@ class CLI:
         self.clinica.emitir_receta(dni, matricula, lista_medicamentos)
         print("✓ Receta emitida correctamente.")
 
-    def ver_historia_clinica(self):
+    def cancelar_turno(self):
+        print("\n--- Cancelar Turno ---")
+        matricula = self.solicitar_entrada_no_vacia("Matrícula del médico: ").lower()
+        fecha_hora = self.solicitar_fecha_hora("Fecha y hora (dd-mm-yyyy hh-mm): ")
+        self.clinica.cancelar_turno(matricula, fecha_hora)
+        print("✓ Turno cancelado correctamente.")
+
+    def buscar_paciente(self):
+        print("\n--- Buscar Paciente ---")
+        texto = self.solicitar_entrada_no_vacia("Nombre o parte del nombre: ")
+        pacientes = self.clinica.buscar_pacientes(texto)
+        if not pacientes:
+            print("No se encontraron pacientes.")
+        else:
+            for p in pacientes:
+                print(p)
+
+    def buscar_horarios_libres(self, cantidad: int = 10):
+        print("\n--- Buscar Horarios Libres ---")
+        especialidad = self.solicitar_entrada_no_vacia("Especialidad: ")
+        horarios = self.clinica.buscar_horarios_libres(
+            especialidad, self.clinica.obtener_reloj().ahora(), cantidad
+        )
+        if not horarios:
+            print("No hay horarios libres para esa especialidad.")
+        else:
+            for fecha_hora, medico in horarios:
+                print(
+                    f"{fecha_hora.strftime('%d/%m/%Y %H:%M')} - "
+                    f"{medico.obtener_nombre()} ({medico.obtener_matricula()})"
+                )
+
+    def ver_historia_clinica(self, tamano_pagina: int = 20):
         print("\n--- Ver Historia Clínica ---")
         dni = self.solicitar_entrada_no_vacia("DNI del paciente: ")
         historia = self.clinica.obtener_historia_clinica(dni)
-        print(historia)
+        lineas = historia.iterar_lineas(mas_recientes_primero=True)
+        for numero, linea in enumerate(lineas, start=1):
+            print(linea)
+            if numero % tamano_pagina == 0:
+                continuar = input("Enter para ver más, 'q' para volver: ").strip()
+                if continuar.lower() == "q":
+                    break
 
     def ver_todos_los_turnos(self):
         print("\n--- Todos los Turnos ---")
-        turnos = self.clinica.obtener_turnos()
+        turnos = self.clinica.ver_turnos()
         if not turnos:
             print("No hay turnos registrados.")
         else:
-            for t in turnos:
-                print(t)
+            # Se escribe turno por turno, sin armar el listado completo en memoria.
+            sys.stdout.writelines(f"{turno}\n" for turno in turnos)
 
     def ver_todos_los_pacientes(self):
         print("\n--- Todos los Pacientes ---")
-        pacientes = self.clinica.obtener_pacientes()
+        pacientes = self.clinica.ver_pacientes().values()
         if not pacientes:
             print("No hay pacientes registrados.")
         else:
@@ -234,9 +291,31 @@ class CLI:
 
     def ver_todos_los_medicos(self):
         print("\n--- Todos los Médicos ---")
-        medicos = self.clinica.obtener_medicos()
+        medicos = self.clinica.ver_medicos().values()
         if not medicos:
             print("No hay médicos registrados.")
         else:
             for m in medicos:
                 print(m)
+
+    def ver_turnos_de_medico(self):
+        print("\n--- Turnos de un Médico ---")
+        matricula = self.solicitar_entrada_no_vacia("Matrícula del médico: ").lower()
+        self.mostrar_turnos(self.clinica.obtener_turnos_de_medico(matricula))
+
+    def ver_turnos_de_especialidad(self):
+        print("\n--- Turnos de una Especialidad ---")
+        especialidad = self.solicitar_entrada_no_vacia("Especialidad: ")
+        self.mostrar_turnos(self.clinica.obtener_turnos_de_especialidad(especialidad))
+
+    def ver_turnos_de_dia(self):
+        print("\n--- Turnos de un Día ---")
+        dia = self.solicitar_fecha("Fecha (dd-mm-yyyy): ")
+        self.mostrar_turnos(self.clinica.obtener_turnos_de_fecha(dia.date()))
+
+    def mostrar_turnos(self, turnos):
+        if not turnos:
+            print("No hay turnos registrados.")
+        else:
+            for t in turnos:
+                print(t)
@@ -0,0 +1,131 @@
+"""
+Modo no interactivo: ejecuta un archivo de comandos (una solicitud JSON por línea,
+con el mismo formato que el socket y la API HTTP) contra la clínica, sin menú ni
+input().
+"""
+
+import json
+import time
+from itertools import islice
+from collections.abc import Iterable
+from typing import TextIO
+from src.models.clinica import Clinica
+from src.servicio.operaciones import (
+    leer_solicitud,
+    respuesta_de_error,
+    respuesta_exitosa,
+)
+from src.errors.custom_exception import CustomException, ValidacionError
+
+LINEAS_POR_ESCRITURA = 1000
+COMANDOS_POR_GRUPO = 1000
+
+
+class EstadisticasLote:
+    """
+    Tiempos y errores de una ejecución en lote, por operación.
+    """
+
+    def __init__(self):
+        self.__tiempos__: dict[str, list[float]] = {}
+        self.__errores__: dict[str, int] = {}
+        self.__total__ = 0.0
+
+    def registrar(
+        self, operacion: str, segundos: float, error: CustomException | None
+    ) -> None:
+        self.__tiempos__.setdefault(operacion, []).append(segundos)
+        if error is not None:
+            clase = type(error).__name__
+            self.__errores__[clase] = self.__errores__.get(clase, 0) + 1
+
+    def registrar_total(self, segundos: float) -> None:
+        self.__total__ = segundos
+
+    def obtener_cantidad(self) -> int:
+        return sum(len(tiempos) for tiempos in self.__tiempos__.values())
+
+    def obtener_cantidad_errores(self) -> int:
+        return sum(self.__errores__.values())
+
+    def obtener_errores_por_tipo(self) -> dict[str, int]:
+        return dict(self.__errores__)
+
+    def obtener_resumen(self) -> list[str]:
+        cantidad = self.obtener_cantidad()
+        por_segundo = cantidad / self.__total__ if self.__total__ else 0.0
+        lineas = [
+            f"Comandos: {cantidad} - Errores: {self.obtener_cantidad_errores()} - "
+            f"Tiempo total: {self.__total__:.3f} s ({por_segundo:.0f} comandos/s)"
+        ]
+        for operacion, tiempos in sorted(self.__tiempos__.items()):
+            tiempos = sorted(tiempos)
+            promedio = sum(tiempos) / len(tiempos) * 1_000_000
+            p99 = tiempos[min(len(tiempos) - 1, int(len(tiempos) * 0.99))] * 1_000_000
+            lineas.append(
+                f"  {operacion}: {len(tiempos)} - promedio {promedio:.1f} us - "
+                f"p99 {p99:.1f} us"
+            )
+        for clase, cantidad_errores in sorted(self.__errores__.items()):
+            lineas.append(f"  {clase}: {cantidad_errores}")
+        return lineas
+
+
+def ejecutar_lote(
+    clinica: Clinica, lineas: Iterable[str], salida: TextIO
+) -> EstadisticasLote:
+    """
+    Ejecuta los comandos en orden y escribe en `salida` la respuesta de cada uno
+    (con el número de línea), juntando las escrituras. Las líneas vacías y las
+    que empiezan con # se ignoran. Un comando que falla, incluso por un error
+    inesperado, no detiene el lote: su error queda en la respuesta y en las
+    estadísticas. Las escrituras al
+    repositorio se confirman cada COMANDOS_POR_GRUPO comandos.
+    """
+    estadisticas = EstadisticasLote()
+    comandos = (
+        (numero, linea)
+        for numero, linea in enumerate(map(str.strip, lineas), start=1)
+        if linea and not linea.startswith("#")
+    )
+    pendientes: list[str] = []
+    comienzo = time.perf_counter()
+    try:
+        while bloque := list(islice(comandos, COMANDOS_POR_GRUPO)):
+            with clinica.agrupar_escrituras():
+                for numero, linea in bloque:
+                    respuesta = _ejecutar_linea(clinica, linea, estadisticas)
+                    pendientes.append(
+                        json.dumps({"linea": numero, **respuesta}, ensure_ascii=False)
+                    )
+                    if len(pendientes) >= LINEAS_POR_ESCRITURA:
+                        salida.write("\n".join(pendientes) + "\n")
+                        pendientes.clear()
+    finally:
+        if pendientes:
+            salida.write("\n".join(pendientes) + "\n")
+        salida.flush()
+    estadisticas.registrar_total(time.perf_counter() - comienzo)
+    return estadisticas
+
+
+def _ejecutar_linea(clinica: Clinica, linea: str, estadisticas: EstadisticasLote):
+    comienzo = time.perf_counter()
+    solicitud = None
+    nombre = "(inválida)"
+    try:
+        try:
+            solicitud = json.loads(linea)
+        except ValueError:
+            raise ValidacionError("La línea no es un JSON válido")
+        if isinstance(solicitud, dict) and isinstance(solicitud.get("op"), str):
+            nombre = solicitud["op"]
+        operacion, argumentos = leer_solicitud(solicitud)
+        resultado = operacion.ejecutar(clinica, argumentos)
+    except Exception as e:
+        if not isinstance(e, CustomException):
+            e = CustomException(f"Error inesperado: {e}")
+        estadisticas.registrar(nombre, time.perf_counter() - comienzo, e)
+        return respuesta_de_error(solicitud, e)
+    estadisticas.registrar(nombre, time.perf_counter() - comienzo, None)
+    return respuesta_exitosa(solicitud, resultado)
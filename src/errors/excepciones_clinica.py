@@ -1,3 +1,4 @@
+from datetime import datetime
 from .custom_exception import CustomException
 
 
@@ -35,9 +36,34 @@ class TurnoOcupadoError(CustomException):
         super().__init__(self.message)
 
 
+class TurnoNoEncontradoError(CustomException):
+    def __init__(self, matricula: str, fecha_hora: datetime):
+        self.matricula = matricula
+        self.fecha_hora = fecha_hora
+        self.message = (
+            f"No existe un turno del médico con matricula {matricula} "
+            f"para el {fecha_hora.strftime('%d/%m/%Y %H:%M')}"
+        )
+        super().__init__(self.message)
+
+
 class MedicoNoDisponibleError(CustomException):
     def __init__(self, matricula: str, dia_semana: str):
         self.matricula = matricula
         self.dia_semana = dia_semana
         self.message = f"El médico con matricula {matricula} no está disponible para la semana {dia_semana}"
         super().__init__(self.message)
+
+
+class PersistenciaError(CustomException):
+    def __init__(self, detalle: str):
+        self.detalle = detalle
+        self.message = f"Error al acceder al almacenamiento: {detalle}"
+        super().__init__(self.message)
+
+
+class OperacionDesconocidaError(CustomException):
+    def __init__(self, operacion: str):
+        self.operacion = operacion
+        self.message = f"No existe la operación {operacion}"
+        super().__init__(self.message)
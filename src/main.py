@@ -1,9 +1,82 @@
+import argparse
+import asyncio
+import sys
 from .models.clinica import Clinica
 from .cli.cli import CLI
+from .cli.lote import ejecutar_lote
+from .persistencia.journal import Journal
+from .persistencia.repositorio_sqlite import RepositorioSQLite
+from .servicio.servicio_asincrono import servir_para_siempre
+from .servicio.servidor_http import ServidorClinica
 
 if __name__ == "__main__":
-    clinica = Clinica({}, {}, [], {})
+    parser = argparse.ArgumentParser(description="Sistema de gestión de la clínica")
+    almacenamiento = parser.add_mutually_exclusive_group()
+    almacenamiento.add_argument(
+        "--db", help="archivo SQLite donde guardar los datos entre ejecuciones"
+    )
+    almacenamiento.add_argument(
+        "--journal", help="directorio del journal y los snapshots de la clínica"
+    )
+    servicio = parser.add_mutually_exclusive_group()
+    servicio.add_argument(
+        "--socket",
+        type=int,
+        metavar="PUERTO",
+        help="en lugar de la consola, atender solicitudes JSON por línea en el puerto",
+    )
+    servicio.add_argument(
+        "--http",
+        type=int,
+        metavar="PUERTO",
+        help="en lugar de la consola, atender la API HTTP/JSON en el puerto",
+    )
+    servicio.add_argument(
+        "--batch",
+        metavar="ARCHIVO",
+        help="ejecutar los comandos JSON por línea del archivo (- para stdin) y salir",
+    )
+    argumentos = parser.parse_args()
 
-    cli = CLI(clinica)
+    repositorio = None
+    codigo_salida = 0
+    if argumentos.db:
+        repositorio = RepositorioSQLite(argumentos.db)
+        clinica = Clinica.desde_repositorio(repositorio)
+    elif argumentos.journal:
+        repositorio = Journal(argumentos.journal)
+        clinica = repositorio.recuperar()
+    else:
+        clinica = Clinica({}, {}, [], {})
 
-    cli.run()
+    try:
+        if argumentos.socket is not None:
+            try:
+                asyncio.run(servir_para_siempre(clinica, puerto=argumentos.socket))
+            except KeyboardInterrupt:
+                pass
+        elif argumentos.batch is not None:
+            if argumentos.batch == "-":
+                estadisticas = ejecutar_lote(clinica, sys.stdin, sys.stdout)
+            else:
+                try:
+                    comandos = open(argumentos.batch, encoding="utf-8")
+                except OSError as e:
+                    parser.error(f"no se puede leer {argumentos.batch}: {e.strerror}")
+                with comandos:
+                    estadisticas = ejecutar_lote(clinica, comandos, sys.stdout)
+            print("\n".join(estadisticas.obtener_resumen()), file=sys.stderr)
+            codigo_salida = 1 if estadisticas.obtener_cantidad_errores() else 0
+        elif argumentos.http is not None:
+            with ServidorClinica(clinica, puerto=argumentos.http) as servidor:
+                print(f"API HTTP en http://127.0.0.1:{argumentos.http}")
+                try:
+                    servidor.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+        else:
+            CLI(clinica).run()
+    finally:
+        if repositorio is not None:
+            repositorio.cerrar()
+    sys.exit(codigo_salida)
@@ -0,0 +1,90 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from .turno import Turno
+
+
+class Agenda:
+    """
+    Agenda de un médico: turnos ordenados por fecha y hora y agrupados por día,
+    para resolver consultas por rango en tiempo logarítmico.
+    """
+
+    def __init__(self):
+        self.__dias__: dict[date, tuple[list[datetime], list[Turno]]] = {}
+
+    def agregar_turno(self, turno: Turno) -> None:
+        fecha_hora = turno.obtener_fecha_hora()
+        horarios, turnos = self.__dias__.setdefault(fecha_hora.date(), ([], []))
+        posicion = bisect_right(horarios, fecha_hora)
+        horarios.insert(posicion, fecha_hora)
+        turnos.insert(posicion, turno)
+
+    def quitar_turno(self, turno: Turno) -> None:
+        fecha_hora = turno.obtener_fecha_hora()
+        dia = self.__dias__.get(fecha_hora.date())
+        if dia is None:
+            return
+        horarios, turnos = dia
+        posicion = bisect_left(horarios, fecha_hora)
+        while posicion < len(horarios) and horarios[posicion] == fecha_hora:
+            if turnos[posicion] is turno:
+                del horarios[posicion]
+                del turnos[posicion]
+                break
+            posicion += 1
+        if not horarios:
+            del self.__dias__[fecha_hora.date()]
+
+    def obtener_turnos_del_dia(self, dia: date) -> list[Turno]:
+        if dia not in self.__dias__:
+            return []
+        return list(self.__dias__[dia][1])
+
+    def obtener_turnos_en_rango(self, desde: datetime, hasta: datetime) -> list[Turno]:
+        """
+        Devuelve los turnos con fecha y hora en el intervalo [desde, hasta), ordenados.
+        """
+        resultado = []
+        dia = desde.date()
+        while dia <= hasta.date():
+            if dia in self.__dias__:
+                horarios, turnos = self.__dias__[dia]
+                inicio = bisect_left(horarios, desde)
+                fin = bisect_left(horarios, hasta)
+                resultado.extend(turnos[inicio:fin])
+            dia += timedelta(days=1)
+        return resultado
+
+    def obtener_proximo_horario_libre(
+        self, desde: datetime, duracion: timedelta
+    ) -> datetime:
+        """
+        Devuelve el primer horario a partir de `desde` en el que entra un turno de la
+        duración indicada sin superponerse con los turnos ya agendados. Cada
+        conflicto se encuentra con una búsqueda binaria, pero se saltea de a uno:
+        sobre un tramo de k turnos seguidos sin huecos el costo es O(k log n).
+        """
+        candidato = desde
+        while True:
+            conflicto = self.__primer_horario_entre__(
+                candidato - duracion, candidato + duracion
+            )
+            if conflicto is None:
+                return candidato
+            candidato = conflicto + duracion
+
+    def __primer_horario_entre__(
+        self, inicio: datetime, fin: datetime
+    ) -> datetime | None:
+        """
+        Devuelve el primer horario agendado estrictamente entre inicio y fin, o None.
+        """
+        dia = inicio.date()
+        while dia <= fin.date():
+            if dia in self.__dias__:
+                horarios = self.__dias__[dia][0]
+                posicion = bisect_right(horarios, inicio)
+                if posicion < len(horarios) and horarios[posicion] < fin:
+                    return horarios[posicion]
+            dia += timedelta(days=1)
+        return None
@@ -0,0 +1,186 @@
+from array import array
+from collections import Counter
+from datetime import date, datetime, timedelta
+from .turno import Turno
+from ..utils.vocabulario import ESPECIALIDADES
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se agrega en Python puro.
+    np = None
+
+EPOCA = datetime(1970, 1, 1)
+MINUTOS_POR_DIA = 24 * 60
+
+
+class AlmacenColumnarTurnos:
+    """
+    Copia columnar de los turnos para reportes: arreglos paralelos con el código del
+    paciente, el del médico, el de la especialidad (el del registro compartido) y la
+    fecha y hora en minutos desde 1970. Las agregaciones recorren enteros contiguos
+    en lugar de objetos Turno, y usan NumPy si está instalado.
+    """
+
+    def __init__(self):
+        self.__pacientes__ = array("l")
+        self.__medicos__ = array("l")
+        self.__especialidades__ = array("l")
+        self.__minutos__ = array("q")
+        self.__codigos__: dict[str, dict[str, int]] = {
+            "paciente": {},
+            "medico": {},
+        }
+        self.__valores__: dict[str, list[str]] = {
+            "paciente": [],
+            "medico": [],
+        }
+        self.__filas__: dict[tuple[str, datetime], int] = {}
+        self.__claves__: list[tuple[str, datetime]] = []
+
+    def __len__(self) -> int:
+        return len(self.__minutos__)
+
+    def agregar_turno(self, turno: Turno) -> None:
+        matricula = turno.obtener_medico().obtener_matricula()
+        fecha_hora = turno.obtener_fecha_hora()
+        self.__filas__[(matricula, fecha_hora)] = len(self.__minutos__)
+        self.__claves__.append((matricula, fecha_hora))
+        self.__pacientes__.append(
+            self.__codificar__("paciente", turno.obtener_paciente().obtener_dni())
+        )
+        self.__medicos__.append(self.__codificar__("medico", matricula))
+        self.__especialidades__.append(turno.obtener_codigo_especialidad())
+        self.__minutos__.append((fecha_hora - EPOCA) // timedelta(minutes=1))
+
+    def quitar_turno(self, turno: Turno) -> None:
+        """
+        Quita la fila del turno moviendo la última fila a su lugar, en tiempo
+        constante.
+        """
+        clave = (turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora())
+        fila = self.__filas__.pop(clave, None)
+        if fila is None:
+            return
+        ultima = len(self.__minutos__) - 1
+        for columna in (
+            self.__pacientes__,
+            self.__medicos__,
+            self.__especialidades__,
+            self.__minutos__,
+        ):
+            columna[fila] = columna[ultima]
+            columna.pop()
+        clave_ultima = self.__claves__.pop()
+        if fila != ultima:
+            self.__claves__[fila] = clave_ultima
+            self.__filas__[clave_ultima] = fila
+
+    def contar_por_medico(self) -> dict[str, int]:
+        return self.__decodificar__("medico", self.__contar__(self.__medicos__))
+
+    def contar_por_paciente(self) -> dict[str, int]:
+        return self.__decodificar__("paciente", self.__contar__(self.__pacientes__))
+
+    def contar_por_especialidad(self) -> dict[str, int]:
+        return {
+            ESPECIALIDADES.obtener_nombre(codigo): cantidad
+            for codigo, cantidad in self.__contar__(self.__especialidades__).items()
+        }
+
+    def contar_por_dia(self) -> dict[date, int]:
+        if np is not None:
+            dias = np.frombuffer(self.__minutos__, dtype=np.int64) // MINUTOS_POR_DIA
+            valores, cantidades = np.unique(dias, return_counts=True)
+            conteo = zip(valores.tolist(), cantidades.tolist())
+        else:
+            conteo = Counter(m // MINUTOS_POR_DIA for m in self.__minutos__).items()
+        return {
+            (EPOCA + timedelta(days=dia)).date(): cantidad
+            for dia, cantidad in sorted(conteo)
+        }
+
+    def contar_por_medico_y_dia(self) -> dict[tuple[str, date], int]:
+        return {
+            (matricula, (EPOCA + timedelta(days=dia)).date()): cantidad
+            for (matricula, dia), cantidad in self.__contar_por_medico_y__(
+                MINUTOS_POR_DIA
+            ).items()
+        }
+
+    def ocupacion_por_medico_y_semana(self) -> dict[tuple[str, date], int]:
+        """
+        Cantidad de turnos por médico y semana, identificando cada semana por la
+        fecha de su lunes.
+        """
+        # El 1/1/1970 fue jueves: se corre el origen al lunes anterior.
+        desplazamiento = 3 * MINUTOS_POR_DIA
+        conteo = self.__contar_por_medico_y__(7 * MINUTOS_POR_DIA, desplazamiento)
+        return {
+            (matricula, (EPOCA + timedelta(weeks=semana, days=-3)).date()): cantidad
+            for (matricula, semana), cantidad in conteo.items()
+        }
+
+    def histograma_por_hora(self) -> list[int]:
+        """
+        Cantidad de turnos según la hora del día en que empiezan (24 posiciones).
+        """
+        if np is not None:
+            minutos = np.frombuffer(self.__minutos__, dtype=np.int64)
+            return np.bincount(minutos // 60 % 24, minlength=24).tolist()
+        histograma = [0] * 24
+        for minuto in self.__minutos__:
+            histograma[minuto // 60 % 24] += 1
+        return histograma
+
+    def __codificar__(self, tipo: str, valor: str) -> int:
+        codigos = self.__codigos__[tipo]
+        if valor not in codigos:
+            codigos[valor] = len(codigos)
+            self.__valores__[tipo].append(valor)
+        return codigos[valor]
+
+    def __decodificar__(self, tipo: str, conteo: dict[int, int]) -> dict[str, int]:
+        valores = self.__valores__[tipo]
+        return {valores[codigo]: cantidad for codigo, cantidad in conteo.items()}
+
+    def __contar__(self, columna: array) -> dict[int, int]:
+        if np is not None:
+            conteo = np.bincount(
+                np.frombuffer(columna, dtype=np.dtype(columna.typecode))
+            )
+            return {c: n for c, n in enumerate(conteo.tolist()) if n}
+        return dict(Counter(columna))
+
+    def __contar_por_medico_y__(
+        self, minutos_por_grupo: int, desplazamiento: int = 0
+    ) -> dict[tuple[str, int], int]:
+        medicos = self.__valores__["medico"]
+        if np is not None:
+            grupos = (
+                np.frombuffer(self.__minutos__, dtype=np.int64) + desplazamiento
+            ) // minutos_por_grupo
+            if not len(grupos):
+                return {}
+            codigos = np.frombuffer(
+                self.__medicos__, dtype=np.dtype(self.__medicos__.typecode)
+            ).astype(np.int64)
+            # Se combinan médico y grupo en una sola clave entera para agrupar.
+            minimo = int(grupos.min())
+            ancho = int(grupos.max()) - minimo + 1
+            claves, cantidades = np.unique(
+                codigos * ancho + (grupos - minimo), return_counts=True
+            )
+            return {
+                (medicos[clave // ancho], clave % ancho + minimo): cantidad
+                for clave, cantidad in zip(claves.tolist(), cantidades.tolist())
+            }
+        conteo = Counter(
+            zip(
+                self.__medicos__,
+                ((m + desplazamiento) // minutos_por_grupo for m in self.__minutos__),
+            )
+        )
+        return {
+            (medicos[codigo], grupo): cantidad
+            for (codigo, grupo), cantidad in conteo.items()
+        }
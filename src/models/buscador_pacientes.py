@@ -0,0 +1,167 @@
+import heapq
+import sys
+import unicodedata
+from bisect import bisect_left, insort
+from .paciente import Paciente
+
+PUNTAJE_EXACTO = 3
+PUNTAJE_PREFIJO = 2
+PUNTAJE_ERROR_DE_TIPEO = 1
+# Las palabras más cortas no se corrigen: con un error de por medio coincidirían
+# con demasiados nombres.
+LARGO_MINIMO_CORRECCION = 3
+PALABRAS_POR_PREFIJO = 64
+
+
+class BuscadorPacientes:
+    """
+    Índice de búsqueda sobre los nombres de los pacientes. Los nombres se separan en
+    palabras normalizadas (minúsculas y sin tildes) que se guardan ordenadas, para
+    resolver prefijos con búsqueda binaria, y con sus variantes de un carácter
+    borrado, para tolerar un error de tipeo por palabra sin recorrer el índice.
+
+    Para acotar la latencia, cada búsqueda puntúa a lo sumo
+    `candidatos_por_busqueda` pacientes, empezando por las mejores coincidencias de
+    la palabra buscada más selectiva, y se detiene antes si ya no puede encontrar
+    mejores resultados. Con nombres muy repetidos, el orden alfabético entre
+    resultados de igual puntaje es solo entre los pacientes evaluados.
+    """
+
+    def __init__(self, candidatos_por_busqueda: int = 200):
+        self.__candidatos_por_busqueda__ = candidatos_por_busqueda
+        self.__dnis_por_palabra__: dict[str, set[str]] = {}
+        self.__palabras__: list[str] = []
+        self.__borrados__: dict[str, set[str]] = {}
+        self.__palabras_por_dni__: dict[str, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__palabras_por_dni__)
+
+    def agregar_paciente(self, paciente: Paciente) -> None:
+        dni = paciente.obtener_dni()
+        palabras = tuple(
+            sys.intern(p) for p in _normalizar(paciente.obtener_nombre()).split()
+        )
+        self.__palabras_por_dni__[dni] = palabras
+        for palabra in palabras:
+            dnis = self.__dnis_por_palabra__.get(palabra)
+            if dnis is None:
+                dnis = self.__dnis_por_palabra__[palabra] = set()
+                insort(self.__palabras__, palabra)
+                for borrado in _borrados(palabra):
+                    self.__borrados__.setdefault(borrado, set()).add(palabra)
+            dnis.add(dni)
+
+    def buscar(self, texto: str, limite: int = 10) -> list[str]:
+        """
+        Devuelve hasta `limite` DNIs de pacientes cuyo nombre contiene, para cada
+        palabra buscada, una palabra igual, que empieza con ella o que difiere en un
+        carácter. Primero van los que mejor coinciden y, a igual coincidencia, por
+        orden alfabético del nombre.
+        """
+        buscadas = _normalizar(texto).split()
+        if not buscadas or limite <= 0:
+            return []
+        coincidencias = [self.__coincidencias__(palabra) for palabra in buscadas]
+        correcciones = [
+            {palabra for puntaje, palabra in c if puntaje == PUNTAJE_ERROR_DE_TIPEO}
+            for c in coincidencias
+        ]
+        # Los candidatos salen de la palabra con menos pacientes y después se
+        # comparan contra el resto de las palabras buscadas.
+        guia = min(
+            range(len(buscadas)),
+            key=lambda i: sum(
+                len(self.__dnis_por_palabra__[p]) for _, p in coincidencias[i]
+            ),
+        )
+        resto = PUNTAJE_EXACTO * (len(buscadas) - 1)
+        puntuados = []
+        # Los `limite` mejores puntajes encontrados, en un montículo de mínimos.
+        mejores_puntajes: list[int] = []
+        vistos: set[str] = set()
+        for puntaje_guia, palabra_guia in coincidencias[guia]:
+            # Ningún candidato que quede puede superar a los ya encontrados.
+            if (
+                len(mejores_puntajes) == limite
+                and mejores_puntajes[0] >= puntaje_guia + resto
+            ):
+                break
+            for dni in self.__dnis_por_palabra__[palabra_guia]:
+                if len(vistos) == self.__candidatos_por_busqueda__:
+                    break
+                if dni in vistos:
+                    continue
+                vistos.add(dni)
+                palabras = self.__palabras_por_dni__[dni]
+                puntaje = 0
+                for buscada, corregidas in zip(buscadas, correcciones):
+                    mejor = _puntuar(buscada, corregidas, palabras)
+                    if not mejor:
+                        break
+                    puntaje += mejor
+                else:
+                    puntuados.append((-puntaje, palabras, dni))
+                    if len(mejores_puntajes) < limite:
+                        heapq.heappush(mejores_puntajes, puntaje)
+                    else:
+                        heapq.heappushpop(mejores_puntajes, puntaje)
+        return [dni for _, _, dni in heapq.nsmallest(limite, puntuados)]
+
+    def __coincidencias__(self, buscada: str) -> list[tuple[int, str]]:
+        """
+        Palabras del índice que coinciden con `buscada` con su puntaje, de la mejor
+        coincidencia a la peor. Se toman a lo sumo `PALABRAS_POR_PREFIJO` palabras
+        que empiezan con ella.
+        """
+        coincidencias = []
+        if buscada in self.__dnis_por_palabra__:
+            coincidencias.append((PUNTAJE_EXACTO, buscada))
+        posicion = bisect_left(self.__palabras__, buscada)
+        fin = min(len(self.__palabras__), posicion + PALABRAS_POR_PREFIJO + 1)
+        while posicion < fin and self.__palabras__[posicion].startswith(buscada):
+            if self.__palabras__[posicion] != buscada:
+                coincidencias.append((PUNTAJE_PREFIJO, self.__palabras__[posicion]))
+            posicion += 1
+        coincidencias.extend(
+            (PUNTAJE_ERROR_DE_TIPEO, palabra)
+            for palabra in sorted(self.__corregir__(buscada))
+            if not palabra.startswith(buscada)
+        )
+        return coincidencias
+
+    def __corregir__(self, buscada: str) -> set[str]:
+        """
+        Palabras del índice a un carácter borrado, agregado o cambiado de
+        `buscada`, buscadas por sus variantes con un carácter borrado.
+        """
+        if len(buscada) < LARGO_MINIMO_CORRECCION:
+            return set()
+        corregidas = set(self.__borrados__.get(buscada, ()))
+        for borrado in _borrados(buscada):
+            if borrado in self.__dnis_por_palabra__:
+                corregidas.add(borrado)
+            corregidas.update(self.__borrados__.get(borrado, ()))
+        corregidas.discard(buscada)
+        return corregidas
+
+
+def _normalizar(texto: str) -> str:
+    descompuesto = unicodedata.normalize("NFKD", texto.casefold())
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def _borrados(palabra: str) -> set[str]:
+    return {palabra[:i] + palabra[i + 1 :] for i in range(len(palabra))}
+
+
+def _puntuar(buscada: str, corregidas: set[str], palabras: tuple[str, ...]) -> int:
+    mejor = 0
+    for palabra in palabras:
+        if palabra == buscada:
+            return PUNTAJE_EXACTO
+        if palabra.startswith(buscada):
+            mejor = PUNTAJE_PREFIJO
+        elif not mejor and palabra in corregidas:
+            mejor = PUNTAJE_ERROR_DE_TIPEO
+    return mejor
@@ -1,19 +1,52 @@
-from datetime import datetime
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, ExitStack, nullcontext
+from datetime import date, datetime, time, timedelta
+from heapq import merge
+from threading import Lock, RLock
+from types import MappingProxyType
 from .paciente import Paciente
 from .medico import Medico
 from .turno import Turno
 from .historia_clinica import HistoriaClinica
+from .estadisticas_historia import EstadisticasHistoria
+from .indice_medicamentos import IndiceMedicamentos
 from .receta import Receta
-from ..errors.custom_exception import TipoDeDatoInvalidoError
+from .agenda import Agenda
+from .almacen_columnar import AlmacenColumnarTurnos
+from .especialidad import Especialidad
+from .indices import IndiceTurnos, crear_indices_predeterminados
+from .buscador_pacientes import BuscadorPacientes
+from .disponibilidad import MotorDisponibilidad
+from ..errors.custom_exception import (
+    CustomException,
+    TipoDeDatoInvalidoError,
+    ValidacionError,
+)
+from ..utils.fechas import DIAS_SEMANA, obtener_numero_dia
+from ..utils.vistas import VistaSecuencia
+from ..utils.vocabulario import ESPECIALIDADES
+from ..utils.reloj import RELOJ_SISTEMA, Reloj
+from ..persistencia.repositorio import Repositorio
+from ..persistencia.archivo_turnos import ArchivoTurnos
+from ..persistencia.hidratacion import hidratar_turno
+from ..utils.importacion import (
+    ResultadoImportacion,
+    medico_desde_registro,
+    paciente_desde_registro,
+)
 from ..errors.excepciones_clinica import (
     PacienteNoEncontradoError,
     PacienteYaRegistradoError,
     MedicoNoEncontradoError,
     MedicoYaRegistradoError,
     TurnoOcupadoError,
+    TurnoNoEncontradoError,
     MedicoNoDisponibleError,
+    PersistenciaError,
 )
 
+_SIN_BLOQUEO = nullcontext()
+
 
 class Clinica:
     """
@@ -26,6 +59,8 @@ class Clinica:
         medicos: dict[str, Medico],
         turnos: list[Turno],
         historias_clinicas: dict[str, HistoriaClinica],
+        repositorio: Repositorio | None = None,
+        reloj: Reloj = RELOJ_SISTEMA,
     ):
         if not isinstance(pacientes, dict):
             raise TipoDeDatoInvalidoError("pacientes debe ser un diccionario")
@@ -39,19 +74,181 @@ class Clinica:
         self.__medicos__ = medicos
         self.__turnos__ = turnos
         self.__historias_clinicas__ = historias_clinicas
+        # Totales de todas las historias; con repositorio solo incluyen las ya
+        # hidratadas hasta que se pide el resumen general.
+        self.__estadisticas__ = EstadisticasHistoria()
+        self.__indice_medicamentos__ = IndiceMedicamentos()
+        self.__historias_completas__ = repositorio is None
+        for historia in historias_clinicas.values():
+            historia.vincular_estadisticas(self.__estadisticas__)
+            for receta in historia.ver_recetas():
+                self.__indice_medicamentos__.agregar_receta(receta)
+        self.__repositorio__ = repositorio
+        # Cada operación lee la fecha y hora actual una sola vez, de este reloj.
+        self.__reloj__ = reloj
+        self.__indice_turnos__: dict[tuple[str, datetime], Turno] = {}
+        self.__agendas__: dict[str, Agenda] = {}
+        self.__almacen_columnar__: AlmacenColumnarTurnos | None = None
+        self.__disponibilidad__: MotorDisponibilidad | None = None
+        self.__archivo_turnos__: ArchivoTurnos | None = None
+        self.__bloqueo_registro__: RLock | None = None
+        self.__bloqueos_medicos__: dict[str, Lock] = {}
+        self.__indices__: dict[str, IndiceTurnos] = {
+            indice.obtener_nombre(): indice
+            for indice in crear_indices_predeterminados()
+        }
+        for turno in turnos:
+            self.__indexar_turno__(turno)
+        self.__buscador_pacientes__ = BuscadorPacientes()
+        for paciente in pacientes.values():
+            self.__buscador_pacientes__.agregar_paciente(paciente)
+
+    @classmethod
+    def desde_repositorio(
+        cls, repositorio: Repositorio, reloj: Reloj = RELOJ_SISTEMA
+    ) -> "Clinica":
+        """
+        Crea una clínica respaldada por el repositorio. Al iniciar se cargan pacientes,
+        médicos y los turnos vigentes; las historias clínicas se hidratan recién cuando
+        se accede a ellas, por lo que el arranque no depende del historial acumulado.
+        """
+        pacientes = repositorio.cargar_pacientes()
+        medicos = repositorio.cargar_medicos()
+        turnos = repositorio.cargar_turnos_desde(reloj.ahora(), pacientes, medicos)
+        return cls(pacientes, medicos, turnos, {}, repositorio, reloj)
+
+    def obtener_reloj(self) -> Reloj:
+        return self.__reloj__
+
+    def habilitar_concurrencia(self) -> None:
+        """
+        Prepara la clínica para usarse desde varios hilos; debe llamarse antes de
+        compartirla. Cada médico tiene su propio lock, que serializa validar y
+        agendar (o cancelar) sus turnos, así que los turnos de médicos distintos se
+        validan en paralelo. Un lock general reentrante protege por tramos cortos las
+        estructuras compartidas (índices, historias clínicas y repositorio); se toma
+        siempre después del lock del médico. Las vistas sin copia (ver_*,
+        iterar_turnos) no deben recorrerse mientras otros hilos escriben.
+        """
+        if self.__bloqueo_registro__ is None:
+            self.__bloqueos_medicos__ = {
+                matricula: Lock() for matricula in self.__medicos__
+            }
+            self.__bloqueo_registro__ = RLock()
+
+    def agrupar_escrituras(self) -> AbstractContextManager:
+        """
+        Contexto dentro del cual las escrituras al repositorio se confirman todas
+        juntas al salir (ver Repositorio.agrupar_escrituras).
+        """
+        if self.__repositorio__ is None:
+            return _SIN_BLOQUEO
+        return self.__repositorio__.agrupar_escrituras()
 
     def agregar_paciente(self, paciente: Paciente):
-        dni = paciente.obtener_dni()
-        if dni in self.__pacientes__:
-            raise PacienteYaRegistradoError(dni)
-        self.__pacientes__[dni] = paciente
-        self.__historias_clinicas__[dni] = HistoriaClinica(paciente)
+        with self.__bloquear_registro__():
+            dni = paciente.obtener_dni()
+            if dni in self.__pacientes__:
+                raise PacienteYaRegistradoError(dni)
+            if self.__repositorio__ is not None:
+                self.__repositorio__.guardar_paciente(paciente)
+            self.__pacientes__[dni] = paciente
+            self.__historias_clinicas__[dni] = HistoriaClinica(
+                paciente, self.__estadisticas__
+            )
+            self.__buscador_pacientes__.agregar_paciente(paciente)
 
     def agregar_medico(self, medico: Medico):
-        matricula = medico.obtener_matricula()
-        if matricula in self.__medicos__:
-            raise MedicoYaRegistradoError(matricula)
-        self.__medicos__[matricula] = medico
+        with self.__bloquear_registro__():
+            matricula = medico.obtener_matricula()
+            if matricula in self.__medicos__:
+                raise MedicoYaRegistradoError(matricula)
+            if self.__repositorio__ is not None:
+                self.__repositorio__.guardar_medico(medico)
+            self.__medicos__[matricula] = medico
+            if self.__disponibilidad__ is not None:
+                self.__disponibilidad__.registrar_medico(medico)
+
+    def agregar_especialidad_a_medico(self, matricula: str, especialidad: Especialidad):
+        self.validar_existencia_medico(matricula)
+        if not isinstance(especialidad, Especialidad):
+            raise TipoDeDatoInvalidoError("Debe agregar una instancia de Especialidad")
+        with self.__bloquear_medico__(matricula), self.__bloquear_registro__():
+            if self.__repositorio__ is not None:
+                self.__repositorio__.guardar_especialidad(matricula, especialidad)
+            self.__medicos__[matricula].agregar_especialidad(especialidad)
+            if self.__disponibilidad__ is not None:
+                self.__disponibilidad__.registrar_medico(self.__medicos__[matricula])
+
+    def importar_pacientes(
+        self, registros: Iterable[dict | str | Paciente]
+    ) -> ResultadoImportacion:
+        """
+        Importa pacientes en lote a partir de registros (por ejemplo los de
+        leer_registros) o instancias de Paciente. Las filas inválidas o con DNI
+        duplicado se informan en el resultado sin abortar la importación, y los
+        pacientes válidos se incorporan todos juntos al final.
+        """
+        ahora = self.__reloj__.ahora()
+        with self.__bloquear_registro__():
+            resultado = ResultadoImportacion()
+            nuevos: dict[str, Paciente] = {}
+            for fila, registro in enumerate(registros, start=1):
+                try:
+                    paciente = (
+                        registro
+                        if isinstance(registro, Paciente)
+                        else paciente_desde_registro(registro, ahora)
+                    )
+                    dni = paciente.obtener_dni()
+                    if dni in self.__pacientes__ or dni in nuevos:
+                        raise PacienteYaRegistradoError(dni)
+                    nuevos[dni] = paciente
+                except CustomException as e:
+                    resultado.registrar_error(fila, e)
+            if self.__repositorio__ is not None:
+                self.__repositorio__.guardar_pacientes(nuevos.values())
+            self.__pacientes__.update(nuevos)
+            self.__historias_clinicas__.update(
+                (dni, HistoriaClinica(paciente, self.__estadisticas__))
+                for dni, paciente in nuevos.items()
+            )
+            for paciente in nuevos.values():
+                self.__buscador_pacientes__.agregar_paciente(paciente)
+            resultado.registrar_importados(len(nuevos))
+            return resultado
+
+    def importar_medicos(
+        self, registros: Iterable[dict | str | Medico]
+    ) -> ResultadoImportacion:
+        """
+        Importa médicos en lote con la misma semántica que importar_pacientes,
+        detectando matrículas duplicadas en el lote y en la clínica.
+        """
+        with self.__bloquear_registro__():
+            resultado = ResultadoImportacion()
+            nuevos: dict[str, Medico] = {}
+            for fila, registro in enumerate(registros, start=1):
+                try:
+                    medico = (
+                        registro
+                        if isinstance(registro, Medico)
+                        else medico_desde_registro(registro)
+                    )
+                    matricula = medico.obtener_matricula()
+                    if matricula in self.__medicos__ or matricula in nuevos:
+                        raise MedicoYaRegistradoError(matricula)
+                    nuevos[matricula] = medico
+                except CustomException as e:
+                    resultado.registrar_error(fila, e)
+            if self.__repositorio__ is not None:
+                self.__repositorio__.guardar_medicos(nuevos.values())
+            self.__medicos__.update(nuevos)
+            if self.__disponibilidad__ is not None:
+                for medico in nuevos.values():
+                    self.__disponibilidad__.registrar_medico(medico)
+            resultado.registrar_importados(len(nuevos))
+            return resultado
 
     def obtener_pacientes(self) -> list[Paciente]:
         return list(self.__pacientes__.values())
@@ -59,38 +256,467 @@ class Clinica:
     def obtener_medicos(self) -> list[Medico]:
         return list(self.__medicos__.values())
 
+    def ver_pacientes(self) -> Mapping[str, Paciente]:
+        """
+        Vista de solo lectura de los pacientes por DNI, sin copiar el diccionario.
+        """
+        return MappingProxyType(self.__pacientes__)
+
+    def ver_medicos(self) -> Mapping[str, Medico]:
+        """
+        Vista de solo lectura de los médicos por matrícula, sin copiar el diccionario.
+        """
+        return MappingProxyType(self.__medicos__)
+
+    def buscar_pacientes(self, texto: str, limite: int = 10) -> list[Paciente]:
+        """
+        Busca pacientes por nombre a partir de prefijos de sus palabras, tolerando
+        un error de tipeo por palabra, y devuelve los `limite` más parecidos.
+        """
+        with self.__bloquear_registro__():
+            return [
+                self.__pacientes__[dni]
+                for dni in self.__buscador_pacientes__.buscar(texto, limite)
+            ]
+
     def obtener_medico_por_matricula(self, matricula: str) -> Medico:
         self.validar_existencia_medico(matricula)
         return self.__medicos__[matricula]
 
     def agendar_turno(
         self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime
-    ):
+    ) -> Turno:
+        self.validar_existencia_paciente(dni)
+        self.validar_existencia_medico(matricula)
+        self.__asegurar_tipos_de_turno__(fecha_hora, especialidad)
+        with self.__bloquear_medico__(matricula):
+            self.validar_turno_no_duplicado(matricula, fecha_hora)
+            paciente = self.__pacientes__[dni]
+            medico = self.__medicos__[matricula]
+            self.validar_especialidad_en_dia(medico, especialidad, fecha_hora.weekday())
+            turno = Turno(
+                paciente, medico, fecha_hora, especialidad, self.__reloj__.ahora()
+            )
+            self.__registrar_turnos__([turno])
+        return turno
+
+    def agendar_turnos_lote(
+        self,
+        dni: str,
+        matricula: str,
+        especialidad: str,
+        fechas: Iterable[datetime],
+    ) -> list[Turno]:
+        """
+        Agenda varios turnos del mismo paciente con el mismo médico (por ejemplo los
+        generados con generar_fechas_recurrentes). Se validan todos antes de agendar
+        cualquiera: si alguno es inválido, está ocupado o se repite dentro del lote,
+        se lanza la excepción correspondiente y no se agenda ninguno.
+        """
         self.validar_existencia_paciente(dni)
         self.validar_existencia_medico(matricula)
-        self.validar_turno_no_duplicado(matricula, fecha_hora)
         paciente = self.__pacientes__[dni]
         medico = self.__medicos__[matricula]
-        dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
-        self.validar_especialidad_en_dia(medico, especialidad, dia_semana)
-        turno = Turno(paciente, medico, fecha_hora, especialidad)
-        self.__turnos__.append(turno)
-        self.__historias_clinicas__[dni].agregar_turno(turno)
+        ahora = self.__reloj__.ahora()
+        with self.__bloquear_medico__(matricula):
+            turnos = []
+            fechas_del_lote = set()
+            for fecha_hora in fechas:
+                # El turno se crea recién después de validar, porque al crearlo se
+                # registra la especialidad en el registro compartido.
+                self.__asegurar_tipos_de_turno__(fecha_hora, especialidad)
+                if fecha_hora in fechas_del_lote:
+                    raise TurnoOcupadoError()
+                self.validar_turno_no_duplicado(matricula, fecha_hora)
+                self.validar_especialidad_en_dia(
+                    medico, especialidad, fecha_hora.weekday()
+                )
+                fechas_del_lote.add(fecha_hora)
+                turnos.append(Turno(paciente, medico, fecha_hora, especialidad, ahora))
+            self.__registrar_turnos__(turnos)
+        return turnos
 
     def obtener_turnos(self) -> list[Turno]:
+        """
+        Devuelve los turnos en memoria. En una clínica creada con desde_repositorio
+        son los vigentes al iniciar más los agendados desde entonces; los anteriores
+        siguen disponibles en la historia clínica de cada paciente.
+        """
         return list(self.__turnos__)
 
-    def emitir_receta(self, dni: str, matricula: str, medicamentos: list[str]):
+    def ver_turnos(self) -> Sequence[Turno]:
+        """
+        Vista de solo lectura de los turnos en memoria, sin copiar la lista.
+        """
+        return VistaSecuencia(self.__turnos__)
+
+    def iterar_turnos(
+        self, filtro: Callable[[Turno], bool] | None = None
+    ) -> Iterator[Turno]:
+        """
+        Recorre los turnos en memoria, opcionalmente solo los que cumplen el filtro.
+        """
+        if filtro is None:
+            return iter(self.__turnos__)
+        return (turno for turno in self.__turnos__ if filtro(turno))
+
+    def habilitar_almacen_columnar(self) -> AlmacenColumnarTurnos:
+        """
+        Crea (una sola vez) el almacén columnar de turnos para reportes a partir de
+        los turnos actuales; desde entonces se mantiene junto con cada turno nuevo.
+        """
+        with self.__bloquear_registro__():
+            if self.__almacen_columnar__ is None:
+                almacen = AlmacenColumnarTurnos()
+                for turno in self.__turnos__:
+                    almacen.agregar_turno(turno)
+                self.__almacen_columnar__ = almacen
+            return self.__almacen_columnar__
+
+    def habilitar_disponibilidad(
+        self,
+        duracion: timedelta = timedelta(minutes=30),
+        apertura: time = time(8, 0),
+        cierre: time = time(18, 0),
+    ) -> MotorDisponibilidad:
+        """
+        Configura el motor de disponibilidad con la duración de las franjas y el
+        horario de atención, reemplazando la configuración anterior si la había.
+        """
+        motor = MotorDisponibilidad(
+            self.__obtener_turnos_del_dia__, duracion, apertura, cierre
+        )
+        with self.__bloquear_registro__():
+            for medico in self.__medicos__.values():
+                motor.registrar_medico(medico)
+            self.__disponibilidad__ = motor
+        return motor
+
+    def habilitar_archivo(self, archivo: ArchivoTurnos) -> None:
+        """
+        Indica dónde archivar_turnos guarda los turnos pasados.
+        """
+        if not isinstance(archivo, ArchivoTurnos):
+            raise TipoDeDatoInvalidoError(
+                "Debe habilitar una instancia de ArchivoTurnos"
+            )
+        with self.__bloquear_registro__():
+            self.__archivo_turnos__ = archivo
+
+    def archivar_turnos(self, hasta: datetime | None = None) -> int:
+        """
+        Mueve al archivo los turnos anteriores a `hasta` (por defecto, ahora): los
+        quita de los turnos en memoria, de sus índices y de las historias clínicas
+        cargadas, que los vuelven a leer del archivo cuando se los consulta.
+        Devuelve cuántos turnos salieron de la memoria. Si hay un repositorio, los
+        turnos siguen en él.
+        """
+        if self.__archivo_turnos__ is None:
+            raise ValidacionError("La clínica no tiene un archivo de turnos habilitado")
+        ahora = self.__reloj__.ahora()
+        if hasta is None:
+            hasta = ahora
+        elif hasta > ahora:
+            raise ValidacionError("Solo se pueden archivar turnos pasados")
+        archivo = self.__archivo_turnos__
+        with ExitStack() as bloqueos:
+            # Todos los médicos en orden fijo y después el registro, como el resto
+            # de las operaciones, para no cruzarse con turnos que se agendan.
+            for matricula in sorted(self.__medicos__):
+                bloqueos.enter_context(self.__bloquear_medico__(matricula))
+            bloqueos.enter_context(self.__bloquear_registro__())
+            pasados = [t for t in self.__turnos__ if t.obtener_fecha_hora() < hasta]
+            archivables = dict.fromkeys(pasados)
+            for historia in self.__historias_clinicas__.values():
+                archivables.update(
+                    dict.fromkeys(historia.obtener_turnos_archivables(hasta))
+                )
+            if not archivables:
+                return 0
+            # Primero se escribe el archivo: si falla, la memoria queda intacta.
+            archivo.archivar(archivables)
+            self.__turnos__[:] = [
+                t for t in self.__turnos__ if t.obtener_fecha_hora() >= hasta
+            ]
+            for turno in pasados:
+                self.__desindexar_turno__(turno)
+            for historia in self.__historias_clinicas__.values():
+                paciente = historia.obtener_paciente()
+                historia.archivar_turnos(
+                    hasta,
+                    lambda meses, paciente=paciente: archivo.cargar_turnos_de_paciente(
+                        paciente, meses, self.__medicos__
+                    ),
+                )
+        return len(archivables)
+
+    def iterar_turnos_entre(
+        self, desde: datetime | None = None, hasta: datetime | None = None
+    ) -> Iterator[Turno]:
+        """
+        Recorre en orden de fecha los turnos del intervalo [desde, hasta), tanto
+        los archivados como los que están en memoria. Del archivo se leen solo los
+        meses del intervalo y a medida que se avanza.
+        """
+        with self.__bloquear_registro__():
+            archivo = self.__archivo_turnos__
+            en_memoria = sorted(
+                (
+                    t
+                    for t in self.__turnos__
+                    if (desde is None or t.obtener_fecha_hora() >= desde)
+                    and (hasta is None or t.obtener_fecha_hora() < hasta)
+                ),
+                key=Turno.obtener_fecha_hora,
+            )
+        if archivo is None:
+            return iter(en_memoria)
+        archivados = (
+            self.__hidratar_turno_archivado__(dni, matricula, fecha_hora, especialidad)
+            for dni, matricula, fecha_hora, especialidad in archivo.iterar_filas(
+                desde, hasta
+            )
+            # Un turno archivado puede volver a estar en memoria, por ejemplo al
+            # recuperar la clínica de un journal.
+            if (matricula, fecha_hora) not in self.__indice_turnos__
+        )
+        return merge(archivados, en_memoria, key=Turno.obtener_fecha_hora)
+
+    def __hidratar_turno_archivado__(
+        self, dni: str, matricula: str, fecha_hora: datetime, especialidad: str
+    ) -> Turno:
+        """
+        Un archivo copiado de otra clínica puede tener turnos de pacientes o
+        médicos que esta no conoce.
+        """
+        paciente = self.__pacientes__.get(dni)
+        medico = self.__medicos__.get(matricula)
+        if paciente is None or medico is None:
+            raise PersistenciaError(
+                f"el turno archivado del {fecha_hora.isoformat()} es de un paciente "
+                f"({dni}) o médico ({matricula}) que no está en la clínica"
+            )
+        return hidratar_turno(paciente, medico, fecha_hora, especialidad)
+
+    def buscar_horarios_libres(
+        self, especialidad: str, desde: datetime, cantidad: int = 10
+    ) -> list[tuple[datetime, Medico]]:
+        """
+        Devuelve los próximos `cantidad` horarios libres para la especialidad con
+        cualquier médico que la atienda, como pares (fecha y hora, médico). Si el
+        motor de disponibilidad no fue configurado, usa franjas de 30 minutos entre
+        las 8 y las 18.
+        """
+        codigo = ESPECIALIDADES.obtener_codigo(especialidad)
+        if codigo is None or cantidad <= 0:
+            return []
+        with self.__bloquear_registro__():
+            if self.__disponibilidad__ is None:
+                self.habilitar_disponibilidad()
+            return self.__disponibilidad__.buscar_horarios_libres(
+                codigo, desde, cantidad
+            )
+
+    def obtener_turnos_medico_en_rango(
+        self, matricula: str, desde: datetime, hasta: datetime
+    ) -> list[Turno]:
+        self.validar_existencia_medico(matricula)
+        with self.__bloquear_registro__():
+            if matricula not in self.__agendas__:
+                return []
+            return self.__agendas__[matricula].obtener_turnos_en_rango(desde, hasta)
+
+    def obtener_turnos_medico_del_dia(self, matricula: str, dia: date) -> list[Turno]:
+        self.validar_existencia_medico(matricula)
+        with self.__bloquear_registro__():
+            return self.__obtener_turnos_del_dia__(matricula, dia)
+
+    def obtener_proximo_horario_libre(
+        self,
+        matricula: str,
+        desde: datetime,
+        duracion: timedelta = timedelta(minutes=30),
+    ) -> datetime:
+        self.validar_existencia_medico(matricula)
+        with self.__bloquear_registro__():
+            if matricula not in self.__agendas__:
+                return desde
+            return self.__agendas__[matricula].obtener_proximo_horario_libre(
+                desde, duracion
+            )
+
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> Turno:
+        """
+        Cancela el turno del médico en la fecha y hora indicadas: lo quita de la
+        clínica, de todos sus índices y de la historia clínica del paciente, y
+        registra la baja en el repositorio si lo hay. Devuelve el turno cancelado.
+        """
+        self.validar_existencia_medico(matricula)
+        with self.__bloquear_medico__(matricula), self.__bloquear_registro__():
+            turno = self.__indice_turnos__.get((matricula, fecha_hora))
+            if turno is None:
+                raise TurnoNoEncontradoError(matricula, fecha_hora)
+            dni = turno.obtener_paciente().obtener_dni()
+            historia = self.__obtener_historia__(dni)
+            if self.__repositorio__ is not None:
+                self.__repositorio__.eliminar_turno(turno)
+            self.__turnos__.remove(turno)
+            self.__desindexar_turno__(turno)
+            historia.quitar_turno(turno)
+        return turno
+
+    def registrar_indice(self, indice: IndiceTurnos) -> None:
+        """
+        Agrega un índice secundario de turnos, cargándolo con los turnos actuales.
+        Desde ese momento se mantiene con cada alta y baja de turnos.
+        """
+        if not isinstance(indice, IndiceTurnos):
+            raise TipoDeDatoInvalidoError(
+                "Debe registrar una instancia de IndiceTurnos"
+            )
+        nombre = indice.obtener_nombre()
+        with self.__bloquear_registro__():
+            if nombre in self.__indices__:
+                raise ValidacionError(f"Ya existe un índice de turnos llamado {nombre}")
+            for turno in self.__turnos__:
+                indice.agregar_turno(turno)
+            self.__indices__[nombre] = indice
+
+    def obtener_turnos_por_indice(self, nombre: str, clave) -> list[Turno]:
+        """
+        Devuelve, ordenados por fecha y hora, los turnos que el índice `nombre`
+        agrupa bajo `clave`.
+        """
+        if nombre not in self.__indices__:
+            raise ValidacionError(f"No existe un índice de turnos llamado {nombre}")
+        with self.__bloquear_registro__():
+            return self.__indices__[nombre].obtener_turnos(clave)
+
+    def obtener_turnos_de_paciente(self, dni: str) -> list[Turno]:
+        """
+        Turnos vigentes del paciente. A diferencia de la historia clínica, no
+        incluye los turnos pasados que solo están en el repositorio.
+        """
+        self.validar_existencia_paciente(dni)
+        return self.obtener_turnos_por_indice("paciente", dni)
+
+    def obtener_turnos_de_medico(self, matricula: str) -> list[Turno]:
+        self.validar_existencia_medico(matricula)
+        return self.obtener_turnos_por_indice("medico", matricula)
+
+    def obtener_turnos_de_especialidad(self, especialidad: str) -> list[Turno]:
+        codigo = ESPECIALIDADES.obtener_codigo(especialidad)
+        if codigo is None:
+            return []
+        return self.obtener_turnos_por_indice("especialidad", codigo)
+
+    def obtener_turnos_de_fecha(self, dia: date) -> list[Turno]:
+        return self.obtener_turnos_por_indice("fecha", dia)
+
+    def emitir_receta(
+        self, dni: str, matricula: str, medicamentos: list[str]
+    ) -> Receta:
         self.validar_existencia_paciente(dni)
         self.validar_existencia_medico(matricula)
         paciente = self.__pacientes__[dni]
         medico = self.__medicos__[matricula]
-        receta = Receta(paciente, medico, medicamentos)
-        self.__historias_clinicas__[dni].agregar_receta(receta)
+        receta = Receta(paciente, medico, medicamentos, self.__reloj__.ahora())
+        with self.__bloquear_registro__():
+            historia = self.__obtener_historia__(dni)
+            if self.__repositorio__ is not None:
+                self.__repositorio__.guardar_receta(receta)
+            historia.agregar_receta(receta, validar=False)
+            self.__indice_medicamentos__.agregar_receta(receta)
+        return receta
+
+    def emitir_recetas_lote(
+        self, solicitudes: Iterable[tuple[str, str, list[str]]]
+    ) -> list[Receta]:
+        """
+        Emite varias recetas, cada una dada como (dni, matrícula, medicamentos), con
+        la misma fecha de emisión. Se validan todas antes de emitir cualquiera: si
+        alguna es inválida se lanza la excepción correspondiente y no se emite
+        ninguna.
+        """
+        fecha = self.__reloj__.ahora()
+        recetas = []
+        for dni, matricula, medicamentos in solicitudes:
+            self.validar_existencia_paciente(dni)
+            self.validar_existencia_medico(matricula)
+            recetas.append(
+                Receta(
+                    self.__pacientes__[dni],
+                    self.__medicos__[matricula],
+                    medicamentos,
+                    fecha,
+                )
+            )
+        with self.__bloquear_registro__():
+            historias = [
+                self.__obtener_historia__(receta.obtener_paciente().obtener_dni())
+                for receta in recetas
+            ]
+            if self.__repositorio__ is not None:
+                self.__repositorio__.guardar_recetas(recetas)
+            for receta, historia in zip(recetas, historias):
+                historia.agregar_receta(receta, validar=False)
+                self.__indice_medicamentos__.agregar_receta(receta)
+        return recetas
 
     def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
         self.validar_existencia_paciente(dni)
-        return self.__historias_clinicas__[dni]
+        with self.__bloquear_registro__():
+            return self.__obtener_historia__(dni)
+
+    def obtener_resumen_general(self) -> dict:
+        """
+        Resumen de todas las historias clínicas, con los mismos datos que
+        HistoriaClinica.obtener_resumen (salvo el último turno) más la cantidad de
+        pacientes. Se mantiene con cada cambio; con un repositorio, la primera vez
+        se hidratan las historias que todavía no se cargaron.
+        """
+        with self.__bloquear_registro__():
+            self.__hidratar_historias__()
+            return {
+                "cantidad_pacientes": len(self.__pacientes__),
+                **self.__estadisticas__.obtener_resumen(),
+            }
+
+    def obtener_recetas_con_medicamento(
+        self, medicamento: str, desde: date | None = None, hasta: date | None = None
+    ) -> list[Receta]:
+        """
+        Recetas que incluyen el medicamento (sin distinguir mayúsculas), emitidas
+        en los días del intervalo [desde, hasta), usando el índice de medicamentos.
+        Con un repositorio, la primera consulta hidrata las historias que todavía
+        no se cargaron.
+        """
+        with self.__bloquear_registro__():
+            self.__hidratar_historias__()
+            return list(
+                self.__indice_medicamentos__.iterar_recetas(medicamento, desde, hasta)
+            )
+
+    def obtener_pacientes_con_medicamento(
+        self, medicamento: str, desde: date | None = None, hasta: date | None = None
+    ) -> list[Paciente]:
+        """
+        Pacientes a los que se les recetó el medicamento en el intervalo, sin
+        repetir y en el orden de su primera receta.
+        """
+        with self.__bloquear_registro__():
+            self.__hidratar_historias__()
+            recetas = self.__indice_medicamentos__.iterar_recetas(
+                medicamento, desde, hasta
+            )
+            return list(dict.fromkeys(r.obtener_paciente() for r in recetas))
+
+    def contar_recetas_por_medicamento(
+        self, desde: date | None = None, hasta: date | None = None
+    ) -> dict[str, int]:
+        with self.__bloquear_registro__():
+            self.__hidratar_historias__()
+            return self.__indice_medicamentos__.contar_por_medicamento(desde, hasta)
 
     def validar_existencia_paciente(self, dni: str):
         if dni not in self.__pacientes__:
@@ -101,24 +727,123 @@ class Clinica:
             raise MedicoNoEncontradoError(matricula)
 
     def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime):
-        for turno in self.__turnos__:
-            if (
-                turno.obtener_medico().obtener_matricula() == matricula
-                and turno.obtener_fecha_hora() == fecha_hora
-            ):
-                raise TurnoOcupadoError()
+        if (matricula, fecha_hora) in self.__indice_turnos__:
+            raise TurnoOcupadoError()
+
+    def __obtener_historia__(self, dni: str) -> HistoriaClinica:
+        """
+        Devuelve la historia clínica del paciente, hidratándola desde el repositorio
+        la primera vez que se accede a ella.
+        """
+        if dni not in self.__historias_clinicas__:
+            historia = HistoriaClinica(self.__pacientes__[dni], self.__estadisticas__)
+            if self.__repositorio__ is not None:
+                turnos, recetas = self.__repositorio__.cargar_historia(
+                    self.__pacientes__[dni], self.__medicos__, self.__indice_turnos__
+                )
+                for turno in turnos:
+                    historia.agregar_turno(turno, validar=False)
+                for receta in recetas:
+                    historia.agregar_receta(receta, validar=False)
+                    self.__indice_medicamentos__.agregar_receta(receta)
+            self.__historias_clinicas__[dni] = historia
+        return self.__historias_clinicas__[dni]
+
+    def __hidratar_historias__(self) -> None:
+        """
+        Carga las historias clínicas que todavía no se hidrataron, para que las
+        estadísticas generales y el índice de medicamentos incluyan todo el
+        historial. Solo recorre los pacientes la primera vez.
+        """
+        if not self.__historias_completas__:
+            for dni in self.__pacientes__:
+                self.__obtener_historia__(dni)
+            self.__historias_completas__ = True
+
+    def __registrar_turnos__(self, turnos: list[Turno]) -> None:
+        """
+        Incorpora turnos ya validados a la clínica, sus índices y la historia clínica
+        de cada paciente, persistiéndolos antes si hay un repositorio. En modo
+        concurrente el llamador debe tener el lock del médico de los turnos.
+        """
+        with self.__bloquear_registro__():
+            historias = [
+                self.__obtener_historia__(turno.obtener_paciente().obtener_dni())
+                for turno in turnos
+            ]
+            if self.__repositorio__ is not None:
+                self.__repositorio__.guardar_turnos(turnos)
+            for turno, historia in zip(turnos, historias):
+                self.__turnos__.append(turno)
+                self.__indexar_turno__(turno)
+                historia.agregar_turno(turno, validar=False)
+
+    def __asegurar_tipos_de_turno__(self, fecha_hora, especialidad) -> None:
+        """
+        Verifica los tipos que las validaciones previas a crear el Turno necesitan;
+        el resto de las reglas las aplica el Turno.
+        """
+        if not isinstance(fecha_hora, datetime):
+            raise TipoDeDatoInvalidoError("La fecha y hora debe ser valida")
+        if not isinstance(especialidad, str):
+            raise TipoDeDatoInvalidoError("La especialidad debe ser texto")
+
+    def __obtener_turnos_del_dia__(self, matricula: str, dia: date) -> list[Turno]:
+        if matricula not in self.__agendas__:
+            return []
+        return self.__agendas__[matricula].obtener_turnos_del_dia(dia)
+
+    def __bloquear_registro__(self) -> AbstractContextManager:
+        if self.__bloqueo_registro__ is None:
+            return _SIN_BLOQUEO
+        return self.__bloqueo_registro__
+
+    def __bloquear_medico__(self, matricula: str) -> AbstractContextManager:
+        if self.__bloqueo_registro__ is None:
+            return _SIN_BLOQUEO
+        bloqueo = self.__bloqueos_medicos__.get(matricula)
+        if bloqueo is None:
+            with self.__bloqueo_registro__:
+                bloqueo = self.__bloqueos_medicos__.setdefault(matricula, Lock())
+        return bloqueo
+
+    def __indexar_turno__(self, turno: Turno) -> None:
+        """
+        Registra el turno en el índice (matrícula, fecha y hora) usado para detectar
+        turnos duplicados en tiempo constante, en la agenda del médico, en los
+        índices secundarios y, si están habilitados, en el almacén columnar y en el
+        motor de disponibilidad.
+        """
+        matricula = turno.obtener_medico().obtener_matricula()
+        self.__indice_turnos__[(matricula, turno.obtener_fecha_hora())] = turno
+        if matricula not in self.__agendas__:
+            self.__agendas__[matricula] = Agenda()
+        self.__agendas__[matricula].agregar_turno(turno)
+        for indice in self.__indices__.values():
+            indice.agregar_turno(turno)
+        if self.__disponibilidad__ is not None:
+            self.__disponibilidad__.ocupar(turno)
+        if self.__almacen_columnar__ is not None:
+            self.__almacen_columnar__.agregar_turno(turno)
+
+    def __desindexar_turno__(self, turno: Turno) -> None:
+        """
+        Quita el turno de los índices que mantiene __indexar_turno__. Todo camino que
+        elimine o reprograme un turno debe llamarlo para mantenerlos sincronizados.
+        """
+        matricula = turno.obtener_medico().obtener_matricula()
+        self.__indice_turnos__.pop((matricula, turno.obtener_fecha_hora()), None)
+        if matricula in self.__agendas__:
+            self.__agendas__[matricula].quitar_turno(turno)
+        for indice in self.__indices__.values():
+            indice.quitar_turno(turno)
+        if self.__disponibilidad__ is not None:
+            self.__disponibilidad__.liberar(turno)
+        if self.__almacen_columnar__ is not None:
+            self.__almacen_columnar__.quitar_turno(turno)
 
     def obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
-        dias = [
-            "lunes",
-            "martes",
-            "miercoles",
-            "jueves",
-            "viernes",
-            "sabados",
-            "domingos",
-        ]
-        return dias[fecha_hora.weekday()]
+        return DIAS_SEMANA[fecha_hora.weekday()]
 
     def obtener_especialidad_disponible(self, medico: Medico, dia_semana: str) -> str:
         especialidad = medico.obtener_especialidad_para_dia(dia_semana)
@@ -127,8 +852,29 @@ class Clinica:
         return especialidad
 
     def validar_especialidad_en_dia(
-        self, medico: Medico, especialidad_solicitada: str, dia_semana: str
+        self, medico: Medico, especialidad_solicitada: str, dia_semana: int | str
     ):
-        especialidad = medico.obtener_especialidad_para_dia(dia_semana)
-        if especialidad is None or especialidad != especialidad_solicitada:
+        """
+        Verifica que el médico atienda la especialidad en el día indicado, ya sea
+        como número de datetime.weekday() o como nombre en español. Las
+        especialidades se comparan por su código en el registro compartido, sin
+        distinguir mayúsculas.
+        """
+        if isinstance(dia_semana, int):
+            numero_dia = dia_semana
+        else:
+            numero_dia = obtener_numero_dia(dia_semana)
+        if numero_dia is not None:
+            codigo = medico.obtener_codigo_especialidad_para_numero_dia(numero_dia)
+            dia_semana = DIAS_SEMANA[numero_dia]
+        else:
+            especialidad = medico.obtener_especialidad_para_dia(dia_semana)
+            codigo = (
+                None
+                if especialidad is None
+                else ESPECIALIDADES.obtener_codigo(especialidad)
+            )
+        if codigo is None or codigo != ESPECIALIDADES.obtener_codigo(
+            especialidad_solicitada
+        ):
             raise MedicoNoDisponibleError(medico.obtener_matricula(), dia_semana)
@@ -0,0 +1,211 @@
+import heapq
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta
+from .medico import Medico
+from .turno import Turno
+from ..errors.custom_exception import TipoDeDatoInvalidoError, ValidacionError
+
+
+class MotorDisponibilidad:
+    """
+    Calcula horarios libres dentro de un horario de atención dividido en franjas de
+    duración fija. Para cada médico y día guarda una máscara de bits con las franjas
+    libres (bit i = franja i), que se arma la primera vez que se consulta ese día a
+    partir de sus turnos y después se actualiza con cada turno nuevo, de modo que
+    las búsquedas no recorren los turnos ya agendados. Además recuerda, por médico,
+    los tramos de días ya completos para saltearlos.
+
+    Se considera que un turno ocupa una franja completa desde su fecha y hora, así
+    que un turno fuera de la grilla ocupa las dos franjas que toca.
+    """
+
+    def __init__(
+        self,
+        obtener_turnos_del_dia: Callable[[str, date], list[Turno]],
+        duracion: timedelta = timedelta(minutes=30),
+        apertura: time = time(8, 0),
+        cierre: time = time(18, 0),
+    ):
+        self.__asegurar_horario_es_valido__(duracion, apertura, cierre)
+        self.__obtener_turnos_del_dia__ = obtener_turnos_del_dia
+        self.__duracion__ = duracion
+        self.__apertura__ = apertura
+        self.__cantidad_franjas__ = (
+            datetime.combine(date.min, cierre) - datetime.combine(date.min, apertura)
+        ) // duracion
+        self.__todas_libres__ = (1 << self.__cantidad_franjas__) - 1
+        self.__libres__: dict[tuple[str, date], int] = {}
+        # Médicos que atienden cada especialidad (por código) en cada día de la semana.
+        self.__medicos_por_dia__: dict[tuple[int, int], dict[str, Medico]] = {}
+        self.__codigos_por_medico__: dict[str, list[int | None]] = {}
+        # Por médico y especialidad, un tramo [inicio, fin) de días sin franjas
+        # libres, para no recorrerlo de nuevo en cada búsqueda.
+        self.__completos__: dict[str, dict[int, tuple[date, date]]] = {}
+
+    def obtener_duracion(self) -> timedelta:
+        return self.__duracion__
+
+    def registrar_medico(self, medico: Medico) -> None:
+        """
+        Registra (o vuelve a registrar, si cambiaron sus especialidades) los días en
+        que el médico atiende cada especialidad.
+        """
+        matricula = medico.obtener_matricula()
+        anteriores = self.__codigos_por_medico__.get(matricula, [None] * 7)
+        codigos = [
+            medico.obtener_codigo_especialidad_para_numero_dia(numero_dia)
+            for numero_dia in range(7)
+        ]
+        for numero_dia, (anterior, codigo) in enumerate(zip(anteriores, codigos)):
+            if anterior is not None:
+                self.__medicos_por_dia__[(anterior, numero_dia)].pop(matricula, None)
+            if codigo is not None:
+                self.__medicos_por_dia__.setdefault((codigo, numero_dia), {})[
+                    matricula
+                ] = medico
+        self.__codigos_por_medico__[matricula] = codigos
+        self.__completos__.pop(matricula, None)
+
+    def ocupar(self, turno: Turno) -> None:
+        clave = self.__clave__(turno)
+        if clave in self.__libres__:
+            for franja in self.__franjas_de__(turno.obtener_fecha_hora()):
+                self.__libres__[clave] &= ~(1 << franja)
+
+    def liberar(self, turno: Turno) -> None:
+        # Otro turno puede compartir la franja: el día se vuelve a armar al consultarlo.
+        matricula, dia = self.__clave__(turno)
+        self.__libres__.pop((matricula, dia), None)
+        completos = self.__completos__.get(matricula, {})
+        for codigo, (inicio, fin) in completos.items():
+            if inicio <= dia < fin:
+                completos[codigo] = (inicio, dia)
+
+    def buscar_horarios_libres(
+        self,
+        codigo_especialidad: int,
+        desde: datetime,
+        cantidad: int,
+        dias_maximos: int = 366,
+    ) -> list[tuple[datetime, Medico]]:
+        """
+        Devuelve los próximos `cantidad` horarios libres a partir de `desde` con
+        cualquier médico que atienda la especialidad ese día, ordenados por fecha y
+        hora (y por matrícula dentro del mismo horario). Busca a lo sumo
+        `dias_maximos` días hacia adelante, sin pasar de date.max.
+        """
+        medicos: dict[str, Medico] = {}
+        for numero_dia in range(7):
+            medicos.update(
+                self.__medicos_por_dia__.get((codigo_especialidad, numero_dia), {})
+            )
+        dias = min(dias_maximos, (date.max - desde.date()).days + 1)
+        ultimo = desde.date() + timedelta(days=dias - 1)
+        # Cada médico entra al montículo con su próximo día con franjas libres.
+        proximos = []
+        for matricula, medico in medicos.items():
+            dia = self.__proximo_dia_libre__(
+                matricula, codigo_especialidad, desde.date(), ultimo
+            )
+            if dia is not None:
+                proximos.append((dia, matricula, medico))
+        heapq.heapify(proximos)
+        resultado: list[tuple[datetime, Medico]] = []
+        while proximos and len(resultado) < cantidad:
+            dia = proximos[0][0]
+            inicio = datetime.combine(dia, self.__apertura__)
+            primera = max(0, -((inicio - desde) // self.__duracion__))
+            faltan = cantidad - len(resultado)
+            franjas = []
+            siguientes = []
+            while proximos and proximos[0][0] == dia:
+                _, matricula, medico = heapq.heappop(proximos)
+                libres = self.__obtener_libres__(matricula, dia) >> primera
+                franja = primera
+                # De cada médico alcanza con sus primeras `faltan` franjas libres.
+                for _ in range(faltan):
+                    if not libres:
+                        break
+                    salto = (libres & -libres).bit_length() - 1
+                    franja += salto
+                    franjas.append((franja, matricula, medico))
+                    libres >>= salto + 1
+                    franja += 1
+                if dia == ultimo:
+                    continue
+                siguiente = self.__proximo_dia_libre__(
+                    matricula, codigo_especialidad, dia + timedelta(days=1), ultimo
+                )
+                if siguiente is not None:
+                    siguientes.append((siguiente, matricula, medico))
+            franjas.sort(key=lambda f: (f[0], f[1]))
+            for franja, _, medico in franjas[:faltan]:
+                resultado.append((inicio + franja * self.__duracion__, medico))
+            for siguiente in siguientes:
+                heapq.heappush(proximos, siguiente)
+        return resultado
+
+    def __proximo_dia_libre__(
+        self, matricula: str, codigo_especialidad: int, dia: date, ultimo: date
+    ) -> date | None:
+        """
+        Primer día desde `dia` (hasta `ultimo`) en que el médico atiende la
+        especialidad y le queda alguna franja libre. Recuerda el tramo de días
+        completos recorrido para saltearlo en las próximas búsquedas.
+        """
+        codigos = self.__codigos_por_medico__[matricula]
+        completos = self.__completos__.setdefault(matricula, {})
+        inicio, fin = completos.get(codigo_especialidad, (None, None))
+        if inicio is not None and inicio <= dia <= fin:
+            dia = fin
+        else:
+            inicio = dia
+        while dia <= ultimo:
+            if codigos[dia.weekday()] == codigo_especialidad and (
+                self.__obtener_libres__(matricula, dia)
+            ):
+                if inicio < dia:
+                    completos[codigo_especialidad] = (inicio, dia)
+                return dia
+            if dia == date.max:
+                break
+            dia += timedelta(days=1)
+        completos[codigo_especialidad] = (inicio, dia)
+        return None
+
+    def __obtener_libres__(self, matricula: str, dia: date) -> int:
+        clave = (matricula, dia)
+        if clave not in self.__libres__:
+            libres = self.__todas_libres__
+            for turno in self.__obtener_turnos_del_dia__(matricula, dia):
+                for franja in self.__franjas_de__(turno.obtener_fecha_hora()):
+                    libres &= ~(1 << franja)
+            self.__libres__[clave] = libres
+        return self.__libres__[clave]
+
+    def __franjas_de__(self, fecha_hora: datetime) -> list[int]:
+        """
+        Franjas del día que se superponen con un turno que empieza en fecha_hora.
+        """
+        inicio = datetime.combine(fecha_hora.date(), self.__apertura__)
+        franja, resto = divmod(fecha_hora - inicio, self.__duracion__)
+        franjas = [franja] if not resto else [franja, franja + 1]
+        return [f for f in franjas if 0 <= f < self.__cantidad_franjas__]
+
+    def __clave__(self, turno: Turno) -> tuple[str, date]:
+        return (
+            turno.obtener_medico().obtener_matricula(),
+            turno.obtener_fecha_hora().date(),
+        )
+
+    def __asegurar_horario_es_valido__(
+        self, duracion: timedelta, apertura: time, cierre: time
+    ) -> None:
+        if not isinstance(duracion, timedelta):
+            raise TipoDeDatoInvalidoError("La duración debe ser un timedelta")
+        if not isinstance(apertura, time) or not isinstance(cierre, time):
+            raise TipoDeDatoInvalidoError("La apertura y el cierre deben ser horas")
+        if duracion <= timedelta(0):
+            raise ValidacionError("La duración de las franjas debe ser positiva")
+        if cierre <= apertura:
+            raise ValidacionError("El cierre debe ser posterior a la apertura")
@@ -1,4 +1,6 @@
 from ..errors.custom_exception import TipoDeDatoInvalidoError, ValidacionError
+from ..utils.fechas import obtener_numero_dia
+from ..utils.vocabulario import ESPECIALIDADES
 
 
 class Especialidad:
@@ -6,19 +8,50 @@ class Especialidad:
     Representa una especialidad médica junto con los días de atención asociados.
     """
 
+    __slots__ = ("__tipo__", "__codigo__", "__dias__", "__mascara_dias__")
+
     def __init__(self, tipo: str, dias: list[str]):
         self.__asegurar_tipo_es_valido__(tipo)
         self.__asegurar_dias_es_valido__(dias)
         self.__tipo__ = tipo
+        self.__codigo__ = ESPECIALIDADES.registrar(tipo)
         self.__dias__ = []
+        self.__mascara_dias__ = 0
         for d in dias:
-            self.__dias__.append(d.lower())
+            numero = obtener_numero_dia(d)
+            if numero is None:
+                self.__dias__.append(d.lower())
+            else:
+                # Los días conocidos comparten el nombre canónico.
+                self.__dias__.append(numero.obtener_nombre())
+                self.__mascara_dias__ |= 1 << numero
 
     def obtener_especialidad(self) -> str:
         return self.__tipo__
 
+    def obtener_codigo(self) -> int:
+        """
+        Devuelve el código de la especialidad en el registro compartido.
+        """
+        return self.__codigo__
+
+    def obtener_dias(self) -> list[str]:
+        return list(self.__dias__)
+
+    def obtener_mascara_dias(self) -> int:
+        """
+        Devuelve los días de atención como máscara de bits (bit 0 = lunes).
+        """
+        return self.__mascara_dias__
+
     def verificar_dia(self, dia: str) -> bool:
-        return dia.lower() in self.__dias__
+        numero = obtener_numero_dia(dia)
+        if numero is not None:
+            return self.verificar_numero_dia(numero)
+        return dia.strip().lower() in self.__dias__
+
+    def verificar_numero_dia(self, numero_dia: int) -> bool:
+        return bool(self.__mascara_dias__ >> numero_dia & 1)
 
     def __str__(self) -> str:
         dias_str = ", ".join(self.__dias__)
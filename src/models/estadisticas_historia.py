@@ -0,0 +1,125 @@
+from collections.abc import Hashable
+from .turno import Turno
+from .receta import Receta
+from ..utils.vocabulario import ESPECIALIDADES, MEDICAMENTOS
+
+
+class Frecuencias:
+    """
+    Cuenta apariciones por clave y mantiene la más frecuente (a igual cantidad, la
+    menor clave) sin recorrer las cuentas en cada consulta. Solo al restar una
+    aparición de la más frecuente se vuelve a buscar entre las claves.
+    """
+
+    __slots__ = ("__cantidades__", "__maximo__")
+
+    def __init__(self):
+        self.__cantidades__: dict[Hashable, int] = {}
+        self.__maximo__: Hashable | None = None
+
+    def sumar(self, clave: Hashable, cantidad: int = 1) -> None:
+        total = self.__cantidades__.get(clave, 0) + cantidad
+        self.__cantidades__[clave] = total
+        maximo = self.__maximo__
+        if maximo is None:
+            self.__maximo__ = clave
+            return
+        total_maximo = self.__cantidades__[maximo]
+        if total > total_maximo or (total == total_maximo and clave < maximo):
+            self.__maximo__ = clave
+
+    def restar(self, clave: Hashable) -> None:
+        total = self.__cantidades__.get(clave)
+        if total is None:
+            return
+        if total == 1:
+            del self.__cantidades__[clave]
+        else:
+            self.__cantidades__[clave] = total - 1
+        if clave == self.__maximo__:
+            self.__maximo__ = min(
+                self.__cantidades__,
+                key=lambda c: (-self.__cantidades__[c], c),
+                default=None,
+            )
+
+    def obtener_maximo(self) -> Hashable | None:
+        return self.__maximo__
+
+    def obtener_cantidad(self, clave: Hashable) -> int:
+        return self.__cantidades__.get(clave, 0)
+
+    def obtener_cantidades(self) -> dict[Hashable, int]:
+        return dict(self.__cantidades__)
+
+
+class EstadisticasHistoria:
+    """
+    Totales de una o varias historias clínicas (turnos, recetas, especialidad más
+    atendida y medicamento más recetado), actualizados con cada turno y receta que
+    se agrega o quita para consultarlos sin recorrer las historias.
+    """
+
+    __slots__ = (
+        "__cantidad_turnos__",
+        "__cantidad_recetas__",
+        "__especialidades__",
+        "__medicamentos__",
+    )
+
+    def __init__(self):
+        self.__cantidad_turnos__ = 0
+        self.__cantidad_recetas__ = 0
+        # Por código del registro compartido de especialidades.
+        self.__especialidades__ = Frecuencias()
+        # Por código del catálogo de medicamentos (sin distinguir mayúsculas, como
+        # el índice de medicamentos); cada uno cuenta una vez por receta.
+        self.__medicamentos__ = Frecuencias()
+
+    def registrar_turno(self, turno: Turno) -> None:
+        self.__cantidad_turnos__ += 1
+        self.__especialidades__.sumar(turno.obtener_codigo_especialidad())
+
+    def quitar_turno(self, turno: Turno) -> None:
+        self.__cantidad_turnos__ -= 1
+        self.__especialidades__.restar(turno.obtener_codigo_especialidad())
+
+    def registrar_receta(self, receta: Receta) -> None:
+        self.__cantidad_recetas__ += 1
+        for codigo in {
+            MEDICAMENTOS.registrar(m) for m in receta.obtener_medicamentos()
+        }:
+            self.__medicamentos__.sumar(codigo)
+
+    def sumar(self, otras: "EstadisticasHistoria") -> None:
+        """
+        Acumula los totales de otras estadísticas en estas.
+        """
+        self.__cantidad_turnos__ += otras.__cantidad_turnos__
+        self.__cantidad_recetas__ += otras.__cantidad_recetas__
+        for codigo, cantidad in otras.__especialidades__.obtener_cantidades().items():
+            self.__especialidades__.sumar(codigo, cantidad)
+        for codigo, cantidad in otras.__medicamentos__.obtener_cantidades().items():
+            self.__medicamentos__.sumar(codigo, cantidad)
+
+    def obtener_cantidad_turnos(self) -> int:
+        return self.__cantidad_turnos__
+
+    def obtener_cantidad_recetas(self) -> int:
+        return self.__cantidad_recetas__
+
+    def obtener_especialidad_mas_frecuente(self) -> str | None:
+        codigo = self.__especialidades__.obtener_maximo()
+        return None if codigo is None else ESPECIALIDADES.obtener_nombre(codigo)
+
+    def obtener_medicamento_mas_recetado(self) -> str | None:
+        codigo = self.__medicamentos__.obtener_maximo()
+        return None if codigo is None else MEDICAMENTOS.obtener_nombre(codigo)
+
+    def obtener_resumen(self) -> dict:
+        return {
+            "cantidad_turnos": self.__cantidad_turnos__,
+            "especialidad_mas_frecuente": self.obtener_especialidad_mas_frecuente(),
+            "cantidad_recetas": self.__cantidad_recetas__,
+            "medicamento_mas_recetado": self.obtener_medicamento_mas_recetado(),
+        }
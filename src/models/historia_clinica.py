@@ -1,35 +1,219 @@
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime
+from itertools import islice
 from .paciente import Paciente
 from .turno import Turno
 from .receta import Receta
+from .estadisticas_historia import EstadisticasHistoria
+from ..utils.vistas import VistaSecuencia
 from ..errors.custom_exception import TipoDeDatoInvalidoError, ValidacionError
 
 
 class HistoriaClinica:
     """
     Clase que almacena la información médica de un paciente: turnos y recetas.
+    Ambos se mantienen ordenados por fecha para poder recorrerlos por rango. Sus
+    estadísticas se actualizan con cada cambio y, si se indican, también las
+    estadísticas generales de la clínica. Los turnos pasados pueden archivarse
+    fuera de la memoria: se vuelven a cargar la primera vez que se los consulta.
     """
 
-    def __init__(self, paciente: Paciente):
+    __slots__ = (
+        "__paciente__",
+        "__turnos__",
+        "__recetas__",
+        "__estadisticas__",
+        "__estadisticas_generales__",
+        "__meses_archivados__",
+        "__cargar_archivados__",
+        "__ultimo_archivado__",
+    )
+
+    def __init__(
+        self,
+        paciente: Paciente,
+        estadisticas_generales: EstadisticasHistoria | None = None,
+    ):
         self.__asegurar_paciente_es_valido__(paciente)
         self.__paciente__ = paciente
         self.__turnos__: list[Turno] = []
         self.__recetas__: list[Receta] = []
+        self.__estadisticas__ = EstadisticasHistoria()
+        self.__estadisticas_generales__ = estadisticas_generales
+        # Meses (año, mes) con turnos archivados todavía sin cargar, la función que
+        # los carga y la fecha y hora del último turno archivado.
+        self.__meses_archivados__: set[tuple[int, int]] = set()
+        self.__cargar_archivados__: (
+            Callable[[Iterable[tuple[int, int]]], list[Turno]] | None
+        ) = None
+        self.__ultimo_archivado__: datetime | None = None
+
+    def agregar_turno(self, turno: Turno, validar: bool = True) -> None:
+        """
+        Con validar=False se omite la verificación del tipo, para turnos creados por
+        la clínica o leídos del almacenamiento propio.
+        """
+        if validar:
+            self.__asegurar_turno_es_valido__(turno)
+        insort(self.__turnos__, turno, key=Turno.obtener_fecha_hora)
+        self.__estadisticas__.registrar_turno(turno)
+        if self.__estadisticas_generales__ is not None:
+            self.__estadisticas_generales__.registrar_turno(turno)
+
+    def quitar_turno(self, turno: Turno) -> None:
+        """
+        Quita el turno (por ejemplo, al cancelarlo). Si no está en la historia no
+        hace nada.
+        """
+        posicion = bisect_left(
+            self.__turnos__, turno.obtener_fecha_hora(), key=Turno.obtener_fecha_hora
+        )
+        while (
+            posicion < len(self.__turnos__)
+            and self.__turnos__[posicion].obtener_fecha_hora()
+            == turno.obtener_fecha_hora()
+        ):
+            if self.__turnos__[posicion] is turno:
+                del self.__turnos__[posicion]
+                self.__estadisticas__.quitar_turno(turno)
+                if self.__estadisticas_generales__ is not None:
+                    self.__estadisticas_generales__.quitar_turno(turno)
+                return
+            posicion += 1
+
+    def obtener_turnos_archivables(self, hasta: datetime) -> list[Turno]:
+        """
+        Turnos en memoria anteriores a `hasta`, sin cargar los ya archivados.
+        """
+        fin = bisect_left(self.__turnos__, hasta, key=Turno.obtener_fecha_hora)
+        return self.__turnos__[:fin]
 
-    def agregar_turno(self, turno: Turno) -> None:
-        self.__asegurar_turno_es_valido__(turno)
-        self.__turnos__.append(turno)
+    def archivar_turnos(
+        self,
+        hasta: datetime,
+        cargar: Callable[[Iterable[tuple[int, int]]], list[Turno]],
+    ) -> list[Turno]:
+        """
+        Quita de la memoria los turnos anteriores a `hasta`, que ya deben estar
+        guardados en el archivo, y devuelve los quitados. Las estadísticas no
+        cambian. `cargar` recibe los meses archivados y devuelve sus turnos del
+        paciente; se llama cuando una consulta necesita los turnos completos.
+        """
+        fin = bisect_left(self.__turnos__, hasta, key=Turno.obtener_fecha_hora)
+        archivados = self.__turnos__[:fin]
+        if archivados:
+            del self.__turnos__[:fin]
+            self.__meses_archivados__.update(
+                (t.obtener_fecha_hora().year, t.obtener_fecha_hora().month)
+                for t in archivados
+            )
+            ultimo = archivados[-1].obtener_fecha_hora()
+            if self.__ultimo_archivado__ is None or ultimo > self.__ultimo_archivado__:
+                self.__ultimo_archivado__ = ultimo
+            self.__cargar_archivados__ = cargar
+        return archivados
 
-    def agregar_receta(self, receta: Receta) -> None:
-        self.__asegurar_receta_es_valida__(receta)
-        self.__recetas__.append(receta)
+    def agregar_receta(self, receta: Receta, validar: bool = True) -> None:
+        if validar:
+            self.__asegurar_receta_es_valida__(receta)
+        insort(self.__recetas__, receta, key=Receta.obtener_fecha)
+        self.__estadisticas__.registrar_receta(receta)
+        if self.__estadisticas_generales__ is not None:
+            self.__estadisticas_generales__.registrar_receta(receta)
+
+    def vincular_estadisticas(self, estadisticas_generales: EstadisticasHistoria):
+        """
+        Suma las estadísticas de la historia a las generales y las mantiene
+        actualizadas desde ahora (para historias creadas fuera de la clínica).
+        """
+        estadisticas_generales.sumar(self.__estadisticas__)
+        self.__estadisticas_generales__ = estadisticas_generales
+
+    def obtener_paciente(self) -> Paciente:
+        return self.__paciente__
+
+    def obtener_estadisticas(self) -> EstadisticasHistoria:
+        return self.__estadisticas__
+
+    def obtener_resumen(self) -> dict:
+        """
+        Cantidad de turnos y recetas, fecha del último turno, especialidad más
+        atendida y medicamento más recetado, sin recorrer la historia.
+        """
+        return {
+            **self.__estadisticas__.obtener_resumen(),
+            "ultimo_turno": (
+                self.__turnos__[-1].obtener_fecha_hora()
+                if self.__turnos__
+                else self.__ultimo_archivado__
+            ),
+        }
 
     def obtener_turnos(self) -> list:
+        self.__cargar_turnos_archivados__()
         return list(self.__turnos__)
 
     def obtener_recetas(self) -> list:
         return list(self.__recetas__)
 
+    def ver_turnos(self) -> Sequence[Turno]:
+        self.__cargar_turnos_archivados__()
+        return VistaSecuencia(self.__turnos__)
+
+    def ver_recetas(self) -> Sequence[Receta]:
+        return VistaSecuencia(self.__recetas__)
+
+    def iterar_lineas(
+        self,
+        desde: datetime | None = None,
+        hasta: datetime | None = None,
+        mas_recientes_primero: bool = False,
+    ) -> Iterator[str]:
+        """
+        Genera la historia clínica línea por línea, con un resumen por turno y por
+        receta, opcionalmente filtrando por fecha en el intervalo [desde, hasta).
+        No arma la historia completa en memoria.
+        """
+        yield f"Historia Clínica de {self.__paciente__}"
+        yield "--- Turnos ---"
+        if self.__ultimo_archivado__ is not None and (
+            desde is None or desde <= self.__ultimo_archivado__
+        ):
+            self.__cargar_turnos_archivados__()
+        turnos = self.__recorrer__(
+            self.__turnos__,
+            Turno.obtener_fecha_hora,
+            desde,
+            hasta,
+            mas_recientes_primero,
+        )
+        yield from self.__resumir__(turnos, "Sin turnos")
+        yield "--- Recetas ---"
+        recetas = self.__recorrer__(
+            self.__recetas__, Receta.obtener_fecha, desde, hasta, mas_recientes_primero
+        )
+        yield from self.__resumir__(recetas, "Sin recetas")
+
+    def obtener_pagina(
+        self,
+        numero_pagina: int,
+        tamano_pagina: int = 20,
+        desde: datetime | None = None,
+        hasta: datetime | None = None,
+        mas_recientes_primero: bool = False,
+    ) -> list[str]:
+        """
+        Devuelve las líneas de la página indicada (numeradas desde 1) de iterar_lineas.
+        """
+        if numero_pagina < 1 or tamano_pagina < 1:
+            raise ValidacionError("La página y su tamaño deben ser mayores a cero")
+        inicio = (numero_pagina - 1) * tamano_pagina
+        lineas = self.iterar_lineas(desde, hasta, mas_recientes_primero)
+        return list(islice(lineas, inicio, inicio + tamano_pagina))
+
     def __str__(self) -> str:
+        self.__cargar_turnos_archivados__()
         turnos_str = (
             "\n".join(str(t) for t in self.__turnos__)
             if self.__turnos__
@@ -46,6 +230,45 @@ class HistoriaClinica:
             f"--- Recetas ---\n{recetas_str}"
         )
 
+    def __cargar_turnos_archivados__(self) -> None:
+        """
+        Vuelve a incorporar, en orden, los turnos de los meses archivados que
+        todavía no se cargaron.
+        """
+        if not self.__meses_archivados__:
+            return
+        presentes = {
+            (t.obtener_medico().obtener_matricula(), t.obtener_fecha_hora())
+            for t in self.__turnos__
+        }
+        self.__turnos__.extend(
+            turno
+            for turno in self.__cargar_archivados__(self.__meses_archivados__)
+            if (turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora())
+            not in presentes
+        )
+        self.__turnos__.sort(key=Turno.obtener_fecha_hora)
+        self.__meses_archivados__ = set()
+
+    def __recorrer__(self, elementos, clave, desde, hasta, mas_recientes_primero):
+        inicio = 0 if desde is None else bisect_left(elementos, desde, key=clave)
+        fin = (
+            len(elementos)
+            if hasta is None
+            else bisect_left(elementos, hasta, key=clave)
+        )
+        if mas_recientes_primero:
+            return (elementos[i] for i in range(fin - 1, inicio - 1, -1))
+        return (elementos[i] for i in range(inicio, fin))
+
+    def __resumir__(self, elementos, sin_elementos: str) -> Iterator[str]:
+        vacio = True
+        for elemento in elementos:
+            vacio = False
+            yield elemento.obtener_resumen()
+        if vacio:
+            yield sin_elementos
+
     def __asegurar_paciente_es_valido__(self, paciente):
         if not isinstance(paciente, Paciente):
             raise TipoDeDatoInvalidoError("El paciente es invalido")
@@ -0,0 +1,88 @@
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+from datetime import date
+from .receta import Receta
+from ..utils.vocabulario import MEDICAMENTOS
+
+
+class IndiceMedicamentos:
+    """
+    Índice invertido de recetas por medicamento, por su código en el catálogo
+    compartido (sin distinguir mayúsculas). Las recetas de cada medicamento se
+    agrupan por día de emisión, con los días ordenados, así que una consulta por
+    rango de fechas solo recorre los días del rango y las recetas que devuelve.
+    """
+
+    __slots__ = ("__dias__", "__recetas__")
+
+    def __init__(self):
+        # Por código: días con recetas (como date.toordinal(), ordenados) y las
+        # recetas de cada uno de esos días.
+        self.__dias__: dict[int, list[int]] = {}
+        self.__recetas__: dict[int, dict[int, list[Receta]]] = {}
+
+    def agregar_receta(self, receta: Receta) -> None:
+        dia = receta.obtener_fecha().toordinal()
+        for codigo in {
+            MEDICAMENTOS.registrar(m) for m in receta.obtener_medicamentos()
+        }:
+            por_dia = self.__recetas__.setdefault(codigo, {})
+            recetas = por_dia.get(dia)
+            if recetas is None:
+                por_dia[dia] = recetas = []
+                insort(self.__dias__.setdefault(codigo, []), dia)
+            recetas.append(receta)
+
+    def obtener_medicamentos(self) -> list[str]:
+        return [MEDICAMENTOS.obtener_nombre(codigo) for codigo in self.__recetas__]
+
+    def iterar_recetas(
+        self, medicamento: str, desde: date | None = None, hasta: date | None = None
+    ) -> Iterator[Receta]:
+        """
+        Recorre las recetas del medicamento emitidas en los días del intervalo
+        [desde, hasta), en orden de día.
+        """
+        codigo = MEDICAMENTOS.obtener_codigo(medicamento)
+        if codigo not in self.__recetas__:
+            return iter(())
+        por_dia = self.__recetas__[codigo]
+        return (
+            receta
+            for dia in self.__dias_en_rango__(codigo, desde, hasta)
+            for receta in por_dia[dia]
+        )
+
+    def contar_recetas(
+        self, medicamento: str, desde: date | None = None, hasta: date | None = None
+    ) -> int:
+        codigo = MEDICAMENTOS.obtener_codigo(medicamento)
+        if codigo not in self.__recetas__:
+            return 0
+        return self.__contar__(codigo, desde, hasta)
+
+    def contar_por_medicamento(
+        self, desde: date | None = None, hasta: date | None = None
+    ) -> dict[str, int]:
+        """
+        Cantidad de recetas de cada medicamento en el intervalo [desde, hasta),
+        omitiendo los que no tienen ninguna.
+        """
+        cantidades = {}
+        for codigo in self.__recetas__:
+            cantidad = self.__contar__(codigo, desde, hasta)
+            if cantidad:
+                cantidades[MEDICAMENTOS.obtener_nombre(codigo)] = cantidad
+        return cantidades
+
+    def __contar__(self, codigo: int, desde, hasta) -> int:
+        por_dia = self.__recetas__[codigo]
+        return sum(
+            len(por_dia[dia]) for dia in self.__dias_en_rango__(codigo, desde, hasta)
+        )
+
+    def __dias_en_rango__(self, codigo: int, desde, hasta) -> list[int]:
+        dias = self.__dias__[codigo]
+        inicio = 0 if desde is None else bisect_left(dias, desde.toordinal())
+        fin = len(dias) if hasta is None else bisect_left(dias, hasta.toordinal())
+        return dias[inicio:fin]
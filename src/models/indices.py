@@ -0,0 +1,85 @@
+from collections.abc import Callable, Hashable
+from datetime import date, datetime
+from .turno import Turno
+
+
+class IndiceTurnos:
+    """
+    Índice secundario que agrupa los turnos según la clave que la función `clave`
+    calcula para cada uno. La clínica lo actualiza con cada alta y cada baja de un
+    turno, así que para sumar un criterio nuevo alcanza con crear un índice con otra
+    función de clave y registrarlo con `Clinica.registrar_indice`.
+    """
+
+    __slots__ = ("__nombre__", "__clave__", "__grupos__")
+
+    def __init__(self, nombre: str, clave: Callable[[Turno], Hashable]):
+        self.__nombre__ = nombre
+        self.__clave__ = clave
+        # Cada grupo indexa sus turnos por (matrícula, fecha y hora) para quitarlos
+        # en tiempo constante.
+        self.__grupos__: dict[Hashable, dict[tuple[str, datetime], Turno]] = {}
+
+    def obtener_nombre(self) -> str:
+        return self.__nombre__
+
+    def agregar_turno(self, turno: Turno) -> None:
+        grupo = self.__grupos__.setdefault(self.__clave__(turno), {})
+        grupo[_identificar(turno)] = turno
+
+    def quitar_turno(self, turno: Turno) -> None:
+        clave = self.__clave__(turno)
+        grupo = self.__grupos__.get(clave)
+        if grupo is None:
+            return
+        grupo.pop(_identificar(turno), None)
+        if not grupo:
+            del self.__grupos__[clave]
+
+    def obtener_turnos(self, clave: Hashable) -> list[Turno]:
+        """
+        Devuelve los turnos con la clave indicada, ordenados por fecha y hora.
+        """
+        grupo = self.__grupos__.get(clave)
+        if grupo is None:
+            return []
+        return sorted(grupo.values(), key=Turno.obtener_fecha_hora)
+
+    def contar(self, clave: Hashable) -> int:
+        return len(self.__grupos__.get(clave, ()))
+
+    def obtener_claves(self) -> list[Hashable]:
+        return list(self.__grupos__)
+
+
+def clave_paciente(turno: Turno) -> str:
+    return turno.obtener_paciente().obtener_dni()
+
+
+def clave_medico(turno: Turno) -> str:
+    return turno.obtener_medico().obtener_matricula()
+
+
+def clave_especialidad(turno: Turno) -> int:
+    return turno.obtener_codigo_especialidad()
+
+
+def clave_fecha(turno: Turno) -> date:
+    return turno.obtener_fecha_hora().date()
+
+
+def crear_indices_predeterminados() -> list[IndiceTurnos]:
+    """
+    Índices que mantiene toda clínica: por paciente (DNI), por médico (matrícula),
+    por especialidad (código del registro compartido) y por fecha.
+    """
+    return [
+        IndiceTurnos("paciente", clave_paciente),
+        IndiceTurnos("medico", clave_medico),
+        IndiceTurnos("especialidad", clave_especialidad),
+        IndiceTurnos("fecha", clave_fecha),
+    ]
+
+
+def _identificar(turno: Turno) -> tuple[str, datetime]:
+    return (turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora())
@@ -1,5 +1,6 @@
 from .especialidad import Especialidad
 from ..errors.custom_exception import TipoDeDatoInvalidoError, ValidacionError
+from ..utils.fechas import obtener_numero_dia
 
 
 class Medico:
@@ -7,32 +8,93 @@ class Medico:
     Representa a un médico del sistema, con sus especialidades y matrícula profesional.
     """
 
+    __slots__ = (
+        "__nombre__",
+        "__matricula__",
+        "__especialidades__",
+        "__especialidad_por_dia__",
+        "__texto__",
+    )
+
     def __init__(self, nombre: str, matricula: str):
         self.__asegurar_nombre_es_valido__(nombre)
         self.__asegurar_matricula_es_valida__(matricula)
         self.__nombre__ = nombre
         self.__matricula__ = matricula
         self.__especialidades__: list[Especialidad] = []
+        # Especialidad atendida en cada día de la semana (0 = lunes).
+        self.__especialidad_por_dia__: list[Especialidad | None] = [None] * 7
+        # Texto de __str__; se descarta cuando cambian las especialidades.
+        self.__texto__: str | None = None
+
+    @classmethod
+    def desde_datos_confiables(cls, nombre: str, matricula: str) -> "Medico":
+        """
+        Crea el médico sin validar nombre ni matrícula, para los datos que vienen del
+        almacenamiento propio o ya fueron validados.
+        """
+        medico = cls.__new__(cls)
+        medico.__nombre__ = nombre
+        medico.__matricula__ = matricula
+        medico.__especialidades__ = []
+        medico.__especialidad_por_dia__ = [None] * 7
+        medico.__texto__ = None
+        return medico
 
     def agregar_especialidad(self, especialidad: Especialidad):
         if not isinstance(especialidad, Especialidad):
             raise TipoDeDatoInvalidoError("Debe agregar una instancia de Especialidad")
         self.__especialidades__.append(especialidad)
+        self.__texto__ = None
+        mascara = especialidad.obtener_mascara_dias()
+        for numero_dia in range(7):
+            if not mascara >> numero_dia & 1:
+                continue
+            if self.__especialidad_por_dia__[numero_dia] is None:
+                self.__especialidad_por_dia__[numero_dia] = especialidad
 
     def obtener_matricula(self) -> str:
         return self.__matricula__
 
+    def obtener_nombre(self) -> str:
+        return self.__nombre__
+
+    def obtener_especialidades(self) -> list[Especialidad]:
+        return list(self.__especialidades__)
+
     def obtener_especialidad_para_dia(self, dia: str) -> str | None:
+        numero_dia = obtener_numero_dia(dia)
+        if numero_dia is not None:
+            return self.obtener_especialidad_para_numero_dia(numero_dia)
         for esp in self.__especialidades__:
             if esp.verificar_dia(dia):
                 return esp.obtener_especialidad()
         return None
 
+    def obtener_especialidad_para_numero_dia(self, numero_dia: int) -> str | None:
+        """
+        Devuelve la especialidad atendida en el día indicado como datetime.weekday().
+        """
+        especialidad = self.__especialidad_por_dia__[numero_dia]
+        return None if especialidad is None else especialidad.obtener_especialidad()
+
+    def obtener_codigo_especialidad_para_numero_dia(
+        self, numero_dia: int
+    ) -> int | None:
+        """
+        Igual que `obtener_especialidad_para_numero_dia`, pero devuelve el código del
+        registro compartido de especialidades.
+        """
+        especialidad = self.__especialidad_por_dia__[numero_dia]
+        return None if especialidad is None else especialidad.obtener_codigo()
+
     def __str__(self) -> str:
-        especialidades_str = ", ".join(
-            [esp.obtener_especialidad() for esp in self.__especialidades__]
-        )
-        return f"Médico: {self.__nombre__} - Matrícula: {self.__matricula__} - Especialidades: {especialidades_str}"
+        if self.__texto__ is None:
+            especialidades_str = ", ".join(
+                [esp.obtener_especialidad() for esp in self.__especialidades__]
+            )
+            self.__texto__ = f"Médico: {self.__nombre__} - Matrícula: {self.__matricula__} - Especialidades: {especialidades_str}"
+        return self.__texto__
 
     def __asegurar_nombre_es_valido__(self, nombre: str) -> None:
         if not isinstance(nombre, str):
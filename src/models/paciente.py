@@ -8,23 +8,60 @@ class Paciente:
     Creacion de la clase paciente
     """
 
-    def __init__(self, nombre: str, dni: str, fecha_nacimiento: datetime):
+    __slots__ = ("__nombre__", "__dni__", "__fecha_nacimiento__", "__texto__")
+
+    def __init__(
+        self,
+        nombre: str,
+        dni: str,
+        fecha_nacimiento: datetime,
+        ahora: datetime | None = None,
+    ):
+        """
+        `ahora` es la fecha contra la que se valida la de nacimiento; si no se
+        indica se lee el reloj del sistema.
+        """
         self.__asegurar_nombre_es_valido__(nombre)
         self.__asegurar_dni_es_valido__(dni)
-        self.__asegurar_fecha_nacimiento_es_valido__(fecha_nacimiento)
+        self.__asegurar_fecha_nacimiento_es_valido__(fecha_nacimiento, ahora)
         self.__nombre__ = nombre
         self.__dni__ = dni
         self.__fecha_nacimiento__ = fecha_nacimiento
+        # Texto de __str__, armado la primera vez que se pide (el paciente no cambia).
+        self.__texto__: str | None = None
+
+    @classmethod
+    def desde_datos_confiables(
+        cls, nombre: str, dni: str, fecha_nacimiento: datetime
+    ) -> "Paciente":
+        """
+        Crea el paciente sin validar los datos, para los que vienen del almacenamiento
+        propio o ya fueron validados.
+        """
+        paciente = cls.__new__(cls)
+        paciente.__nombre__ = nombre
+        paciente.__dni__ = dni
+        paciente.__fecha_nacimiento__ = fecha_nacimiento
+        paciente.__texto__ = None
+        return paciente
 
     def obtener_dni(self) -> str:
         return self.__dni__
 
+    def obtener_nombre(self) -> str:
+        return self.__nombre__
+
+    def obtener_fecha_nacimiento(self) -> datetime:
+        return self.__fecha_nacimiento__
+
     def __str__(self) -> str:
-        return (
-            f"Paciente: {self.__nombre__} - "
-            f"DNI: {self.__dni__} - "
-            f"Fecha de nacimiento: {formatear_fecha(self.__fecha_nacimiento__)}"
-        )
+        if self.__texto__ is None:
+            self.__texto__ = (
+                f"Paciente: {self.__nombre__} - "
+                f"DNI: {self.__dni__} - "
+                f"Fecha de nacimiento: {formatear_fecha(self.__fecha_nacimiento__)}"
+            )
+        return self.__texto__
 
     def __asegurar_nombre_es_valido__(self, nombre: str) -> None:
         """
@@ -57,16 +94,17 @@ class Paciente:
             raise ValidacionError("El DNI debe ser numérico")
 
     def __asegurar_fecha_nacimiento_es_valido__(
-        self, fecha_nacimiento: datetime
+        self, fecha_nacimiento: datetime, ahora: datetime | None
     ) -> None:
         """
         Verifica que la fecha de nacimiento sea un datetime y no esté en el futuro.
 
         :param fecha_nacimiento: Fecha a validar.
+        :param ahora: Fecha actual, o None para leer el reloj del sistema.
         :raises TipoDeDatoInvalidoError: Si no es datetime.
         :raises ValidacionError: Si la fecha es posterior a la fecha actual.
         """
         if not isinstance(fecha_nacimiento, datetime):
             raise TipoDeDatoInvalidoError("La fecha de nacimiento es inválida")
-        if fecha_nacimiento > datetime.now():
+        if fecha_nacimiento > (datetime.now() if ahora is None else ahora):
             raise ValidacionError("La fecha de nacimiento no puede ser mayor a hoy")
@@ -1,3 +1,4 @@
+import sys
 from datetime import datetime
 from .paciente import Paciente
 from .medico import Medico
@@ -10,14 +11,68 @@ class Receta:
     Representa una receta médica emitida por un médico a un paciente, incluyendo los medicamentos recetados y la fecha de emisión.
     """
 
-    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: list[str]):
+    __slots__ = ("__paciente__", "__medico__", "__medicamentos__", "__fecha__")
+
+    def __init__(
+        self,
+        paciente: Paciente,
+        medico: Medico,
+        medicamentos: list[str],
+        fecha: datetime | None = None,
+    ):
+        """
+        `fecha` es la de emisión; si no se indica se lee el reloj del sistema.
+        """
         self.__asegurar_paciente_es_valido__(paciente)
         self.__asegurar_medico_es_valido__(medico)
         self.__asegurar_medicamentos_es_valido__(medicamentos)
         self.__paciente__ = paciente
         self.__medico__ = medico
-        self.__medicamentos__ = medicamentos
-        self.__fecha__ = datetime.now()
+        # Los nombres se internan: las recetas de un medicamento comparten el texto.
+        self.__medicamentos__ = list(map(sys.intern, medicamentos))
+        self.__fecha__ = datetime.now() if fecha is None else fecha
+
+    @classmethod
+    def desde_datos_confiables(
+        cls,
+        paciente: Paciente,
+        medico: Medico,
+        medicamentos: list[str],
+        fecha: datetime,
+    ) -> "Receta":
+        """
+        Crea la receta sin validar y con su fecha original, para las que vienen del
+        almacenamiento propio.
+        """
+        receta = cls.__new__(cls)
+        receta.__paciente__ = paciente
+        receta.__medico__ = medico
+        receta.__medicamentos__ = list(map(sys.intern, medicamentos))
+        receta.__fecha__ = fecha
+        return receta
+
+    def obtener_paciente(self) -> Paciente:
+        return self.__paciente__
+
+    def obtener_medico(self) -> Medico:
+        return self.__medico__
+
+    def obtener_medicamentos(self) -> list[str]:
+        return list(self.__medicamentos__)
+
+    def obtener_fecha(self) -> datetime:
+        return self.__fecha__
+
+    def obtener_resumen(self) -> str:
+        """
+        Representación de una línea para listados dentro de una historia clínica,
+        sin repetir los datos completos del paciente.
+        """
+        return (
+            f"{formatear_fecha(self.__fecha__)} - "
+            f"{', '.join(self.__medicamentos__)} - "
+            f"Médico: {self.__medico__.obtener_nombre()} ({self.__medico__.obtener_matricula()})"
+        )
 
     def __str__(self) -> str:
         medicamentos_str = ", ".join(self.__medicamentos__)
@@ -2,7 +2,8 @@ from datetime import datetime
 from .paciente import Paciente
 from .medico import Medico
 from ..errors.custom_exception import TipoDeDatoInvalidoError, ValidacionError
-from ..utils.fechas import formatear_fecha
+from ..utils.fechas import formatear_fecha_hora
+from ..utils.vocabulario import ESPECIALIDADES
 
 
 class Turno:
@@ -10,21 +11,51 @@ class Turno:
     Representa un turno médico entre un paciente y un médico para una especialidad específica en una fecha y hora determinada.
     """
 
+    __slots__ = ("__paciente__", "__medico__", "__fecha_hora__", "__especialidad__")
+
     def __init__(
         self,
         paciente: Paciente,
         medico: Medico,
         fecha_hora: datetime,
         especialidad: str,
+        ahora: datetime | None = None,
     ):
+        """
+        `ahora` es la fecha contra la que se valida que el turno no sea pasado; si
+        no se indica se lee el reloj del sistema.
+        """
         self.__asegurar_paciente_es_valido__(paciente)
         self.__asegurar_medico_es_valido__(medico)
-        self.__asegurar_fecha_hora_es_valida__(fecha_hora)
+        self.__asegurar_fecha_hora_es_valida__(fecha_hora, ahora)
         self.__asegurar_especialidad_es_valida__(especialidad)
         self.__paciente__ = paciente
         self.__medico__ = medico
         self.__fecha_hora__ = fecha_hora
-        self.__especialidad__ = especialidad
+        # Se guarda el código del registro compartido en lugar del texto.
+        self.__especialidad__ = ESPECIALIDADES.registrar(especialidad)
+
+    @classmethod
+    def desde_datos_confiables(
+        cls,
+        paciente: Paciente,
+        medico: Medico,
+        fecha_hora: datetime,
+        especialidad: str,
+    ) -> "Turno":
+        """
+        Crea el turno sin validar, para los que vienen del almacenamiento propio
+        (los turnos pasados no pasarían la validación de la fecha).
+        """
+        turno = cls.__new__(cls)
+        turno.__paciente__ = paciente
+        turno.__medico__ = medico
+        turno.__fecha_hora__ = fecha_hora
+        turno.__especialidad__ = ESPECIALIDADES.registrar(especialidad)
+        return turno
+
+    def obtener_paciente(self) -> Paciente:
+        return self.__paciente__
 
     def obtener_medico(self) -> Medico:
         return self.__medico__
@@ -32,12 +63,29 @@ class Turno:
     def obtener_fecha_hora(self) -> datetime:
         return self.__fecha_hora__
 
+    def obtener_especialidad(self) -> str:
+        return ESPECIALIDADES.obtener_nombre(self.__especialidad__)
+
+    def obtener_codigo_especialidad(self) -> int:
+        return self.__especialidad__
+
+    def obtener_resumen(self) -> str:
+        """
+        Representación de una línea para listados dentro de una historia clínica,
+        sin repetir los datos completos del paciente.
+        """
+        return (
+            f"{formatear_fecha_hora(self.__fecha_hora__)} - "
+            f"{self.obtener_especialidad()} - "
+            f"Médico: {self.__medico__.obtener_nombre()} ({self.__medico__.obtener_matricula()})"
+        )
+
     def __str__(self) -> str:
         return (
             f"Turno: Paciente: {self.__paciente__} | "
             f"Médico: {self.__medico__} | "
-            f"Especialidad: {self.__especialidad__} | "
-            f"Fecha y hora: {formatear_fecha(self.__fecha_hora__)} {self.__fecha_hora__.strftime('%H:%M')}"
+            f"Especialidad: {self.obtener_especialidad()} | "
+            f"Fecha y hora: {formatear_fecha_hora(self.__fecha_hora__)}"
         )
 
     def __asegurar_paciente_es_valido__(self, paciente):
@@ -48,10 +96,10 @@ class Turno:
         if not isinstance(medico, Medico):
             raise TipoDeDatoInvalidoError("MedIco no es valido :]")
 
-    def __asegurar_fecha_hora_es_valida__(self, fecha_hora):
+    def __asegurar_fecha_hora_es_valida__(self, fecha_hora, ahora):
         if not isinstance(fecha_hora, datetime):
             raise TipoDeDatoInvalidoError("La fecha y hora debe ser valida")
-        if fecha_hora < datetime.now():
+        if fecha_hora < (datetime.now() if ahora is None else ahora):
             raise ValidacionError("La fecha y hora del turno no puede ser en el pasado")
 
     def __asegurar_especialidad_es_valida__(self, especialidad):
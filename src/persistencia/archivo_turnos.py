@@ -0,0 +1,207 @@
+"""
+Archivo de turnos pasados: un segmento por mes, en JSON Lines comprimido con gzip,
+que se lee recién cuando una consulta lo necesita.
+"""
+
+import gzip
+import json
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from threading import Lock
+from .hidratacion import hidratar_turno
+from .serializacion import turno_a_dict
+from ..models.paciente import Paciente
+from ..models.medico import Medico
+from ..models.turno import Turno
+from ..errors.excepciones_clinica import PersistenciaError
+
+NOMBRE_SEGMENTO = re.compile(r"turnos-(\d{4})-(\d{2})\.jsonl\.gz$")
+
+# Fila de un segmento: (dni, matrícula, fecha y hora, especialidad).
+Fila = tuple[str, str, datetime, str]
+
+
+class ArchivoTurnos:
+    """
+    Guarda turnos pasados fuera de la memoria, agrupados en segmentos mensuales.
+    Archivar es idempotente: los turnos de un mes se combinan con los que el
+    segmento ya tenía, sin repetir (matrícula, fecha y hora). Los últimos
+    `meses_en_memoria` segmentos leídos se conservan ya descomprimidos.
+    """
+
+    def __init__(self, directorio: str, meses_en_memoria: int = 12):
+        try:
+            os.makedirs(directorio, exist_ok=True)
+        except OSError as e:
+            raise PersistenciaError(str(e))
+        self.__directorio__ = directorio
+        self.__meses_en_memoria__ = meses_en_memoria
+        self.__segmentos__: OrderedDict[tuple[int, int], list[Fila]] = OrderedDict()
+        self.__lock__ = Lock()
+
+    def obtener_meses(self) -> list[tuple[int, int]]:
+        """
+        Devuelve los meses archivados como (año, mes), en orden.
+        """
+        try:
+            nombres = os.listdir(self.__directorio__)
+        except OSError as e:
+            raise PersistenciaError(str(e))
+        meses = []
+        for nombre in nombres:
+            coincidencia = NOMBRE_SEGMENTO.match(nombre)
+            if coincidencia:
+                meses.append((int(coincidencia[1]), int(coincidencia[2])))
+        return sorted(meses)
+
+    def archivar(self, turnos: Iterable[Turno]) -> int:
+        """
+        Escribe los turnos en los segmentos de sus meses y devuelve cuántos se
+        agregaron. Cada segmento se reescribe completo en un archivo temporal que
+        luego reemplaza al anterior.
+        """
+        por_mes: dict[tuple[int, int], list[Turno]] = {}
+        for turno in turnos:
+            fecha_hora = turno.obtener_fecha_hora()
+            por_mes.setdefault((fecha_hora.year, fecha_hora.month), []).append(turno)
+        agregados = 0
+        with self.__lock__:
+            for mes, nuevos in por_mes.items():
+                filas = {
+                    (fila[1], fila[2]): fila for fila in self.__leer_segmento__(mes)
+                }
+                cantidad_previa = len(filas)
+                for turno in nuevos:
+                    fila = _fila(turno)
+                    filas[(fila[1], fila[2])] = fila
+                agregados += len(filas) - cantidad_previa
+                self.__escribir_segmento__(
+                    mes, sorted(filas.values(), key=lambda f: f[2])
+                )
+        return agregados
+
+    def iterar_filas(
+        self, desde: datetime | None = None, hasta: datetime | None = None
+    ) -> Iterator[Fila]:
+        """
+        Recorre en orden de fecha las filas con fecha y hora en [desde, hasta),
+        leyendo solo los segmentos de los meses del intervalo, de a uno por vez.
+        """
+        for mes in self.obtener_meses():
+            if desde is not None and mes < (desde.year, desde.month):
+                continue
+            if hasta is not None and mes > (hasta.year, hasta.month):
+                break
+            with self.__lock__:
+                filas = self.__leer_segmento__(mes)
+            for fila in filas:
+                if (desde is None or fila[2] >= desde) and (
+                    hasta is None or fila[2] < hasta
+                ):
+                    yield fila
+
+    def cargar_turnos_de_paciente(
+        self,
+        paciente: Paciente,
+        meses: Iterable[tuple[int, int]],
+        medicos: dict[str, Medico],
+    ) -> list[Turno]:
+        """
+        Hidrata los turnos archivados del paciente en los meses indicados.
+        """
+        dni = paciente.obtener_dni()
+        turnos = []
+        for mes in sorted(meses):
+            with self.__lock__:
+                filas = self.__leer_segmento__(mes)
+            for dni_fila, matricula, fecha_hora, especialidad in filas:
+                if dni_fila != dni:
+                    continue
+                if matricula not in medicos:
+                    raise PersistenciaError(
+                        f"el turno archivado del {fecha_hora.isoformat()} es de un "
+                        f"médico ({matricula}) que no está en la clínica"
+                    )
+                turnos.append(
+                    hidratar_turno(
+                        paciente, medicos[matricula], fecha_hora, especialidad
+                    )
+                )
+        return turnos
+
+    def __ruta__(self, mes: tuple[int, int]) -> str:
+        anio, numero = mes
+        return os.path.join(
+            self.__directorio__, f"turnos-{anio:04d}-{numero:02d}.jsonl.gz"
+        )
+
+    def __leer_segmento__(self, mes: tuple[int, int]) -> list[Fila]:
+        """
+        Devuelve las filas del segmento (vacío si no existe). Debe llamarse con el
+        lock tomado.
+        """
+        filas = self.__segmentos__.get(mes)
+        if filas is not None:
+            self.__segmentos__.move_to_end(mes)
+            return filas
+        ruta = self.__ruta__(mes)
+        filas = []
+        if os.path.exists(ruta):
+            try:
+                with gzip.open(ruta, "rt", encoding="utf-8") as archivo:
+                    for linea in archivo:
+                        datos = json.loads(linea)
+                        filas.append(
+                            (
+                                datos["dni"],
+                                datos["matricula"],
+                                datetime.fromisoformat(datos["fecha_hora"]),
+                                datos["especialidad"],
+                            )
+                        )
+            except (OSError, ValueError, KeyError) as e:
+                raise PersistenciaError(f"{ruta}: {e}")
+        self.__guardar_en_memoria__(mes, filas)
+        return filas
+
+    def __escribir_segmento__(self, mes: tuple[int, int], filas: list[Fila]) -> None:
+        ruta = self.__ruta__(mes)
+        temporal = ruta + ".tmp"
+        try:
+            with gzip.open(temporal, "wt", encoding="utf-8") as archivo:
+                for dni, matricula, fecha_hora, especialidad in filas:
+                    archivo.write(
+                        json.dumps(
+                            {
+                                "dni": dni,
+                                "matricula": matricula,
+                                "fecha_hora": fecha_hora.isoformat(),
+                                "especialidad": especialidad,
+                            },
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+            os.replace(temporal, ruta)
+        except OSError as e:
+            raise PersistenciaError(f"{ruta}: {e}")
+        self.__guardar_en_memoria__(mes, filas)
+
+    def __guardar_en_memoria__(self, mes: tuple[int, int], filas: list[Fila]) -> None:
+        self.__segmentos__[mes] = filas
+        self.__segmentos__.move_to_end(mes)
+        while len(self.__segmentos__) > self.__meses_en_memoria__:
+            self.__segmentos__.popitem(last=False)
+
+
+def _fila(turno: Turno) -> Fila:
+    datos = turno_a_dict(turno)
+    return (
+        datos["dni"],
+        datos["matricula"],
+        turno.obtener_fecha_hora(),
+        datos["especialidad"],
+    )
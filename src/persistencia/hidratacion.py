@@ -0,0 +1,32 @@
+"""
+Reconstrucción de modelos a partir de datos ya persistidos. Esos datos se
+validaron al crearse, y los turnos pasados o la fecha original de una receta no
+pasarían las validaciones de los constructores, por lo que se restauran con los
+constructores confiables de cada modelo.
+"""
+
+from datetime import datetime
+from ..models.paciente import Paciente
+from ..models.medico import Medico
+from ..models.turno import Turno
+from ..models.receta import Receta
+
+
+def hidratar_paciente(nombre: str, dni: str, fecha_nacimiento: datetime) -> Paciente:
+    return Paciente.desde_datos_confiables(nombre, dni, fecha_nacimiento)
+
+
+def hidratar_medico(nombre: str, matricula: str) -> Medico:
+    return Medico.desde_datos_confiables(nombre, matricula)
+
+
+def hidratar_turno(
+    paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str
+) -> Turno:
+    return Turno.desde_datos_confiables(paciente, medico, fecha_hora, especialidad)
+
+
+def hidratar_receta(
+    paciente: Paciente, medico: Medico, medicamentos: list[str], fecha: datetime
+) -> Receta:
+    return Receta.desde_datos_confiables(paciente, medico, medicamentos, fecha)
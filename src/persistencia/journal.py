@@ -0,0 +1,325 @@
+import json
+import os
+import time
+from threading import Lock
+from .repositorio import GruposDeEscritura, Repositorio
+from .serializacion import (
+    especialidad_a_dict,
+    especialidad_desde_dict,
+    medico_a_dict,
+    medico_desde_dict,
+    paciente_a_dict,
+    paciente_desde_dict,
+    receta_a_dict,
+    receta_desde_dict,
+    turno_a_dict,
+    turno_desde_dict,
+)
+from ..models.clinica import Clinica
+from ..utils.reloj import RELOJ_SISTEMA, Reloj
+from ..models.historia_clinica import HistoriaClinica
+from ..errors.custom_exception import ValidacionError
+from ..errors.excepciones_clinica import PersistenciaError
+
+POLITICAS_FSYNC = ("siempre", "grupo", "nunca")
+
+
+class Journal(Repositorio):
+    """
+    Registro de solo agregado (una línea JSON por cambio) con snapshots periódicos
+    del estado completo. Al recuperar se carga el último snapshot y se reaplican
+    solo los cambios posteriores.
+
+    Políticas de fsync:
+    - "siempre": cada cambio se sincroniza a disco antes de aplicarse.
+    - "grupo": se sincroniza cada `tamano_grupo` cambios o cuando pasaron
+      `intervalo_grupo` segundos desde el primer cambio pendiente. El intervalo se
+      controla recién al anotar el cambio siguiente: los últimos cambios de una
+      ráfaga quedan en el buffer del proceso, sin límite de tiempo, hasta otro
+      cambio, sincronizar() o cerrar(). Quien necesite acotar esa ventana debe
+      llamar a sincronizar() periódicamente.
+    - "nunca": se delega en el sistema operativo; solo se sincroniza al cerrar.
+    """
+
+    def __init__(
+        self,
+        directorio: str,
+        politica_fsync: str = "grupo",
+        tamano_grupo: int = 64,
+        intervalo_grupo: float = 0.05,
+        snapshot_cada: int | None = None,
+    ):
+        if politica_fsync not in POLITICAS_FSYNC:
+            raise ValidacionError(
+                f"Política de fsync inválida: {politica_fsync}. "
+                f"Opciones: {', '.join(POLITICAS_FSYNC)}"
+            )
+        os.makedirs(directorio, exist_ok=True)
+        self.__ruta_journal__ = os.path.join(directorio, "journal.jsonl")
+        self.__ruta_snapshot__ = os.path.join(directorio, "snapshot.json")
+        self.__politica_fsync__ = politica_fsync
+        self.__tamano_grupo__ = tamano_grupo
+        self.__intervalo_grupo__ = intervalo_grupo
+        self.__snapshot_cada__ = snapshot_cada
+        self.__secuencia__ = 0
+        self.__desde_snapshot__ = 0
+        self.__pendientes__ = 0
+        self.__inicio_pendientes__ = 0.0
+        self.__clinica__: Clinica | None = None
+        self.__archivo__ = None
+        self.__grupos__ = GruposDeEscritura(
+            Lock(), lambda: None, self.__sincronizar_grupo__
+        )
+
+    def recuperar(self, reloj: Reloj = RELOJ_SISTEMA) -> Clinica:
+        """
+        Reconstruye la clínica a partir del último snapshot y el journal, y la deja
+        registrando sus cambios en este journal y leyendo la hora de `reloj`.
+        """
+        # Los turnos se acumulan por (matrícula, fecha y hora) para poder aplicar
+        # las cancelaciones.
+        pacientes, medicos, turnos, historias = {}, {}, {}, {}
+        ultimo = 0
+        if os.path.exists(self.__ruta_snapshot__):
+            with open(self.__ruta_snapshot__, encoding="utf-8") as archivo:
+                snapshot = json.load(archivo)
+            ultimo = snapshot["ultimo"]
+            for operacion, clave in (
+                ("paciente", "pacientes"),
+                ("medico", "medicos"),
+                ("turno", "turnos"),
+                ("receta", "recetas"),
+            ):
+                for datos in snapshot[clave]:
+                    registro = {"op": operacion, **datos}
+                    self.__aplicar__(registro, pacientes, medicos, turnos, historias)
+        self.__secuencia__ = ultimo
+        if os.path.exists(self.__ruta_journal__):
+            # Bytes hasta el final de la última línea completa y válida.
+            valido = 0
+            with open(self.__ruta_journal__, "rb+") as archivo:
+                for linea in archivo:
+                    try:
+                        if not linea.endswith(b"\n"):
+                            raise ValueError
+                        registro = json.loads(linea)
+                    except ValueError:
+                        # Solo la última línea puede haber quedado a medio
+                        # escribir por una caída; más adelante es corrupción, y
+                        # el archivo se deja intacto.
+                        if archivo.read(1):
+                            raise PersistenciaError(
+                                f"{self.__ruta_journal__}: registro ilegible en "
+                                f"el byte {valido}"
+                            )
+                        break
+                    valido += len(linea)
+                    if registro["n"] <= ultimo:
+                        continue
+                    self.__aplicar__(registro, pacientes, medicos, turnos, historias)
+                    self.__secuencia__ = registro["n"]
+                # Se descarta el fragmento para que el próximo registro no quede
+                # pegado a él.
+                archivo.truncate(valido)
+        self.__desde_snapshot__ = self.__secuencia__ - ultimo
+        self.__abrir__()
+        self.__clinica__ = Clinica(
+            pacientes, medicos, list(turnos.values()), historias, self, reloj
+        )
+        return self.__clinica__
+
+    def guardar_paciente(self, paciente) -> None:
+        self.guardar_pacientes([paciente])
+
+    def guardar_pacientes(self, pacientes) -> None:
+        self.__snapshot_si_corresponde__()
+        for paciente in pacientes:
+            self.__anotar__({"op": "paciente", **paciente_a_dict(paciente)})
+
+    def guardar_medico(self, medico) -> None:
+        self.guardar_medicos([medico])
+
+    def guardar_medicos(self, medicos) -> None:
+        self.__snapshot_si_corresponde__()
+        for medico in medicos:
+            self.__anotar__({"op": "medico", **medico_a_dict(medico)})
+
+    def guardar_especialidad(self, matricula: str, especialidad) -> None:
+        self.__snapshot_si_corresponde__()
+        self.__anotar__(
+            {
+                "op": "especialidad",
+                "matricula": matricula,
+                **especialidad_a_dict(especialidad),
+            }
+        )
+
+    def guardar_turno(self, turno) -> None:
+        self.guardar_turnos([turno])
+
+    def guardar_turnos(self, turnos) -> None:
+        self.__snapshot_si_corresponde__()
+        for turno in turnos:
+            self.__anotar__({"op": "turno", **turno_a_dict(turno)})
+
+    def eliminar_turno(self, turno) -> None:
+        self.__snapshot_si_corresponde__()
+        self.__anotar__(
+            {
+                "op": "cancelacion",
+                "matricula": turno.obtener_medico().obtener_matricula(),
+                "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+            }
+        )
+
+    def guardar_receta(self, receta) -> None:
+        self.guardar_recetas([receta])
+
+    def guardar_recetas(self, recetas) -> None:
+        self.__snapshot_si_corresponde__()
+        for receta in recetas:
+            self.__anotar__({"op": "receta", **receta_a_dict(receta)})
+
+    def guardar_snapshot(self) -> None:
+        """
+        Escribe el estado completo de la clínica y vacía el journal. El snapshot se
+        escribe en un archivo temporal y se reemplaza atómicamente. Incluye los
+        turnos archivados, que al recuperar vuelven a quedar en memoria.
+        """
+        clinica = self.__clinica__
+        pacientes = clinica.ver_pacientes()
+        snapshot = {
+            "ultimo": self.__secuencia__,
+            "pacientes": [paciente_a_dict(p) for p in pacientes.values()],
+            "medicos": [medico_a_dict(m) for m in clinica.ver_medicos().values()],
+            "turnos": [turno_a_dict(t) for t in clinica.iterar_turnos_entre()],
+            "recetas": [
+                receta_a_dict(r)
+                for dni in pacientes
+                for r in clinica.obtener_historia_clinica(dni).ver_recetas()
+            ],
+        }
+        temporal = self.__ruta_snapshot__ + ".tmp"
+        try:
+            with open(temporal, "w", encoding="utf-8") as archivo:
+                json.dump(snapshot, archivo, separators=(",", ":"))
+                archivo.flush()
+                os.fsync(archivo.fileno())
+            os.replace(temporal, self.__ruta_snapshot__)
+            self.__archivo__.close()
+            # Si la caída ocurre antes de vaciar el journal, los registros ya
+            # incluidos en el snapshot se descartan por su número de secuencia.
+            open(self.__ruta_journal__, "wb").close()
+        except OSError as e:
+            raise PersistenciaError(str(e)) from e
+        self.__abrir__()
+        self.__desde_snapshot__ = 0
+        self.__pendientes__ = 0
+
+    def sincronizar(self) -> None:
+        """
+        Fuerza la escritura a disco de los cambios pendientes.
+        """
+        try:
+            self.__archivo__.flush()
+            os.fsync(self.__archivo__.fileno())
+        except OSError as e:
+            raise PersistenciaError(str(e)) from e
+        self.__pendientes__ = 0
+
+    def agrupar_escrituras(self):
+        """
+        Mientras haya grupos abiertos los cambios se anotan sin sincronizar, y al
+        salir el último se sincronizan todos juntos (con la política "nunca" solo se
+        vacía el buffer). Ver GruposDeEscritura.
+        """
+        return self.__grupos__.agrupar()
+
+    def __sincronizar_grupo__(self) -> None:
+        if not self.__pendientes__:
+            return
+        if self.__politica_fsync__ == "nunca":
+            try:
+                self.__archivo__.flush()
+            except OSError as e:
+                raise PersistenciaError(str(e)) from e
+            self.__pendientes__ = 0
+        else:
+            self.sincronizar()
+
+    def cerrar(self) -> None:
+        if self.__archivo__ is not None and not self.__archivo__.closed:
+            self.sincronizar()
+            self.__archivo__.close()
+
+    def __abrir__(self) -> None:
+        try:
+            self.__archivo__ = open(self.__ruta_journal__, "ab")
+        except OSError as e:
+            raise PersistenciaError(str(e)) from e
+
+    def __snapshot_si_corresponde__(self) -> None:
+        """
+        Se llama al comienzo de cada cambio: en ese momento todo lo anotado ya está
+        aplicado en memoria, así que el snapshot es consistente con la secuencia.
+        """
+        if self.__archivo__ is None:
+            raise PersistenciaError("El journal no fue abierto con recuperar()")
+        if (
+            self.__snapshot_cada__ is not None
+            and self.__desde_snapshot__ >= self.__snapshot_cada__
+        ):
+            self.guardar_snapshot()
+
+    def __anotar__(self, registro: dict) -> None:
+        self.__secuencia__ += 1
+        registro["n"] = self.__secuencia__
+        linea = json.dumps(registro, separators=(",", ":")) + "\n"
+        try:
+            self.__archivo__.write(linea.encode("utf-8"))
+        except OSError as e:
+            raise PersistenciaError(str(e)) from e
+        self.__desde_snapshot__ += 1
+        if self.__grupos__.hay_grupos_abiertos():
+            self.__pendientes__ += 1
+        elif self.__politica_fsync__ == "siempre":
+            self.sincronizar()
+        elif self.__politica_fsync__ == "grupo":
+            if self.__pendientes__ == 0:
+                self.__inicio_pendientes__ = time.monotonic()
+            self.__pendientes__ += 1
+            if (
+                self.__pendientes__ >= self.__tamano_grupo__
+                or time.monotonic() - self.__inicio_pendientes__
+                >= self.__intervalo_grupo__
+            ):
+                self.sincronizar()
+        else:
+            self.__archivo__.flush()
+
+    def __aplicar__(self, registro, pacientes, medicos, turnos, historias) -> None:
+        operacion = registro["op"]
+        if operacion == "paciente":
+            paciente = paciente_desde_dict(registro, confiable=True)
+            pacientes[paciente.obtener_dni()] = paciente
+            historias[paciente.obtener_dni()] = HistoriaClinica(paciente)
+        elif operacion == "medico":
+            medico = medico_desde_dict(registro, confiable=True)
+            medicos[medico.obtener_matricula()] = medico
+        elif operacion == "especialidad":
+            medicos[registro["matricula"]].agregar_especialidad(
+                especialidad_desde_dict(registro)
+            )
+        elif operacion == "turno":
+            turno = turno_desde_dict(registro, pacientes, medicos)
+            turnos[(registro["matricula"], registro["fecha_hora"])] = turno
+            historias[registro["dni"]].agregar_turno(turno, validar=False)
+        elif operacion == "cancelacion":
+            turno = turnos.pop((registro["matricula"], registro["fecha_hora"]))
+            historias[turno.obtener_paciente().obtener_dni()].quitar_turno(turno)
+        elif operacion == "receta":
+            historias[registro["dni"]].agregar_receta(
+                receta_desde_dict(registro, pacientes, medicos), validar=False
+            )
+        else:
+            raise PersistenciaError(f"Operación desconocida en el journal: {operacion}")
@@ -0,0 +1,154 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from contextlib import contextmanager, nullcontext
+from threading import Condition, local
+from ..errors.excepciones_clinica import PersistenciaError
+
+
+class Repositorio(ABC):
+    """
+    Interfaz de almacenamiento sobre la que puede apoyarse `Clinica`. La clínica
+    llama a los métodos `guardar_*` antes de aplicar cada cambio en memoria, de modo
+    que un error de almacenamiento en una escritura individual no deja el estado a
+    medio actualizar. Dentro de agrupar_escrituras la confirmación ocurre al final:
+    si falla, los cambios del grupo ya quedaron aplicados en memoria.
+    """
+
+    @abstractmethod
+    def guardar_paciente(self, paciente) -> None: ...
+
+    def guardar_pacientes(self, pacientes) -> None:
+        for paciente in pacientes:
+            self.guardar_paciente(paciente)
+
+    @abstractmethod
+    def guardar_medico(self, medico) -> None: ...
+
+    def guardar_medicos(self, medicos) -> None:
+        for medico in medicos:
+            self.guardar_medico(medico)
+
+    @abstractmethod
+    def guardar_especialidad(self, matricula: str, especialidad) -> None: ...
+
+    @abstractmethod
+    def guardar_turno(self, turno) -> None: ...
+
+    def guardar_turnos(self, turnos) -> None:
+        for turno in turnos:
+            self.guardar_turno(turno)
+
+    @abstractmethod
+    def eliminar_turno(self, turno) -> None: ...
+
+    @abstractmethod
+    def guardar_receta(self, receta) -> None: ...
+
+    def guardar_recetas(self, recetas) -> None:
+        for receta in recetas:
+            self.guardar_receta(receta)
+
+    def agrupar_escrituras(self):
+        """
+        Contexto dentro del cual el repositorio puede confirmar las escrituras todas
+        juntas al salir en lugar de una por una. Puede anidarse y abrirse desde
+        varios hilos (ver GruposDeEscritura): al salir, las escrituras del grupo ya
+        están confirmadas. Si la confirmación falla, los cambios del grupo ya están
+        aplicados en memoria.
+        """
+        return nullcontext()
+
+    def cerrar(self) -> None:
+        pass
+
+    def cargar_historia(self, paciente, medicos: dict, turnos_vigentes: dict):
+        """
+        Devuelve (turnos, recetas) del paciente para hidratar su historia clínica.
+        Los repositorios que mantienen todo en memoria no necesitan implementarlo.
+        """
+        return [], []
+
+
+class _Tanda:
+    """
+    Grupos que comparten una misma confirmación.
+    """
+
+    __slots__ = ("confirmada", "error")
+
+    def __init__(self):
+        self.confirmada = False
+        self.error: PersistenciaError | None = None
+
+
+class GruposDeEscritura:
+    """
+    Coordina los grupos de escrituras que varios hilos abren sobre un mismo
+    almacenamiento. Los grupos abiertos a la vez forman una tanda que se confirma
+    una sola vez (`iniciar` al abrirse el primero, `confirmar` al cerrarse el
+    último). Cuando un grupo sale, la tanda deja de aceptar grupos nuevos, que
+    esperan a la siguiente, y el grupo espera a que la tanda se confirme: así la
+    confirmación no se posterga indefinidamente y nadie informa como hechas
+    escrituras todavía sin confirmar. Los grupos anidados en un mismo hilo forman
+    parte del grupo exterior. Una escritura hecha fuera de todo grupo mientras hay
+    una tanda abierta se confirma junto con ella.
+    """
+
+    def __init__(
+        self, bloqueo, iniciar: Callable[[], None], confirmar: Callable[[], None]
+    ):
+        # `bloqueo` es el mismo que protege el almacenamiento, así que iniciar y
+        # confirmar no se cruzan con otras escrituras.
+        self.__condicion__ = Condition(bloqueo)
+        self.__iniciar__ = iniciar
+        self.__confirmar__ = confirmar
+        self.__abiertos__ = 0
+        self.__cerrando__ = False
+        self.__tanda__ = _Tanda()
+        self.__hilo__ = local()
+
+    def hay_grupos_abiertos(self) -> bool:
+        return self.__abiertos__ > 0
+
+    @contextmanager
+    def agrupar(self):
+        profundidad = getattr(self.__hilo__, "profundidad", 0)
+        if profundidad:
+            self.__hilo__.profundidad = profundidad + 1
+            try:
+                yield
+            finally:
+                self.__hilo__.profundidad = profundidad
+            return
+        with self.__condicion__:
+            while self.__cerrando__:
+                self.__condicion__.wait()
+            if self.__abiertos__ == 0:
+                self.__iniciar__()
+            self.__abiertos__ += 1
+            tanda = self.__tanda__
+        self.__hilo__.profundidad = 1
+        try:
+            yield
+        finally:
+            self.__hilo__.profundidad = 0
+            self.__salir__(tanda)
+
+    def __salir__(self, tanda: _Tanda) -> None:
+        with self.__condicion__:
+            self.__cerrando__ = True
+            self.__abiertos__ -= 1
+            if self.__abiertos__ == 0:
+                try:
+                    self.__confirmar__()
+                except PersistenciaError as e:
+                    tanda.error = e
+                tanda.confirmada = True
+                self.__tanda__ = _Tanda()
+                self.__cerrando__ = False
+                self.__condicion__.notify_all()
+            else:
+                while not tanda.confirmada:
+                    self.__condicion__.wait()
+        if tanda.error is not None:
+            raise tanda.error
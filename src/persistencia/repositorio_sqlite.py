@@ -0,0 +1,334 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from threading import RLock
+from .repositorio import GruposDeEscritura, Repositorio
+from .hidratacion import (
+    hidratar_medico,
+    hidratar_paciente,
+    hidratar_receta,
+    hidratar_turno,
+)
+from ..models.paciente import Paciente
+from ..models.medico import Medico
+from ..models.especialidad import Especialidad
+from ..models.turno import Turno
+from ..models.receta import Receta
+from ..errors.excepciones_clinica import PersistenciaError
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    dni TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicos (
+    matricula TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS especialidades (
+    id INTEGER PRIMARY KEY,
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    tipo TEXT NOT NULL,
+    dias TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_especialidades_matricula
+    ON especialidades (matricula);
+CREATE TABLE IF NOT EXISTS turnos (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    fecha_hora TEXT NOT NULL,
+    especialidad TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_turnos_matricula_fecha_hora
+    ON turnos (matricula, fecha_hora);
+CREATE INDEX IF NOT EXISTS idx_turnos_dni ON turnos (dni);
+CREATE INDEX IF NOT EXISTS idx_turnos_fecha_hora ON turnos (fecha_hora);
+CREATE TABLE IF NOT EXISTS recetas (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL REFERENCES pacientes (dni),
+    matricula TEXT NOT NULL REFERENCES medicos (matricula),
+    medicamentos TEXT NOT NULL,
+    fecha TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recetas_dni ON recetas (dni);
+"""
+
+INSERTAR_PACIENTE = (
+    "INSERT INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)"
+)
+INSERTAR_MEDICO = "INSERT INTO medicos (matricula, nombre) VALUES (?, ?)"
+INSERTAR_ESPECIALIDAD = (
+    "INSERT INTO especialidades (matricula, tipo, dias) VALUES (?, ?, ?)"
+)
+INSERTAR_TURNO = (
+    "INSERT INTO turnos (dni, matricula, fecha_hora, especialidad) VALUES (?, ?, ?, ?)"
+)
+ELIMINAR_TURNO = "DELETE FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+INSERTAR_RECETA = (
+    "INSERT INTO recetas (dni, matricula, medicamentos, fecha) VALUES (?, ?, ?, ?)"
+)
+SELECCIONAR_PACIENTES = "SELECT dni, nombre, fecha_nacimiento FROM pacientes"
+SELECCIONAR_MEDICOS = "SELECT matricula, nombre FROM medicos"
+SELECCIONAR_ESPECIALIDADES = (
+    "SELECT matricula, tipo, dias FROM especialidades ORDER BY id"
+)
+SELECCIONAR_TURNOS_DESDE = (
+    "SELECT dni, matricula, fecha_hora, especialidad FROM turnos "
+    "WHERE fecha_hora >= ? ORDER BY id"
+)
+SELECCIONAR_TURNOS_DE_PACIENTE = (
+    "SELECT matricula, fecha_hora, especialidad FROM turnos "
+    "WHERE dni = ? ORDER BY fecha_hora"
+)
+SELECCIONAR_RECETAS_DE_PACIENTE = (
+    "SELECT matricula, medicamentos, fecha FROM recetas WHERE dni = ? ORDER BY id"
+)
+
+
+class RepositorioSQLite(Repositorio):
+    """
+    Repositorio respaldado por un archivo SQLite. Todas las consultas usan
+    parámetros, por lo que la conexión reutiliza las sentencias ya preparadas. La
+    conexión puede usarse desde varios hilos siempre que los accesos estén
+    serializados, como hace la clínica en modo concurrente.
+    """
+
+    def __init__(self, ruta: str = ":memory:"):
+        try:
+            self.__conexion__ = sqlite3.connect(
+                ruta, cached_statements=256, check_same_thread=False
+            )
+            self.__conexion__.execute("PRAGMA journal_mode = WAL")
+            self.__conexion__.execute("PRAGMA synchronous = NORMAL")
+            self.__conexion__.executescript(ESQUEMA)
+        except sqlite3.Error as e:
+            raise PersistenciaError(str(e)) from e
+        self.__bloqueo__ = RLock()
+        self.__grupos__ = GruposDeEscritura(
+            self.__bloqueo__, lambda: self.__ejecutar__("BEGIN"), self.__confirmar__
+        )
+
+    def cerrar(self) -> None:
+        self.__conexion__.close()
+
+    def agrupar_escrituras(self):
+        """
+        Abre una transacción compartida por los grupos abiertos a la vez, que se
+        confirma al salir el último (ver GruposDeEscritura). Cada escritura del
+        grupo usa un savepoint propio, así que una que falla se deshace sin afectar
+        a las demás.
+        """
+        return self.__grupos__.agrupar()
+
+    def __confirmar__(self) -> None:
+        try:
+            self.__conexion__.commit()
+        except sqlite3.Error as e:
+            self.__conexion__.rollback()
+            raise PersistenciaError(str(e)) from e
+
+    def guardar_paciente(self, paciente: Paciente) -> None:
+        with self.__transaccion__() as conexion:
+            conexion.execute(INSERTAR_PACIENTE, self.__fila_paciente__(paciente))
+
+    def guardar_pacientes(self, pacientes) -> None:
+        with self.__transaccion__() as conexion:
+            conexion.executemany(
+                INSERTAR_PACIENTE, (self.__fila_paciente__(p) for p in pacientes)
+            )
+
+    def guardar_medico(self, medico: Medico) -> None:
+        self.guardar_medicos([medico])
+
+    def guardar_medicos(self, medicos) -> None:
+        with self.__transaccion__() as conexion:
+            for medico in medicos:
+                matricula = medico.obtener_matricula()
+                conexion.execute(INSERTAR_MEDICO, (matricula, medico.obtener_nombre()))
+                conexion.executemany(
+                    INSERTAR_ESPECIALIDAD,
+                    (
+                        self.__fila_especialidad__(matricula, especialidad)
+                        for especialidad in medico.obtener_especialidades()
+                    ),
+                )
+
+    def guardar_especialidad(self, matricula: str, especialidad: Especialidad) -> None:
+        with self.__transaccion__() as conexion:
+            conexion.execute(
+                INSERTAR_ESPECIALIDAD,
+                self.__fila_especialidad__(matricula, especialidad),
+            )
+
+    def guardar_turno(self, turno: Turno) -> None:
+        with self.__transaccion__() as conexion:
+            conexion.execute(INSERTAR_TURNO, self.__fila_turno__(turno))
+
+    def guardar_turnos(self, turnos) -> None:
+        with self.__transaccion__() as conexion:
+            conexion.executemany(
+                INSERTAR_TURNO, (self.__fila_turno__(t) for t in turnos)
+            )
+
+    def eliminar_turno(self, turno: Turno) -> None:
+        with self.__transaccion__() as conexion:
+            conexion.execute(
+                ELIMINAR_TURNO,
+                (
+                    turno.obtener_medico().obtener_matricula(),
+                    turno.obtener_fecha_hora().isoformat(),
+                ),
+            )
+
+    def guardar_receta(self, receta: Receta) -> None:
+        with self.__transaccion__() as conexion:
+            conexion.execute(INSERTAR_RECETA, self.__fila_receta__(receta))
+
+    def guardar_recetas(self, recetas) -> None:
+        with self.__transaccion__() as conexion:
+            conexion.executemany(
+                INSERTAR_RECETA, (self.__fila_receta__(r) for r in recetas)
+            )
+
+    def cargar_pacientes(self) -> dict[str, Paciente]:
+        with self.__transaccion__() as conexion:
+            return {
+                dni: hidratar_paciente(
+                    nombre, dni, datetime.fromisoformat(fecha_nacimiento)
+                )
+                for dni, nombre, fecha_nacimiento in conexion.execute(
+                    SELECCIONAR_PACIENTES
+                )
+            }
+
+    def cargar_medicos(self) -> dict[str, Medico]:
+        with self.__transaccion__() as conexion:
+            medicos = {
+                matricula: hidratar_medico(nombre, matricula)
+                for matricula, nombre in conexion.execute(SELECCIONAR_MEDICOS)
+            }
+            for matricula, tipo, dias in conexion.execute(SELECCIONAR_ESPECIALIDADES):
+                medicos[matricula].agregar_especialidad(
+                    Especialidad(tipo, json.loads(dias))
+                )
+        return medicos
+
+    def cargar_turnos_desde(
+        self,
+        desde: datetime,
+        pacientes: dict[str, Paciente],
+        medicos: dict[str, Medico],
+    ) -> list[Turno]:
+        """
+        Carga los turnos con fecha y hora posterior a `desde`, que son los que
+        participan de la validación de nuevos turnos. El historial anterior se
+        hidrata por paciente con cargar_historia.
+        """
+        with self.__transaccion__() as conexion:
+            return [
+                hidratar_turno(
+                    pacientes[dni],
+                    medicos[matricula],
+                    datetime.fromisoformat(fecha_hora),
+                    especialidad,
+                )
+                for dni, matricula, fecha_hora, especialidad in conexion.execute(
+                    SELECCIONAR_TURNOS_DESDE, (desde.isoformat(),)
+                )
+            ]
+
+    def cargar_historia(
+        self,
+        paciente: Paciente,
+        medicos: dict[str, Medico],
+        turnos_vigentes: dict[tuple[str, datetime], Turno],
+    ) -> tuple[list[Turno], list[Receta]]:
+        """
+        Devuelve los turnos y recetas del paciente. Los turnos que ya están en
+        memoria (indexados por matrícula y fecha y hora) se reutilizan.
+        """
+        dni = paciente.obtener_dni()
+        with self.__transaccion__() as conexion:
+            turnos = []
+            for matricula, fecha_hora, especialidad in conexion.execute(
+                SELECCIONAR_TURNOS_DE_PACIENTE, (dni,)
+            ):
+                fecha_hora = datetime.fromisoformat(fecha_hora)
+                turno = turnos_vigentes.get((matricula, fecha_hora))
+                if turno is None:
+                    turno = hidratar_turno(
+                        paciente, medicos[matricula], fecha_hora, especialidad
+                    )
+                turnos.append(turno)
+            recetas = [
+                hidratar_receta(
+                    paciente,
+                    medicos[matricula],
+                    json.loads(medicamentos),
+                    datetime.fromisoformat(fecha),
+                )
+                for matricula, medicamentos, fecha in conexion.execute(
+                    SELECCIONAR_RECETAS_DE_PACIENTE, (dni,)
+                )
+            ]
+        return turnos, recetas
+
+    @contextmanager
+    def __transaccion__(self):
+        with self.__bloqueo__:
+            if self.__grupos__.hay_grupos_abiertos():
+                self.__ejecutar__("SAVEPOINT escritura")
+                try:
+                    yield self.__conexion__
+                except BaseException as e:
+                    self.__ejecutar__("ROLLBACK TO escritura")
+                    self.__ejecutar__("RELEASE escritura")
+                    if isinstance(e, sqlite3.Error):
+                        raise PersistenciaError(str(e)) from e
+                    raise
+                self.__ejecutar__("RELEASE escritura")
+                return
+            try:
+                with self.__conexion__:
+                    yield self.__conexion__
+            except sqlite3.Error as e:
+                raise PersistenciaError(str(e)) from e
+
+    def __ejecutar__(self, sentencia: str) -> None:
+        try:
+            self.__conexion__.execute(sentencia)
+        except sqlite3.Error as e:
+            raise PersistenciaError(str(e)) from e
+
+    def __fila_paciente__(self, paciente: Paciente) -> tuple:
+        return (
+            paciente.obtener_dni(),
+            paciente.obtener_nombre(),
+            paciente.obtener_fecha_nacimiento().isoformat(),
+        )
+
+    def __fila_especialidad__(self, matricula: str, especialidad: Especialidad):
+        return (
+            matricula,
+            especialidad.obtener_especialidad(),
+            json.dumps(especialidad.obtener_dias()),
+        )
+
+    def __fila_turno__(self, turno: Turno) -> tuple:
+        return (
+            turno.obtener_paciente().obtener_dni(),
+            turno.obtener_medico().obtener_matricula(),
+            turno.obtener_fecha_hora().isoformat(),
+            turno.obtener_especialidad(),
+        )
+
+    def __fila_receta__(self, receta: Receta) -> tuple:
+        return (
+            receta.obtener_paciente().obtener_dni(),
+            receta.obtener_medico().obtener_matricula(),
+            json.dumps(receta.obtener_medicamentos()),
+            receta.obtener_fecha().isoformat(),
+        )
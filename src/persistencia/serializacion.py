@@ -0,0 +1,109 @@
+"""
+Conversión de los modelos a diccionarios compatibles con JSON y viceversa.
+"""
+
+from datetime import datetime
+from .hidratacion import (
+    hidratar_medico,
+    hidratar_paciente,
+    hidratar_receta,
+    hidratar_turno,
+)
+from ..models.paciente import Paciente
+from ..models.medico import Medico
+from ..models.especialidad import Especialidad
+from ..models.turno import Turno
+from ..models.receta import Receta
+
+
+def paciente_a_dict(paciente: Paciente) -> dict:
+    return {
+        "dni": paciente.obtener_dni(),
+        "nombre": paciente.obtener_nombre(),
+        "fecha_nacimiento": paciente.obtener_fecha_nacimiento().isoformat(),
+    }
+
+
+def especialidad_a_dict(especialidad: Especialidad) -> dict:
+    return {
+        "tipo": especialidad.obtener_especialidad(),
+        "dias": especialidad.obtener_dias(),
+    }
+
+
+def medico_a_dict(medico: Medico) -> dict:
+    return {
+        "matricula": medico.obtener_matricula(),
+        "nombre": medico.obtener_nombre(),
+        "especialidades": [
+            especialidad_a_dict(e) for e in medico.obtener_especialidades()
+        ],
+    }
+
+
+def turno_a_dict(turno: Turno) -> dict:
+    return {
+        "dni": turno.obtener_paciente().obtener_dni(),
+        "matricula": turno.obtener_medico().obtener_matricula(),
+        "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+        "especialidad": turno.obtener_especialidad(),
+    }
+
+
+def receta_a_dict(receta: Receta) -> dict:
+    return {
+        "dni": receta.obtener_paciente().obtener_dni(),
+        "matricula": receta.obtener_medico().obtener_matricula(),
+        "medicamentos": receta.obtener_medicamentos(),
+        "fecha": receta.obtener_fecha().isoformat(),
+    }
+
+
+def paciente_desde_dict(datos: dict, confiable: bool = False) -> Paciente:
+    """
+    Con `confiable` (datos leídos del almacenamiento propio) no se validan.
+    """
+    crear = hidratar_paciente if confiable else Paciente
+    return crear(
+        datos["nombre"],
+        datos["dni"],
+        datetime.fromisoformat(datos["fecha_nacimiento"]),
+    )
+
+
+def especialidad_desde_dict(datos: dict) -> Especialidad:
+    return Especialidad(datos["tipo"], datos["dias"])
+
+
+def medico_desde_dict(datos: dict, confiable: bool = False) -> Medico:
+    """
+    Con `confiable` (datos leídos del almacenamiento propio) no se validan nombre
+    ni matrícula.
+    """
+    crear = hidratar_medico if confiable else Medico
+    medico = crear(datos["nombre"], datos["matricula"])
+    for especialidad in datos["especialidades"]:
+        medico.agregar_especialidad(especialidad_desde_dict(especialidad))
+    return medico
+
+
+def turno_desde_dict(
+    datos: dict, pacientes: dict[str, Paciente], medicos: dict[str, Medico]
+) -> Turno:
+    return hidratar_turno(
+        pacientes[datos["dni"]],
+        medicos[datos["matricula"]],
+        datetime.fromisoformat(datos["fecha_hora"]),
+        datos["especialidad"],
+    )
+
+
+def receta_desde_dict(
+    datos: dict, pacientes: dict[str, Paciente], medicos: dict[str, Medico]
+) -> Receta:
+    return hidratar_receta(
+        pacientes[datos["dni"]],
+        medicos[datos["matricula"]],
+        datos["medicamentos"],
+        datetime.fromisoformat(datos["fecha"]),
+    )
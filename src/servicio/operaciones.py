@@ -0,0 +1,344 @@
+"""
+Operaciones de la clínica expresadas como datos: cada una recibe un diccionario de
+argumentos compatibles con JSON y devuelve un resultado también compatible con
+JSON. Las comparten las interfaces que no son la consola interactiva.
+
+Una solicitud tiene la forma {"op": nombre, "args": {...}} y puede llevar un "id"
+que se repite en la respuesta. La respuesta es {"ok": true, "resultado": ...} o
+{"ok": false, "error": clase de la excepción, "mensaje": ...}.
+"""
+
+from collections.abc import Iterator
+from datetime import date, datetime
+from ..models.clinica import Clinica
+from ..models.paciente import Paciente
+from ..models.especialidad import Especialidad
+from ..persistencia.serializacion import (
+    medico_desde_dict,
+    medico_a_dict,
+    paciente_a_dict,
+    receta_a_dict,
+    turno_a_dict,
+)
+from ..errors.custom_exception import CustomException, ValidacionError
+from ..errors.excepciones_clinica import OperacionDesconocidaError
+
+
+class Operacion:
+    """
+    Operación disponible para los servicios. Las que modifican la clínica indican
+    el argumento (matrícula o DNI) por el que deben serializarse con las demás.
+    """
+
+    def __init__(self, ejecutar, clave: str | None = None):
+        self.__ejecutar__ = ejecutar
+        self.__clave__ = clave
+
+    def ejecutar(self, clinica: Clinica, argumentos: dict):
+        return self.__ejecutar__(clinica, argumentos)
+
+    def obtener_clave(self, argumentos: dict) -> str | None:
+        """
+        Clave de serialización del pedido, por ejemplo "medico:M1", o None si la
+        operación es una consulta.
+        """
+        if self.__clave__ is None:
+            return None
+        tipo = "medico" if self.__clave__ == "matricula" else "paciente"
+        return f"{tipo}:{_texto(argumentos, self.__clave__)}"
+
+
+class Listado(Operacion):
+    """
+    Consulta que devuelve una lista posiblemente larga. Además de armarla completa
+    puede recorrerse elemento por elemento, para enviarla a medida que se convierte.
+    """
+
+    def __init__(self, obtener, convertir):
+        super().__init__(
+            lambda clinica, argumentos: list(self.iterar(clinica, argumentos))
+        )
+        self.__obtener__ = obtener
+        self.__convertir__ = convertir
+
+    def iterar(self, clinica: Clinica, argumentos: dict) -> Iterator:
+        """
+        Valida los argumentos y obtiene los elementos en el momento; la conversión
+        a diccionarios se hace a medida que se recorre.
+        """
+        return map(self.__convertir__, self.__obtener__(clinica, argumentos))
+
+
+def _argumento(argumentos: dict, nombre: str):
+    if nombre not in argumentos:
+        raise ValidacionError(f"Falta el argumento {nombre}")
+    return argumentos[nombre]
+
+
+def _texto(argumentos: dict, nombre: str) -> str:
+    valor = _argumento(argumentos, nombre)
+    if not isinstance(valor, str):
+        raise ValidacionError(f"El argumento {nombre} debe ser un texto")
+    return valor
+
+
+def _entero(argumentos: dict, nombre: str, predeterminado: int) -> int:
+    valor = argumentos.get(nombre, predeterminado)
+    if not isinstance(valor, int) or isinstance(valor, bool):
+        raise ValidacionError(f"El argumento {nombre} debe ser un entero")
+    return valor
+
+
+def _fecha_hora(argumentos: dict, nombre: str) -> datetime:
+    try:
+        fecha_hora = datetime.fromisoformat(_texto(argumentos, nombre))
+    except ValueError:
+        raise ValidacionError(
+            f"El argumento {nombre} debe tener formato ISO (aaaa-mm-ddThh:mm)"
+        )
+    # La clínica trabaja con fechas y horas locales sin zona horaria; una con zona
+    # no se puede comparar con ellas.
+    if fecha_hora.tzinfo is not None:
+        raise ValidacionError(
+            f"El argumento {nombre} no debe indicar zona horaria (aaaa-mm-ddThh:mm)"
+        )
+    return fecha_hora
+
+
+def _fecha(argumentos: dict, nombre: str) -> date:
+    try:
+        return date.fromisoformat(_texto(argumentos, nombre))
+    except ValueError:
+        raise ValidacionError(f"El argumento {nombre} debe tener formato aaaa-mm-dd")
+
+
+def _fecha_opcional(argumentos: dict, nombre: str) -> date | None:
+    return _fecha(argumentos, nombre) if argumentos.get(nombre) is not None else None
+
+
+def _lista_de_textos(argumentos: dict, nombre: str) -> list[str]:
+    valor = _argumento(argumentos, nombre)
+    if not isinstance(valor, list) or not all(isinstance(v, str) for v in valor):
+        raise ValidacionError(f"El argumento {nombre} debe ser una lista de textos")
+    return valor
+
+
+def _agregar_paciente(clinica: Clinica, argumentos: dict) -> dict:
+    paciente = Paciente(
+        _texto(argumentos, "nombre"),
+        _texto(argumentos, "dni"),
+        _fecha_hora(argumentos, "fecha_nacimiento"),
+        clinica.obtener_reloj().ahora(),
+    )
+    clinica.agregar_paciente(paciente)
+    return paciente_a_dict(paciente)
+
+
+def _agregar_medico(clinica: Clinica, argumentos: dict) -> dict:
+    try:
+        medico = medico_desde_dict(
+            {
+                "nombre": _texto(argumentos, "nombre"),
+                "matricula": _texto(argumentos, "matricula"),
+                "especialidades": argumentos.get("especialidades", []),
+            }
+        )
+    except (KeyError, TypeError):
+        raise ValidacionError(
+            "Cada especialidad debe tener la forma {tipo: ..., dias: [...]}"
+        )
+    clinica.agregar_medico(medico)
+    return medico_a_dict(medico)
+
+
+def _agregar_especialidad(clinica: Clinica, argumentos: dict) -> dict:
+    matricula = _texto(argumentos, "matricula")
+    especialidad = Especialidad(
+        _texto(argumentos, "tipo"), _lista_de_textos(argumentos, "dias")
+    )
+    clinica.agregar_especialidad_a_medico(matricula, especialidad)
+    return medico_a_dict(clinica.obtener_medico_por_matricula(matricula))
+
+
+def _agendar_turno(clinica: Clinica, argumentos: dict) -> dict:
+    turno = clinica.agendar_turno(
+        _texto(argumentos, "dni"),
+        _texto(argumentos, "matricula"),
+        _texto(argumentos, "especialidad"),
+        _fecha_hora(argumentos, "fecha_hora"),
+    )
+    return turno_a_dict(turno)
+
+
+def _cancelar_turno(clinica: Clinica, argumentos: dict) -> dict:
+    turno = clinica.cancelar_turno(
+        _texto(argumentos, "matricula"), _fecha_hora(argumentos, "fecha_hora")
+    )
+    return turno_a_dict(turno)
+
+
+def _emitir_receta(clinica: Clinica, argumentos: dict) -> dict:
+    receta = clinica.emitir_receta(
+        _texto(argumentos, "dni"),
+        _texto(argumentos, "matricula"),
+        _lista_de_textos(argumentos, "medicamentos"),
+    )
+    return receta_a_dict(receta)
+
+
+def _obtener_historia_clinica(clinica: Clinica, argumentos: dict) -> dict:
+    historia = clinica.obtener_historia_clinica(_texto(argumentos, "dni"))
+    return {
+        "paciente": paciente_a_dict(historia.obtener_paciente()),
+        "turnos": [turno_a_dict(t) for t in historia.obtener_turnos()],
+        "recetas": [receta_a_dict(r) for r in historia.obtener_recetas()],
+    }
+
+
+def _obtener_resumen_historia_clinica(clinica: Clinica, argumentos: dict) -> dict:
+    resumen = clinica.obtener_historia_clinica(
+        _texto(argumentos, "dni")
+    ).obtener_resumen()
+    if resumen["ultimo_turno"] is not None:
+        resumen["ultimo_turno"] = resumen["ultimo_turno"].isoformat()
+    return resumen
+
+
+def _obtener_resumen_general(clinica: Clinica, argumentos: dict) -> dict:
+    return clinica.obtener_resumen_general()
+
+
+def _contar_recetas_por_medicamento(clinica: Clinica, argumentos: dict) -> dict:
+    return clinica.contar_recetas_por_medicamento(
+        _fecha_opcional(argumentos, "desde"), _fecha_opcional(argumentos, "hasta")
+    )
+
+
+def _obtener_medico(clinica: Clinica, argumentos: dict) -> dict:
+    return medico_a_dict(
+        clinica.obtener_medico_por_matricula(_texto(argumentos, "matricula"))
+    )
+
+
+def _buscar_pacientes(clinica: Clinica, argumentos: dict) -> list[dict]:
+    return [
+        paciente_a_dict(paciente)
+        for paciente in clinica.buscar_pacientes(
+            _texto(argumentos, "texto"), _entero(argumentos, "limite", 10)
+        )
+    ]
+
+
+def _buscar_horarios_libres(clinica: Clinica, argumentos: dict) -> list[dict]:
+    return [
+        {"fecha_hora": fecha_hora.isoformat(), "matricula": medico.obtener_matricula()}
+        for fecha_hora, medico in clinica.buscar_horarios_libres(
+            _texto(argumentos, "especialidad"),
+            _fecha_hora(argumentos, "desde"),
+            _entero(argumentos, "cantidad", 10),
+        )
+    ]
+
+
+OPERACIONES: dict[str, Operacion] = {
+    "agregar_paciente": Operacion(_agregar_paciente, clave="dni"),
+    "agregar_medico": Operacion(_agregar_medico, clave="matricula"),
+    "agregar_especialidad": Operacion(_agregar_especialidad, clave="matricula"),
+    "agendar_turno": Operacion(_agendar_turno, clave="matricula"),
+    "cancelar_turno": Operacion(_cancelar_turno, clave="matricula"),
+    "emitir_receta": Operacion(_emitir_receta, clave="dni"),
+    "obtener_historia_clinica": Operacion(_obtener_historia_clinica),
+    "obtener_resumen_historia_clinica": Operacion(_obtener_resumen_historia_clinica),
+    "obtener_resumen_general": Operacion(_obtener_resumen_general),
+    "obtener_pacientes": Listado(
+        lambda clinica, _: clinica.obtener_pacientes(), paciente_a_dict
+    ),
+    "obtener_medicos": Listado(
+        lambda clinica, _: clinica.obtener_medicos(), medico_a_dict
+    ),
+    "obtener_medico": Operacion(_obtener_medico),
+    "obtener_turnos": Listado(
+        lambda clinica, _: clinica.obtener_turnos(), turno_a_dict
+    ),
+    "obtener_turnos_de_paciente": Listado(
+        lambda c, a: c.obtener_turnos_de_paciente(_texto(a, "dni")), turno_a_dict
+    ),
+    "obtener_turnos_de_medico": Listado(
+        lambda c, a: c.obtener_turnos_de_medico(_texto(a, "matricula")),
+        turno_a_dict,
+    ),
+    "obtener_turnos_de_especialidad": Listado(
+        lambda c, a: c.obtener_turnos_de_especialidad(_texto(a, "especialidad")),
+        turno_a_dict,
+    ),
+    "obtener_turnos_de_fecha": Listado(
+        lambda c, a: c.obtener_turnos_de_fecha(_fecha(a, "fecha")), turno_a_dict
+    ),
+    "obtener_pacientes_con_medicamento": Listado(
+        lambda c, a: c.obtener_pacientes_con_medicamento(
+            _texto(a, "medicamento"),
+            _fecha_opcional(a, "desde"),
+            _fecha_opcional(a, "hasta"),
+        ),
+        paciente_a_dict,
+    ),
+    "obtener_recetas_con_medicamento": Listado(
+        lambda c, a: c.obtener_recetas_con_medicamento(
+            _texto(a, "medicamento"),
+            _fecha_opcional(a, "desde"),
+            _fecha_opcional(a, "hasta"),
+        ),
+        receta_a_dict,
+    ),
+    "contar_recetas_por_medicamento": Operacion(_contar_recetas_por_medicamento),
+    "buscar_pacientes": Operacion(_buscar_pacientes),
+    "buscar_horarios_libres": Operacion(_buscar_horarios_libres),
+}
+
+
+def obtener_operacion(nombre: str) -> Operacion:
+    if nombre not in OPERACIONES:
+        raise OperacionDesconocidaError(nombre)
+    return OPERACIONES[nombre]
+
+
+def leer_solicitud(solicitud) -> tuple[Operacion, dict]:
+    """
+    Valida la forma de una solicitud y devuelve la operación y sus argumentos.
+    """
+    if not isinstance(solicitud, dict) or not isinstance(solicitud.get("op"), str):
+        raise ValidacionError('La solicitud debe ser un objeto con el campo "op"')
+    argumentos = solicitud.get("args", {})
+    if not isinstance(argumentos, dict):
+        raise ValidacionError('El campo "args" debe ser un objeto')
+    return obtener_operacion(solicitud["op"]), argumentos
+
+
+def respuesta_exitosa(solicitud, resultado) -> dict:
+    return _con_id(solicitud, {"ok": True, "resultado": resultado})
+
+
+def respuesta_de_error(solicitud, error: CustomException) -> dict:
+    return _con_id(
+        solicitud,
+        {"ok": False, "error": type(error).__name__, "mensaje": error.message},
+    )
+
+
+def responder(clinica: Clinica, solicitud) -> dict:
+    """
+    Ejecuta una solicitud y devuelve su respuesta. Los errores de la clínica (las
+    subclases de CustomException) se informan en la respuesta.
+    """
+    try:
+        operacion, argumentos = leer_solicitud(solicitud)
+        resultado = operacion.ejecutar(clinica, argumentos)
+    except CustomException as e:
+        return respuesta_de_error(solicitud, e)
+    return respuesta_exitosa(solicitud, resultado)
+
+
+def _con_id(solicitud, respuesta: dict) -> dict:
+    if isinstance(solicitud, dict) and "id" in solicitud:
+        return {"id": solicitud["id"], **respuesta}
+    return respuesta
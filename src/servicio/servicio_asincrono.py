@@ -0,0 +1,235 @@
+"""
+Servicio asyncio sobre una Clinica, para atender muchos pedidos concurrentes en
+lugar de la consola interactiva, que se bloquea esperando cada input().
+"""
+
+import asyncio
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from ..models.clinica import Clinica
+from ..errors.custom_exception import CustomException, ValidacionError
+from .operaciones import (
+    Operacion,
+    leer_solicitud,
+    obtener_operacion,
+    respuesta_de_error,
+    respuesta_exitosa,
+)
+
+
+class ServicioClinica:
+    """
+    Fachada asíncrona de la clínica. Los pedidos que la modifican se encolan por
+    médico o por paciente (según la operación) y cada cola los atiende en orden:
+    toma todos los acumulados, hasta `tamano_lote`, y los ejecuta en un hilo del
+    ejecutor dentro de un solo grupo de escrituras del repositorio, y responde
+    recién cuando el grupo quedó confirmado (si la confirmación falla, todos los
+    pedidos del lote reciben el error). Las colas de claves distintas avanzan en
+    paralelo (la clínica se pasa a modo concurrente) y el bucle de eventos nunca
+    espera al disco. Las consultas van directo al ejecutor.
+    """
+
+    def __init__(self, clinica: Clinica, tamano_lote: int = 64, hilos: int = 4):
+        if tamano_lote < 1:
+            raise ValidacionError("El tamaño de lote debe ser al menos 1")
+        clinica.habilitar_concurrencia()
+        self.__clinica__ = clinica
+        self.__tamano_lote__ = tamano_lote
+        self.__ejecutor__ = ThreadPoolExecutor(
+            max_workers=hilos, thread_name_prefix="clinica"
+        )
+        self.__colas__: dict[str, deque] = {}
+        self.__tareas__: set[asyncio.Task] = set()
+
+    async def ejecutar(self, operacion: str, argumentos: dict | None = None):
+        """
+        Ejecuta una operación de `operaciones.OPERACIONES` y devuelve su resultado
+        compatible con JSON. Los errores de la clínica se propagan.
+        """
+        return await self.__ejecutar__(obtener_operacion(operacion), argumentos or {})
+
+    async def responder(self, solicitud) -> dict:
+        """
+        Versión asíncrona de operaciones.responder: nunca lanza CustomException.
+        """
+        try:
+            operacion, argumentos = leer_solicitud(solicitud)
+            resultado = await self.__ejecutar__(operacion, argumentos)
+        except CustomException as e:
+            return respuesta_de_error(solicitud, e)
+        return respuesta_exitosa(solicitud, resultado)
+
+    async def agendar_turno(
+        self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime
+    ) -> dict:
+        return await self.ejecutar(
+            "agendar_turno",
+            {
+                "dni": dni,
+                "matricula": matricula,
+                "especialidad": especialidad,
+                "fecha_hora": fecha_hora.isoformat(),
+            },
+        )
+
+    async def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> dict:
+        return await self.ejecutar(
+            "cancelar_turno",
+            {"matricula": matricula, "fecha_hora": fecha_hora.isoformat()},
+        )
+
+    async def emitir_receta(
+        self, dni: str, matricula: str, medicamentos: list[str]
+    ) -> dict:
+        return await self.ejecutar(
+            "emitir_receta",
+            {"dni": dni, "matricula": matricula, "medicamentos": medicamentos},
+        )
+
+    async def obtener_historia_clinica(self, dni: str) -> dict:
+        return await self.ejecutar("obtener_historia_clinica", {"dni": dni})
+
+    async def buscar_horarios_libres(
+        self, especialidad: str, desde: datetime, cantidad: int = 10
+    ) -> list[dict]:
+        return await self.ejecutar(
+            "buscar_horarios_libres",
+            {
+                "especialidad": especialidad,
+                "desde": desde.isoformat(),
+                "cantidad": cantidad,
+            },
+        )
+
+    async def servir(self, host: str = "127.0.0.1", puerto: int = 0):
+        """
+        Atiende conexiones TCP que envían una solicitud JSON por línea. Cada línea
+        se procesa en cuanto llega y su respuesta (con el mismo "id") se escribe
+        al terminar, así que un cliente puede tener muchos pedidos en curso. Solo
+        se garantiza el orden entre pedidos de la misma cola: para leer algo recién
+        escrito hay que esperar antes la respuesta de la escritura.
+        Devuelve el asyncio.Server; el puerto asignado se obtiene de sus sockets.
+        """
+        return await asyncio.start_server(self.__atender_conexion__, host, puerto)
+
+    async def cerrar(self) -> None:
+        """
+        Espera a que se atiendan los pedidos encolados y libera los hilos.
+        """
+        while self.__tareas__:
+            await asyncio.gather(*self.__tareas__)
+        self.__ejecutor__.shutdown()
+
+    async def __ejecutar__(self, operacion: Operacion, argumentos: dict):
+        clave = operacion.obtener_clave(argumentos)
+        bucle = asyncio.get_running_loop()
+        if clave is None:
+            return await bucle.run_in_executor(
+                self.__ejecutor__, operacion.ejecutar, self.__clinica__, argumentos
+            )
+        futuro = bucle.create_future()
+        cola = self.__colas__.get(clave)
+        if cola is None:
+            cola = self.__colas__[clave] = deque()
+            tarea = asyncio.create_task(self.__atender_cola__(clave, cola))
+            self.__tareas__.add(tarea)
+            tarea.add_done_callback(self.__tareas__.discard)
+        cola.append((operacion, argumentos, futuro))
+        return await futuro
+
+    async def __atender_cola__(self, clave: str, cola: deque) -> None:
+        bucle = asyncio.get_running_loop()
+        while cola:
+            lote = [cola.popleft() for _ in range(min(len(cola), self.__tamano_lote__))]
+            try:
+                resultados = await bucle.run_in_executor(
+                    self.__ejecutor__, self.__ejecutar_lote__, lote
+                )
+            except Exception as e:
+                resultados = [(False, e)] * len(lote)
+            for (_, _, futuro), (exito, valor) in zip(lote, resultados):
+                if futuro.done():
+                    continue
+                if exito:
+                    futuro.set_result(valor)
+                else:
+                    futuro.set_exception(valor)
+        del self.__colas__[clave]
+
+    def __ejecutar_lote__(self, lote: list) -> list[tuple[bool, object]]:
+        resultados = []
+        with self.__clinica__.agrupar_escrituras():
+            for operacion, argumentos, _ in lote:
+                try:
+                    resultados.append(
+                        (True, operacion.ejecutar(self.__clinica__, argumentos))
+                    )
+                except Exception as e:
+                    resultados.append((False, e))
+        return resultados
+
+    async def __atender_conexion__(self, lector, escritor) -> None:
+        respuestas: asyncio.Queue = asyncio.Queue()
+        escritura = asyncio.create_task(self.__escribir__(escritor, respuestas))
+        pendientes: set[asyncio.Task] = set()
+        try:
+            while linea := await lector.readline():
+                if not linea.strip():
+                    continue
+                tarea = asyncio.create_task(self.__responder_linea__(linea, respuestas))
+                pendientes.add(tarea)
+                tarea.add_done_callback(pendientes.discard)
+            if pendientes:
+                await asyncio.wait(pendientes)
+        except ConnectionError:
+            pass
+        finally:
+            respuestas.put_nowait(None)
+            await escritura
+
+    async def __responder_linea__(self, linea: bytes, respuestas: asyncio.Queue):
+        solicitud = None
+        try:
+            solicitud = json.loads(linea)
+            respuesta = await self.responder(solicitud)
+        except ValueError:
+            respuesta = respuesta_de_error(
+                None, ValidacionError("La línea no es un JSON válido")
+            )
+        except Exception as e:
+            respuesta = respuesta_de_error(
+                solicitud, CustomException(f"Error inesperado: {e}")
+            )
+        respuestas.put_nowait(respuesta)
+
+    async def __escribir__(self, escritor, respuestas: asyncio.Queue) -> None:
+        try:
+            while (respuesta := await respuestas.get()) is not None:
+                escritor.write(
+                    json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n"
+                )
+                if respuestas.empty():
+                    await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def servir_para_siempre(
+    clinica: Clinica, host: str = "127.0.0.1", puerto: int = 8765
+) -> None:
+    servicio = ServicioClinica(clinica)
+    servidor = await servicio.servir(host, puerto)
+    print(f"Atendiendo solicitudes JSON por línea en {host}:{puerto}")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        await servicio.cerrar()
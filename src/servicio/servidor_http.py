@@ -0,0 +1,233 @@
+"""
+API HTTP/JSON de la clínica sobre la biblioteca estándar. Rutas:
+
+- POST /operaciones/<nombre>: el cuerpo son los argumentos de la operación y la
+  respuesta es la de operaciones.responder, enviada una vez confirmada la
+  escritura.
+- POST /lote: el cuerpo es una lista de solicitudes {"op", "args", "id"} que se
+  ejecutan en orden, con las escrituras confirmadas juntas; se responde la lista
+  de respuestas.
+- GET /pacientes, /medicos y /turnos (filtrable con ?dni=, ?matricula=,
+  ?especialidad= o ?fecha=): listados en NDJSON, enviados por partes a medida
+  que se serializan.
+
+Las conexiones se mantienen abiertas entre pedidos (HTTP/1.1) y cada una se
+atiende en su propio hilo, con la clínica en modo concurrente.
+"""
+
+import json
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+from ..models.clinica import Clinica
+from ..errors.custom_exception import CustomException, ValidacionError
+from ..errors.excepciones_clinica import (
+    MedicoNoEncontradoError,
+    MedicoYaRegistradoError,
+    OperacionDesconocidaError,
+    PacienteNoEncontradoError,
+    PacienteYaRegistradoError,
+    PersistenciaError,
+    TurnoNoEncontradoError,
+    TurnoOcupadoError,
+)
+from .operaciones import (
+    leer_solicitud,
+    obtener_operacion,
+    respuesta_de_error,
+    respuesta_exitosa,
+)
+
+TAMANO_PARTE = 64 * 1024
+TAMANO_MAXIMO_CUERPO = 16 * 1024 * 1024
+
+ESTADOS_POR_ERROR = {
+    PacienteNoEncontradoError: HTTPStatus.NOT_FOUND,
+    MedicoNoEncontradoError: HTTPStatus.NOT_FOUND,
+    TurnoNoEncontradoError: HTTPStatus.NOT_FOUND,
+    OperacionDesconocidaError: HTTPStatus.NOT_FOUND,
+    PacienteYaRegistradoError: HTTPStatus.CONFLICT,
+    MedicoYaRegistradoError: HTTPStatus.CONFLICT,
+    TurnoOcupadoError: HTTPStatus.CONFLICT,
+    PersistenciaError: HTTPStatus.INTERNAL_SERVER_ERROR,
+}
+
+# Filtro de /turnos -> operación que lo resuelve con un índice.
+LISTADOS_DE_TURNOS = {
+    "dni": "obtener_turnos_de_paciente",
+    "matricula": "obtener_turnos_de_medico",
+    "especialidad": "obtener_turnos_de_especialidad",
+    "fecha": "obtener_turnos_de_fecha",
+}
+
+
+def _error_inesperado(error: Exception) -> CustomException:
+    return CustomException(f"Error inesperado: {error}")
+
+
+class ManejadorClinica(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Encabezados y cuerpo se envían por separado: sin esto Nagle demora cada
+    # respuesta de una conexión reutilizada.
+    disable_nagle_algorithm = True
+    server: "ServidorClinica"
+
+    def do_POST(self):
+        ruta = urlsplit(self.path).path
+        try:
+            cuerpo = self.__leer_cuerpo__()
+            if ruta == "/lote":
+                self.__responder_lote__(cuerpo)
+            elif ruta.startswith("/operaciones/"):
+                solicitud = {"op": ruta.removeprefix("/operaciones/"), "args": cuerpo}
+                operacion, argumentos = leer_solicitud(solicitud)
+                clinica = self.server.obtener_clinica()
+                # Como en /lote, la respuesta sale recién con la escritura
+                # confirmada, aunque otra conexión tenga un grupo abierto.
+                with clinica.agrupar_escrituras():
+                    resultado = operacion.ejecutar(clinica, argumentos)
+                self.__enviar_json__(HTTPStatus.OK, respuesta_exitosa(None, resultado))
+            else:
+                self.__enviar_error_de_ruta__()
+        except Exception as e:
+            self.__enviar_excepcion__(e)
+
+    def do_GET(self):
+        partes = urlsplit(self.path)
+        argumentos = dict(parse_qsl(partes.query))
+        if partes.path == "/pacientes":
+            nombre = "obtener_pacientes"
+        elif partes.path == "/medicos":
+            nombre = "obtener_medicos"
+        elif partes.path == "/turnos":
+            filtros = [f for f in LISTADOS_DE_TURNOS if f in argumentos]
+            nombre = LISTADOS_DE_TURNOS[filtros[0]] if filtros else "obtener_turnos"
+        else:
+            self.__enviar_error_de_ruta__()
+            return
+        try:
+            elementos = obtener_operacion(nombre).iterar(
+                self.server.obtener_clinica(), argumentos
+            )
+        except Exception as e:
+            self.__enviar_excepcion__(e)
+            return
+        self.__enviar_ndjson__(elementos)
+
+    def log_message(self, format, *args):
+        if self.server.registra_pedidos():
+            super().log_message(format, *args)
+
+    def __leer_cuerpo__(self):
+        try:
+            longitud = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            longitud = -1
+        if not 0 <= longitud <= TAMANO_MAXIMO_CUERPO:
+            self.close_connection = True
+            raise ValidacionError("Content-Length inválido")
+        datos = self.rfile.read(longitud) if longitud else b"{}"
+        try:
+            return json.loads(datos)
+        except ValueError:
+            raise ValidacionError("El cuerpo no es un JSON válido")
+
+    def __responder_lote__(self, solicitudes):
+        if not isinstance(solicitudes, list):
+            raise ValidacionError("El cuerpo de /lote debe ser una lista")
+        clinica = self.server.obtener_clinica()
+        respuestas = []
+        with clinica.agrupar_escrituras():
+            for solicitud in solicitudes:
+                try:
+                    operacion, argumentos = leer_solicitud(solicitud)
+                    resultado = operacion.ejecutar(clinica, argumentos)
+                except CustomException as e:
+                    respuestas.append(respuesta_de_error(solicitud, e))
+                except Exception as e:
+                    respuestas.append(
+                        respuesta_de_error(solicitud, _error_inesperado(e))
+                    )
+                else:
+                    respuestas.append(respuesta_exitosa(solicitud, resultado))
+        self.__enviar_json__(HTTPStatus.OK, respuestas)
+
+    def __enviar_excepcion__(self, error: Exception) -> None:
+        """
+        Responde con el error como JSON: los de la clínica según su tipo y
+        cualquier otro como 500, sin cortar la conexión.
+        """
+        if isinstance(error, CustomException):
+            estado = ESTADOS_POR_ERROR.get(type(error), HTTPStatus.BAD_REQUEST)
+        else:
+            estado = HTTPStatus.INTERNAL_SERVER_ERROR
+            error = _error_inesperado(error)
+        self.__enviar_json__(estado, respuesta_de_error(None, error))
+
+    def __enviar_error_de_ruta__(self):
+        self.__enviar_json__(
+            HTTPStatus.NOT_FOUND,
+            {"ok": False, "error": "RutaInexistente", "mensaje": self.path},
+        )
+
+    def __enviar_json__(self, estado: HTTPStatus, contenido) -> None:
+        datos = json.dumps(contenido, ensure_ascii=False).encode("utf-8")
+        self.send_response(estado)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def __enviar_ndjson__(self, elementos) -> None:
+        """
+        Envía un objeto JSON por línea con codificación chunked, juntando líneas
+        hasta TAMANO_PARTE para no hacer una escritura por elemento.
+        """
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        codificar = json.JSONEncoder(ensure_ascii=False).encode
+        parte = []
+        tamano = 0
+        for elemento in elementos:
+            linea = (codificar(elemento) + "\n").encode("utf-8")
+            parte.append(linea)
+            tamano += len(linea)
+            if tamano >= TAMANO_PARTE:
+                self.__enviar_parte__(b"".join(parte))
+                parte.clear()
+                tamano = 0
+        if parte:
+            self.__enviar_parte__(b"".join(parte))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def __enviar_parte__(self, datos: bytes) -> None:
+        self.wfile.write(b"%X\r\n%s\r\n" % (len(datos), datos))
+
+
+class ServidorClinica(ThreadingHTTPServer):
+    """
+    Servidor HTTP de la clínica; con puerto 0 el sistema elige uno libre, que se
+    obtiene de `server_address`.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        clinica: Clinica,
+        host: str = "127.0.0.1",
+        puerto: int = 8080,
+        registrar_pedidos: bool = False,
+    ):
+        clinica.habilitar_concurrencia()
+        self.__clinica__ = clinica
+        self.__registrar_pedidos__ = registrar_pedidos
+        super().__init__((host, puerto), ManejadorClinica)
+
+    def obtener_clinica(self) -> Clinica:
+        return self.__clinica__
+
+    def registra_pedidos(self) -> bool:
+        return self.__registrar_pedidos__
@@ -1,5 +1,97 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from enum import IntEnum
+from functools import lru_cache
+from ..errors.custom_exception import ValidacionError
+
+DIAS_SEMANA = [
+    "lunes",
+    "martes",
+    "miercoles",
+    "jueves",
+    "viernes",
+    "sabados",
+    "domingos",
+]
+
+
+class DiaSemana(IntEnum):
+    """
+    Días de la semana con los mismos números que datetime.weekday().
+    """
+
+    LUNES = 0
+    MARTES = 1
+    MIERCOLES = 2
+    JUEVES = 3
+    VIERNES = 4
+    SABADO = 5
+    DOMINGO = 6
+
+    def obtener_nombre(self) -> str:
+        return DIAS_SEMANA[self]
+
+
+# Variantes aceptadas para cada día.
+_NUMERO_DIA = {
+    "lunes": DiaSemana.LUNES,
+    "martes": DiaSemana.MARTES,
+    "miercoles": DiaSemana.MIERCOLES,
+    "miércoles": DiaSemana.MIERCOLES,
+    "jueves": DiaSemana.JUEVES,
+    "viernes": DiaSemana.VIERNES,
+    "sabado": DiaSemana.SABADO,
+    "sábado": DiaSemana.SABADO,
+    "sabados": DiaSemana.SABADO,
+    "sábados": DiaSemana.SABADO,
+    "domingo": DiaSemana.DOMINGO,
+    "domingos": DiaSemana.DOMINGO,
+}
 
 
 def formatear_fecha(fecha: datetime) -> str:
     return fecha.strftime("%d/%m/%Y")
+
+
+@lru_cache(maxsize=4096)
+def formatear_fecha_hora(fecha_hora: datetime) -> str:
+    """
+    Fecha y hora como "dd/mm/aaaa HH:MM". Los turnos se repiten en pocos horarios
+    distintos, así que se guardan los textos más recientes en lugar de volver a
+    llamar a strftime por cada uno.
+    """
+    return fecha_hora.strftime("%d/%m/%Y %H:%M")
+
+
+def obtener_numero_dia(dia: str) -> DiaSemana | None:
+    """
+    Devuelve el día (0 = lunes, como datetime.weekday()) para un nombre de día en
+    español, o None si no se reconoce.
+    """
+    return _NUMERO_DIA.get(dia.strip().lower())
+
+
+def generar_fechas_recurrentes(
+    inicio: datetime,
+    hasta: datetime,
+    dias_semana: list[int],
+    cada_semanas: int = 1,
+) -> list[datetime]:
+    """
+    Genera las fechas entre inicio y hasta (inclusive) que caen en los días de la
+    semana indicados (0 = lunes), con la hora de inicio y repitiendo cada
+    `cada_semanas` semanas a partir de la semana de inicio.
+    """
+    if not isinstance(cada_semanas, int) or cada_semanas < 1:
+        raise ValidacionError("cada_semanas debe ser un entero mayor a cero")
+    if any(not isinstance(dia, int) or not 0 <= dia <= 6 for dia in dias_semana):
+        raise ValidacionError("Los días de la semana deben estar entre 0 y 6")
+    fechas = []
+    dias = sorted(set(dias_semana))
+    semana = inicio - timedelta(days=inicio.weekday())
+    while semana <= hasta:
+        for dia in dias:
+            fecha = semana + timedelta(days=dia)
+            if inicio <= fecha <= hasta:
+                fechas.append(fecha)
+        semana += timedelta(weeks=cada_semanas)
+    return fechas
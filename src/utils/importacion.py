@@ -0,0 +1,153 @@
+import csv
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from functools import lru_cache
+from ..errors.custom_exception import CustomException, ValidacionError
+from ..models.paciente import Paciente
+from ..models.medico import Medico
+from ..models.especialidad import Especialidad
+
+
+class ResultadoImportacion:
+    """
+    Resultado de una importación masiva: cantidad de registros incorporados y
+    errores por fila (numeradas desde 1).
+    """
+
+    def __init__(self):
+        self.__importados__ = 0
+        self.__errores__: list[tuple[int, CustomException]] = []
+
+    def registrar_importados(self, cantidad: int) -> None:
+        self.__importados__ += cantidad
+
+    def registrar_error(self, fila: int, error: CustomException) -> None:
+        self.__errores__.append((fila, error))
+
+    def obtener_cantidad_importados(self) -> int:
+        return self.__importados__
+
+    def obtener_errores(self) -> list[tuple[int, CustomException]]:
+        return list(self.__errores__)
+
+    def __str__(self) -> str:
+        return f"Importados: {self.__importados__} - Errores: {len(self.__errores__)}"
+
+
+def leer_csv(ruta: str) -> Iterator[dict]:
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        yield from csv.DictReader(archivo)
+
+
+def leer_jsonl(ruta: str) -> Iterator[str]:
+    """
+    Devuelve las líneas no vacías sin interpretar: cada una se decodifica al
+    convertirla en registro, para que una línea inválida sea un error de esa fila.
+    """
+    with open(ruta, encoding="utf-8") as archivo:
+        for linea in archivo:
+            if linea.strip():
+                yield linea
+
+
+def leer_registros(ruta: str) -> Iterator[dict | str]:
+    """
+    Lee registros de un archivo CSV o JSONL según su extensión, de a uno por vez.
+    """
+    if ruta.endswith(".csv"):
+        return leer_csv(ruta)
+    if ruta.endswith(".jsonl"):
+        return leer_jsonl(ruta)
+    raise ValidacionError(f"Formato de archivo no soportado: {ruta}")
+
+
+def paciente_desde_registro(
+    registro: dict | str, ahora: datetime | None = None
+) -> Paciente:
+    registro = _leer_registro(registro)
+    fecha_nacimiento = _obtener_campo(registro, "fecha_nacimiento")
+    if isinstance(fecha_nacimiento, str):
+        fecha_nacimiento = _leer_fecha(fecha_nacimiento)
+    return Paciente(
+        _obtener_campo(registro, "nombre"),
+        _obtener_campo(registro, "dni"),
+        fecha_nacimiento,
+        ahora,
+    )
+
+
+def medico_desde_registro(registro: dict | str) -> Medico:
+    """
+    Crea un médico a partir de un registro. Las especialidades pueden venir como
+    lista de objetos {"tipo", "dias"} o como texto "tipo:dia,dia;tipo:dia".
+    """
+    registro = _leer_registro(registro)
+    medico = Medico(
+        _obtener_campo(registro, "nombre"),
+        _obtener_campo(registro, "matricula"),
+    )
+    especialidades = registro.get("especialidades") or []
+    if isinstance(especialidades, str):
+        especialidades = _leer_especialidades(especialidades)
+    if not isinstance(especialidades, list):
+        raise ValidacionError("Las especialidades deben ser una lista o un texto")
+    for especialidad in especialidades:
+        if not isinstance(especialidad, dict):
+            raise ValidacionError("Especialidad con formato inválido")
+        medico.agregar_especialidad(
+            Especialidad(
+                _obtener_campo(especialidad, "tipo"),
+                _obtener_campo(especialidad, "dias"),
+            )
+        )
+    return medico
+
+
+def _leer_registro(registro: dict | str) -> dict:
+    """
+    Decodifica una línea JSONL y verifica que el registro sea un objeto.
+    """
+    if isinstance(registro, str):
+        try:
+            registro = json.loads(registro)
+        except json.JSONDecodeError as e:
+            raise ValidacionError(f"Línea JSON inválida: {e.msg}") from None
+    if not isinstance(registro, dict):
+        raise ValidacionError("El registro debe ser un objeto")
+    return registro
+
+
+def _obtener_campo(registro: dict, campo: str):
+    if campo not in registro or registro[campo] is None:
+        raise ValidacionError(f"Falta el campo {campo}")
+    return registro[campo]
+
+
+# Las fechas de nacimiento se repiten mucho en un lote grande; strptime es la
+# parte más cara de cada fila.
+@lru_cache(maxsize=65536)
+def _leer_fecha(texto: str) -> datetime:
+    try:
+        return datetime.strptime(texto.strip(), "%d-%m-%Y")
+    except ValueError:
+        raise ValidacionError(
+            f"Fecha inválida '{texto}'. Use el formato dd-mm-yyyy"
+        ) from None
+
+
+def _leer_especialidades(texto: str) -> list[dict]:
+    especialidades = []
+    for parte in texto.split(";"):
+        if not parte.strip():
+            continue
+        tipo, separador, dias = parte.partition(":")
+        if not separador:
+            raise ValidacionError(f"Especialidad sin días de atención: {parte}")
+        especialidades.append(
+            {
+                "tipo": tipo.strip(),
+                "dias": [dia.strip() for dia in dias.split(",") if dia.strip()],
+            }
+        )
+    return especialidades
@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta
+
+
+class Reloj:
+    """
+    Fuente de la fecha y hora actual de la clínica. Las operaciones en lote la leen
+    una sola vez y usan ese valor para todos sus elementos.
+    """
+
+    def ahora(self) -> datetime:
+        return datetime.now()
+
+
+class RelojCongelado(Reloj):
+    """
+    Reloj que siempre devuelve la misma fecha y hora, salvo que se lo avance a mano.
+    Sirve para reproducir operaciones y para pruebas y benchmarks deterministas.
+    """
+
+    def __init__(self, fecha_hora: datetime):
+        self.__fecha_hora__ = fecha_hora
+
+    def ahora(self) -> datetime:
+        return self.__fecha_hora__
+
+    def avanzar(self, intervalo: timedelta) -> None:
+        self.__fecha_hora__ += intervalo
+
+
+RELOJ_SISTEMA = Reloj()
@@ -0,0 +1,29 @@
+from collections.abc import Iterator, Sequence
+
+
+class VistaSecuencia(Sequence):
+    """
+    Vista de solo lectura sobre una lista: permite recorrerla, indexarla y medirla
+    sin copiarla, y refleja los cambios posteriores de la lista original.
+    """
+
+    def __init__(self, elementos: list):
+        self.__elementos__ = elementos
+
+    def __getitem__(self, indice):
+        return self.__elementos__[indice]
+
+    def __len__(self) -> int:
+        return len(self.__elementos__)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__elementos__)
+
+    def __reversed__(self) -> Iterator:
+        return reversed(self.__elementos__)
+
+    def __contains__(self, elemento) -> bool:
+        return elemento in self.__elementos__
+
+    def __repr__(self) -> str:
+        return f"VistaSecuencia({self.__elementos__!r})"
@@ -0,0 +1,61 @@
+import sys
+from threading import Lock
+
+
+class Vocabulario:
+    """
+    Vocabulario compartido de nombres: a cada nombre, sin distinguir mayúsculas ni
+    espacios en los extremos, le asigna un código entero estable. El primer nombre
+    registrado queda como forma canónica y se guarda internado.
+    """
+
+    def __init__(self):
+        self.__codigos__: dict[str, int] = {}
+        self.__nombres__: list[str] = []
+        self.__lock__ = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__nombres__)
+
+    def registrar(self, nombre: str) -> int:
+        """
+        Devuelve el código del nombre, registrándolo si todavía no existe.
+        """
+        clave = nombre.strip().casefold()
+        codigo = self.__codigos__.get(clave)
+        if codigo is not None:
+            return codigo
+        with self.__lock__:
+            codigo = self.__codigos__.get(clave)
+            if codigo is None:
+                codigo = len(self.__nombres__)
+                self.__nombres__.append(sys.intern(nombre.strip()))
+                self.__codigos__[clave] = codigo
+        return codigo
+
+    def obtener_codigo(self, nombre: str) -> int | None:
+        """
+        Devuelve el código del nombre sin registrarlo, o None si no se conoce.
+        """
+        return self.__codigos__.get(nombre.strip().casefold())
+
+    def obtener_nombre(self, codigo: int) -> str:
+        return self.__nombres__[codigo]
+
+
+class RegistroEspecialidades(Vocabulario):
+    """
+    Vocabulario de especialidades: todos los turnos de una especialidad guardan su
+    código y comparten el mismo objeto para el nombre.
+    """
+
+
+class CatalogoMedicamentos(Vocabulario):
+    """
+    Vocabulario de medicamentos: las recetas de un mismo medicamento escrito con
+    distintas mayúsculas se indexan bajo el mismo código.
+    """
+
+
+ESPECIALIDADES = RegistroEspecialidades()
+MEDICAMENTOS = CatalogoMedicamentos()
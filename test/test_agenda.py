@@ -0,0 +1,82 @@
+import unittest
+from datetime import datetime, timedelta
+from src.models.agenda import Agenda
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.turno import Turno
+
+
+class TestAgenda(unittest.TestCase):
+    def setUp(self):
+        self.paciente = Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+        self.medico = Medico("Ana Gómez", "12345")
+        self.dia = (datetime.now() + timedelta(days=2)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        self.agenda = Agenda()
+
+    def crear_turno(self, fecha_hora):
+        turno = Turno(self.paciente, self.medico, fecha_hora, "Pediatría")
+        self.agenda.agregar_turno(turno)
+        return turno
+
+    def test_turnos_del_dia_ordenados(self):
+        tarde = self.crear_turno(self.dia.replace(hour=15))
+        manana = self.crear_turno(self.dia.replace(hour=10))
+        self.crear_turno(self.dia + timedelta(days=1))
+        self.assertEqual(
+            self.agenda.obtener_turnos_del_dia(self.dia.date()), [manana, tarde]
+        )
+        self.assertEqual(
+            self.agenda.obtener_turnos_del_dia((self.dia - timedelta(days=1)).date()),
+            [],
+        )
+
+    def test_turnos_en_rango(self):
+        t1 = self.crear_turno(self.dia.replace(hour=9))
+        t2 = self.crear_turno(self.dia.replace(hour=12, minute=30))
+        self.crear_turno(self.dia.replace(hour=13))
+        t4 = self.crear_turno(self.dia + timedelta(days=1))
+        self.assertEqual(
+            self.agenda.obtener_turnos_en_rango(
+                self.dia.replace(hour=9), self.dia.replace(hour=13)
+            ),
+            [t1, t2],
+        )
+        self.assertEqual(
+            self.agenda.obtener_turnos_en_rango(
+                self.dia.replace(hour=14), self.dia + timedelta(days=2)
+            ),
+            [t4],
+        )
+
+    def test_proximo_horario_libre(self):
+        duracion = timedelta(minutes=30)
+        self.crear_turno(self.dia.replace(hour=9))
+        self.crear_turno(self.dia.replace(hour=9, minute=30))
+        self.crear_turno(self.dia.replace(hour=10, minute=15))
+        self.assertEqual(
+            self.agenda.obtener_proximo_horario_libre(
+                self.dia.replace(hour=9), duracion
+            ),
+            self.dia.replace(hour=10, minute=45),
+        )
+        self.assertEqual(
+            self.agenda.obtener_proximo_horario_libre(
+                self.dia.replace(hour=8), duracion
+            ),
+            self.dia.replace(hour=8),
+        )
+
+    def test_quitar_turno(self):
+        turno = self.crear_turno(self.dia)
+        self.agenda.quitar_turno(turno)
+        self.assertEqual(self.agenda.obtener_turnos_del_dia(self.dia.date()), [])
+        self.assertEqual(
+            self.agenda.obtener_proximo_horario_libre(self.dia, timedelta(minutes=30)),
+            self.dia,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
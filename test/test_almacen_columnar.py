@@ -0,0 +1,103 @@
+import unittest
+from collections import Counter
+from datetime import date, datetime, timedelta
+from src.models import almacen_columnar
+from src.models.almacen_columnar import AlmacenColumnarTurnos
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.turno import Turno
+
+
+class TestAlmacenColumnar(unittest.TestCase):
+    def setUp(self):
+        self.pacientes = [
+            Paciente(f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+            for i in range(3)
+        ]
+        self.medicos = [Medico("Ana Gómez", "m1"), Medico("Luis Díaz", "m2")]
+        # 01/06/2099 es lunes
+        self.base = datetime(2099, 6, 1, 9, 0)
+        self.turnos = [
+            Turno(
+                self.pacientes[i % 3],
+                self.medicos[i % 2],
+                self.base + timedelta(hours=i * 7),
+                "pediatria" if i % 3 else "cardiologia",
+            )
+            for i in range(40)
+        ]
+        self.almacen = AlmacenColumnarTurnos()
+        for turno in self.turnos:
+            self.almacen.agregar_turno(turno)
+
+    def esperado(self, clave):
+        return dict(Counter(clave(t) for t in self.turnos))
+
+    def verificar_agregaciones(self):
+        self.assertEqual(len(self.almacen), len(self.turnos))
+        self.assertEqual(
+            self.almacen.contar_por_medico(),
+            self.esperado(lambda t: t.obtener_medico().obtener_matricula()),
+        )
+        self.assertEqual(
+            self.almacen.contar_por_paciente(),
+            self.esperado(lambda t: t.obtener_paciente().obtener_dni()),
+        )
+        self.assertEqual(
+            self.almacen.contar_por_especialidad(),
+            self.esperado(Turno.obtener_especialidad),
+        )
+        self.assertEqual(
+            self.almacen.contar_por_dia(),
+            self.esperado(lambda t: t.obtener_fecha_hora().date()),
+        )
+        self.assertEqual(
+            self.almacen.contar_por_medico_y_dia(),
+            self.esperado(
+                lambda t: (
+                    t.obtener_medico().obtener_matricula(),
+                    t.obtener_fecha_hora().date(),
+                )
+            ),
+        )
+
+        def lunes(t):
+            fecha = t.obtener_fecha_hora().date()
+            return fecha - timedelta(days=fecha.weekday())
+
+        self.assertEqual(
+            self.almacen.ocupacion_por_medico_y_semana(),
+            self.esperado(lambda t: (t.obtener_medico().obtener_matricula(), lunes(t))),
+        )
+        histograma = [0] * 24
+        for t in self.turnos:
+            histograma[t.obtener_fecha_hora().hour] += 1
+        self.assertEqual(self.almacen.histograma_por_hora(), histograma)
+
+    def test_agregaciones_coinciden_con_recorrido(self):
+        self.verificar_agregaciones()
+
+    def test_agregaciones_sin_numpy(self):
+        numpy = almacen_columnar.np
+        almacen_columnar.np = None
+        try:
+            self.verificar_agregaciones()
+        finally:
+            almacen_columnar.np = numpy
+
+    def test_quitar_turno(self):
+        for turno in (self.turnos[5], self.turnos[-1], self.turnos[0]):
+            self.almacen.quitar_turno(turno)
+            self.turnos.remove(turno)
+        self.almacen.quitar_turno(self.turnos[0])
+        self.turnos.pop(0)
+        self.verificar_agregaciones()
+
+    def test_semana_identificada_por_lunes(self):
+        semanas = {semana for _, semana in self.almacen.ocupacion_por_medico_y_semana()}
+        self.assertIn(date(2099, 6, 1), semanas)
+        self.assertTrue(all(semana.weekday() == 0 for semana in semanas))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.archivo_turnos import ArchivoTurnos
+from src.errors.custom_exception import ValidacionError
+from src.errors.excepciones_clinica import PersistenciaError
+from src.utils.reloj import RelojCongelado
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabados", "domingos"]
+
+
+def claves(turnos):
+    return [
+        (
+            t.obtener_paciente().obtener_dni(),
+            t.obtener_medico().obtener_matricula(),
+            t.obtener_fecha_hora(),
+        )
+        for t in turnos
+    ]
+
+
+class TestArchivoTurnos(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.inicio = datetime(2025, 1, 6, 9, 0)
+        self.reloj = RelojCongelado(self.inicio)
+        self.clinica = Clinica({}, {}, [], {}, reloj=self.reloj)
+        for dni in ("10000001", "10000002"):
+            self.clinica.agregar_paciente(Paciente("Juan", dni, datetime(1990, 1, 1)))
+        medico = Medico("Ana Gómez", "12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", DIAS))
+        self.clinica.agregar_medico(medico)
+        # Un turno por paciente cada diez días durante cuatro meses.
+        for dia in range(0, 120, 10):
+            fecha_hora = self.inicio + timedelta(days=dia, hours=1)
+            self.clinica.agendar_turno("10000001", "12345", "Pediatría", fecha_hora)
+            self.clinica.agendar_turno(
+                "10000002", "12345", "Pediatría", fecha_hora + timedelta(hours=1)
+            )
+        self.todos = claves(self.clinica.iterar_turnos_entre())
+        self.historia = self.clinica.obtener_historia_clinica("10000001")
+        self.lineas = list(self.historia.iterar_lineas())
+        self.resumen = self.historia.obtener_resumen()
+        self.reloj.avanzar(timedelta(days=75))
+        self.archivo = ArchivoTurnos(os.path.join(self.directorio.name, "archivo"))
+        self.clinica.habilitar_archivo(self.archivo)
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def test_archivar_saca_de_memoria_los_turnos_pasados(self):
+        ahora = self.reloj.ahora()
+        archivados = self.clinica.archivar_turnos()
+        self.assertEqual(archivados, 16)
+        self.assertEqual(
+            self.archivo.obtener_meses(), [(2025, 1), (2025, 2), (2025, 3)]
+        )
+        self.assertTrue(
+            all(t.obtener_fecha_hora() >= ahora for t in self.clinica.ver_turnos())
+        )
+        self.assertEqual(len(self.clinica.obtener_turnos_de_medico("12345")), 8)
+        # Archivar de nuevo no repite turnos.
+        self.assertEqual(self.clinica.archivar_turnos(), 0)
+        self.assertEqual(claves(self.clinica.iterar_turnos_entre()), self.todos)
+
+    def test_historia_carga_los_turnos_archivados_al_consultarlos(self):
+        self.clinica.archivar_turnos()
+        self.assertEqual(self.historia.obtener_resumen(), self.resumen)
+        # Filtrar solo turnos en memoria no lee el archivo.
+        recientes = list(self.historia.iterar_lineas(desde=self.reloj.ahora()))
+        self.assertEqual(len(recientes), len(self.lineas) - 8)
+        self.assertEqual(list(self.historia.iterar_lineas()), self.lineas)
+        self.assertEqual(len(self.historia.ver_turnos()), 12)
+
+    def test_iterar_turnos_entre_lee_solo_el_intervalo(self):
+        self.clinica.archivar_turnos()
+        desde, hasta = datetime(2025, 2, 1), datetime(2025, 3, 1)
+        esperados = [clave for clave in self.todos if desde <= clave[2] < hasta]
+        self.assertEqual(
+            claves(self.clinica.iterar_turnos_entre(desde, hasta)), esperados
+        )
+
+    def test_archivo_persiste_entre_instancias(self):
+        self.clinica.archivar_turnos()
+        otro = ArchivoTurnos(os.path.join(self.directorio.name, "archivo"), 1)
+        filas = list(otro.iterar_filas())
+        self.assertEqual(len(filas), 16)
+        self.assertEqual(filas, sorted(filas, key=lambda fila: fila[2]))
+
+    def test_archivo_de_otra_clinica(self):
+        self.clinica.archivar_turnos()
+        otra = Clinica({}, {}, [], {}, reloj=self.reloj)
+        otra.habilitar_archivo(
+            ArchivoTurnos(os.path.join(self.directorio.name, "archivo"))
+        )
+        with self.assertRaises(PersistenciaError):
+            list(otra.iterar_turnos_entre())
+
+    def test_no_archiva_turnos_futuros_ni_sin_archivo(self):
+        with self.assertRaises(ValidacionError):
+            self.clinica.archivar_turnos(self.reloj.ahora() + timedelta(days=1))
+        sin_archivo = Clinica({}, {}, [], {})
+        with self.assertRaises(ValidacionError):
+            sin_archivo.archivar_turnos()
+
+
+if __name__ == "__main__":
+    unittest.main()
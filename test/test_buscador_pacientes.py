@@ -0,0 +1,43 @@
+import unittest
+from datetime import datetime
+from src.models.paciente import Paciente
+from src.models.buscador_pacientes import BuscadorPacientes
+
+
+class TestBuscadorPacientes(unittest.TestCase):
+    def setUp(self):
+        self.buscador = BuscadorPacientes()
+        for nombre, dni in (
+            ("Juan Pérez", "1"),
+            ("Juana Pereyra", "2"),
+            ("María López", "3"),
+            ("Mario Lopresti", "4"),
+            ("José María Gómez", "5"),
+        ):
+            self.buscador.agregar_paciente(Paciente(nombre, dni, datetime(1990, 1, 1)))
+
+    def test_coincidencia_exacta_primero(self):
+        self.assertEqual(self.buscador.buscar("juan"), ["1", "2"])
+
+    def test_prefijo_sin_tildes(self):
+        self.assertEqual(self.buscador.buscar("PER"), ["1", "2"])
+        self.assertEqual(self.buscador.buscar("lop"), ["3", "4"])
+
+    def test_varias_palabras(self):
+        self.assertEqual(self.buscador.buscar("maria lop"), ["3", "4"])
+        self.assertEqual(self.buscador.buscar("maria lopez"), ["3"])
+        self.assertEqual(self.buscador.buscar("gomez maría"), ["5"])
+
+    def test_error_de_tipeo(self):
+        self.assertEqual(self.buscador.buscar("Perz"), ["1"])
+        self.assertEqual(self.buscador.buscar("lopes"), ["3"])
+        self.assertEqual(self.buscador.buscar("gmoez"), ["5"])
+        self.assertEqual(self.buscador.buscar("rodriguez"), [])
+
+    def test_limite(self):
+        self.assertEqual(len(self.buscador.buscar("m", limite=2)), 2)
+        self.assertEqual(self.buscador.buscar("   "), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,24 @@
 import unittest
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from src.models.clinica import Clinica
 from src.models.paciente import Paciente
 from src.models.medico import Medico
 from src.models.especialidad import Especialidad
+from src.models.turno import Turno
+from src.models.indices import IndiceTurnos
+from src.utils.fechas import generar_fechas_recurrentes
+from src.utils.reloj import RelojCongelado
+from src.utils.vocabulario import ESPECIALIDADES
 from src.errors.excepciones_clinica import (
     PacienteNoEncontradoError,
     PacienteYaRegistradoError,
     MedicoNoEncontradoError,
     MedicoYaRegistradoError,
     TurnoOcupadoError,
+    TurnoNoEncontradoError,
     MedicoNoDisponibleError,
 )
-from src.errors.custom_exception import TipoDeDatoInvalidoError
+from src.errors.custom_exception import TipoDeDatoInvalidoError, ValidacionError
 
 
 class TestClinica(unittest.TestCase):
@@ -93,6 +99,296 @@ class TestClinica(unittest.TestCase):
         with self.assertRaises(TurnoOcupadoError):
             self.clinica.agendar_turno("12345678", "12345", "Pediatría", fecha)
 
+    def test_evitar_turno_duplicado_con_turnos_iniciales(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+
+        fecha = datetime.now() + timedelta(days=1)
+        while fecha.weekday() != 0:
+            fecha += timedelta(days=1)
+
+        turno = Turno(self.paciente, self.medico, fecha, "Pediatría")
+        clinica = Clinica(
+            {"12345678": self.paciente}, {"12345": self.medico}, [turno], {}
+        )
+        with self.assertRaises(TurnoOcupadoError):
+            clinica.validar_turno_no_duplicado("12345", fecha)
+        clinica.validar_turno_no_duplicado("12345", fecha + timedelta(hours=1))
+        clinica.validar_turno_no_duplicado("99999", fecha)
+
+    def test_consultas_de_agenda_del_medico(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+
+        fecha = (datetime.now() + timedelta(days=1)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        while fecha.weekday() != 0:
+            fecha += timedelta(days=1)
+
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", fecha)
+        self.clinica.agendar_turno(
+            "12345678", "12345", "Pediatría", fecha + timedelta(minutes=30)
+        )
+        en_rango = self.clinica.obtener_turnos_medico_en_rango(
+            "12345", fecha, fecha.replace(hour=13)
+        )
+        self.assertEqual(len(en_rango), 2)
+        self.assertEqual(
+            len(self.clinica.obtener_turnos_medico_del_dia("12345", fecha.date())), 2
+        )
+        self.assertEqual(
+            self.clinica.obtener_proximo_horario_libre("12345", fecha),
+            fecha + timedelta(hours=1),
+        )
+        with self.assertRaises(MedicoNoEncontradoError):
+            self.clinica.obtener_turnos_medico_del_dia("99999", fecha.date())
+
+    def proximo_lunes(self):
+        fecha = (datetime.now() + timedelta(days=1)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        while fecha.weekday() != 0:
+            fecha += timedelta(days=1)
+        return fecha
+
+    def test_agendar_turnos_lote(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+
+        lunes = self.proximo_lunes()
+        fechas = generar_fechas_recurrentes(lunes, lunes + timedelta(weeks=4), [0, 2])
+        turnos = self.clinica.agendar_turnos_lote(
+            "12345678", "12345", "Pediatría", fechas
+        )
+        self.assertEqual(len(turnos), 9)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 9)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 9)
+        with self.assertRaises(TurnoOcupadoError):
+            self.clinica.validar_turno_no_duplicado("12345", fechas[-1])
+
+    def test_especialidad_sin_distinguir_mayusculas(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+
+        lunes = self.proximo_lunes()
+        self.clinica.agendar_turno("12345678", "12345", "PEDIATRÍA", lunes)
+        turno = self.clinica.obtener_turnos()[0]
+        self.assertEqual(
+            turno.obtener_codigo_especialidad(), self.especialidad.obtener_codigo()
+        )
+        self.assertEqual(turno.obtener_especialidad(), "Pediatría")
+        with self.assertRaises(MedicoNoDisponibleError):
+            self.clinica.agendar_turno(
+                "12345678", "12345", "Cardiología", lunes + timedelta(hours=1)
+            )
+
+    def test_indices_secundarios(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_paciente(
+            Paciente("María López", "87654321", datetime(1985, 5, 5))
+        )
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+        otro = Medico("Luis Díaz", "54321")
+        otro.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.clinica.agregar_medico(otro)
+
+        lunes = self.proximo_lunes()
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", lunes)
+        self.clinica.agendar_turno("87654321", "54321", "Cardiología", lunes)
+        self.clinica.agendar_turno(
+            "12345678", "12345", "Pediatría", lunes + timedelta(days=2)
+        )
+
+        self.assertEqual(len(self.clinica.obtener_turnos_de_paciente("12345678")), 2)
+        self.assertEqual(len(self.clinica.obtener_turnos_de_medico("54321")), 1)
+        self.assertEqual(
+            len(self.clinica.obtener_turnos_de_especialidad("pediatría")), 2
+        )
+        self.assertEqual(
+            self.clinica.obtener_turnos_de_especialidad("Dermatología"), []
+        )
+        del_lunes = self.clinica.obtener_turnos_de_fecha(lunes.date())
+        self.assertEqual(
+            {t.obtener_medico().obtener_matricula() for t in del_lunes},
+            {"12345", "54321"},
+        )
+        with self.assertRaises(MedicoNoEncontradoError):
+            self.clinica.obtener_turnos_de_medico("99999")
+
+    def test_registrar_indice_propio(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+        lunes = self.proximo_lunes()
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", lunes)
+
+        indice = IndiceTurnos("hora", lambda t: t.obtener_fecha_hora().hour)
+        self.clinica.registrar_indice(indice)
+        self.clinica.agendar_turno(
+            "12345678", "12345", "Pediatría", lunes + timedelta(days=2)
+        )
+        self.assertEqual(len(self.clinica.obtener_turnos_por_indice("hora", 9)), 2)
+        with self.assertRaises(ValidacionError):
+            self.clinica.registrar_indice(IndiceTurnos("hora", lambda t: 0))
+
+    def test_buscar_pacientes(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.importar_pacientes(
+            [
+                {
+                    "nombre": "Juana Pérez",
+                    "dni": "87654321",
+                    "fecha_nacimiento": "05-05-1985",
+                }
+            ]
+        )
+        encontrados = self.clinica.buscar_pacientes("perez")
+        self.assertEqual(
+            [p.obtener_dni() for p in encontrados], ["12345678", "87654321"]
+        )
+        self.assertEqual(
+            self.clinica.buscar_pacientes("juna", limite=1), [self.paciente]
+        )
+
+    def test_buscar_horarios_libres(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+        lunes = self.proximo_lunes()
+        self.clinica.habilitar_disponibilidad(apertura=time(9), cierre=time(10))
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", lunes)
+
+        horarios = self.clinica.buscar_horarios_libres("pediatría", lunes, 2)
+        self.assertEqual(
+            [fecha_hora for fecha_hora, _ in horarios],
+            [lunes + timedelta(minutes=30), lunes + timedelta(days=2)],
+        )
+        self.assertIs(horarios[0][1], self.medico)
+        self.clinica.cancelar_turno("12345", lunes)
+        self.assertEqual(
+            self.clinica.buscar_horarios_libres("Pediatría", lunes, 1)[0][0], lunes
+        )
+        self.assertEqual(self.clinica.buscar_horarios_libres("Cardiología", lunes), [])
+
+    def test_cancelar_turno(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+        lunes = self.proximo_lunes()
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", lunes)
+
+        turno = self.clinica.cancelar_turno("12345", lunes)
+        self.assertEqual(turno.obtener_fecha_hora(), lunes)
+        self.assertEqual(self.clinica.obtener_turnos(), [])
+        self.assertEqual(self.clinica.obtener_turnos_de_medico("12345"), [])
+        self.assertEqual(self.clinica.obtener_turnos_de_fecha(lunes.date()), [])
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(historia.obtener_turnos(), [])
+        with self.assertRaises(TurnoNoEncontradoError):
+            self.clinica.cancelar_turno("12345", lunes)
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", lunes)
+
+    def test_agendar_turnos_lote_es_atomico(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+
+        lunes = self.proximo_lunes()
+        self.clinica.agendar_turno(
+            "12345678", "12345", "Pediatría", lunes + timedelta(weeks=2)
+        )
+        semanas = [lunes + timedelta(weeks=i) for i in range(4)]
+        with self.assertRaises(TurnoOcupadoError):
+            self.clinica.agendar_turnos_lote("12345678", "12345", "Pediatría", semanas)
+        with self.assertRaises(TurnoOcupadoError):
+            self.clinica.agendar_turnos_lote(
+                "12345678", "12345", "Pediatría", [lunes, lunes]
+            )
+        with self.assertRaises(MedicoNoDisponibleError):
+            self.clinica.agendar_turnos_lote(
+                "12345678", "12345", "Pediatría", [lunes, lunes + timedelta(days=1)]
+            )
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+        self.clinica.validar_turno_no_duplicado("12345", lunes)
+
+    def test_especialidades_rechazadas_no_se_registran(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+
+        lunes = self.proximo_lunes()
+        for especialidad in ("Pediatriaa rechazada", "Oftalmología rechazada"):
+            with self.assertRaises(MedicoNoDisponibleError):
+                self.clinica.agendar_turnos_lote(
+                    "12345678", "12345", especialidad, [lunes]
+                )
+            with self.assertRaises(MedicoNoDisponibleError):
+                self.clinica.agendar_turno("12345678", "12345", especialidad, lunes)
+            self.assertIsNone(ESPECIALIDADES.obtener_codigo(especialidad))
+        with self.assertRaises(TipoDeDatoInvalidoError):
+            self.clinica.agendar_turnos_lote(
+                "12345678", "12345", "Pediatría", ["no es fecha"]
+            )
+
+    def test_vistas_de_solo_lectura(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+        turnos = self.clinica.ver_turnos()
+        pacientes = self.clinica.ver_pacientes()
+        self.assertEqual(len(turnos), 0)
+
+        lunes = self.proximo_lunes()
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", lunes)
+        self.assertEqual(len(turnos), 1)
+        self.assertEqual(turnos[0].obtener_fecha_hora(), lunes)
+        self.assertEqual(list(pacientes), ["12345678"])
+        self.assertIs(self.clinica.ver_medicos()["12345"], self.medico)
+        with self.assertRaises(TypeError):
+            turnos[0] = None
+        with self.assertRaises(TypeError):
+            pacientes["99999999"] = self.paciente
+        self.assertFalse(hasattr(turnos, "append"))
+
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(list(historia.ver_turnos()), list(turnos))
+        self.assertEqual(len(historia.ver_recetas()), 0)
+
+    def test_iterar_turnos_con_filtro(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+        lunes = self.proximo_lunes()
+        self.clinica.agendar_turnos_lote(
+            "12345678", "12345", "Pediatría", [lunes, lunes + timedelta(weeks=1)]
+        )
+        self.assertEqual(len(list(self.clinica.iterar_turnos())), 2)
+        filtrados = list(
+            self.clinica.iterar_turnos(lambda t: t.obtener_fecha_hora() > lunes)
+        )
+        self.assertEqual(len(filtrados), 1)
+
+    def test_almacen_columnar_se_mantiene_con_cada_turno(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        self.clinica.agregar_medico(self.medico)
+        lunes = self.proximo_lunes()
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", lunes)
+
+        almacen = self.clinica.habilitar_almacen_columnar()
+        self.assertIs(self.clinica.habilitar_almacen_columnar(), almacen)
+        self.assertEqual(almacen.contar_por_medico(), {"12345": 1})
+        self.clinica.agendar_turnos_lote(
+            "12345678", "12345", "Pediatría", [lunes + timedelta(weeks=1)]
+        )
+        self.assertEqual(almacen.contar_por_especialidad(), {"Pediatría": 2})
+
     def test_error_paciente_no_existe(self):
         self.medico.agregar_especialidad(self.especialidad)
         self.clinica.agregar_medico(self.medico)
@@ -141,6 +437,40 @@ class TestClinica(unittest.TestCase):
         recetas = historia.obtener_recetas()
         self.assertEqual(len(recetas), 1)
 
+    def test_emitir_recetas_lote(self):
+        self.clinica.agregar_paciente(self.paciente)
+        self.clinica.agregar_medico(self.medico)
+        recetas = self.clinica.emitir_recetas_lote(
+            [("12345678", "12345", ["Paracetamol"]), ("12345678", "12345", ["B"])]
+        )
+        self.assertEqual(recetas[0].obtener_fecha(), recetas[1].obtener_fecha())
+        with self.assertRaises(MedicoNoEncontradoError):
+            self.clinica.emitir_recetas_lote(
+                [("12345678", "12345", ["C"]), ("12345678", "99999", ["D"])]
+            )
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_recetas()), 2)
+
+    def test_reloj_congelado(self):
+        reloj = RelojCongelado(datetime(2020, 3, 1, 8, 0))
+        clinica = Clinica({}, {}, [], {}, reloj=reloj)
+        clinica.agregar_paciente(self.paciente)
+        self.medico.agregar_especialidad(self.especialidad)
+        clinica.agregar_medico(self.medico)
+        # Para la clínica el 2/3/2020 (lunes) es futuro.
+        clinica.agendar_turno(
+            "12345678", "12345", "Pediatría", datetime(2020, 3, 2, 9, 0)
+        )
+        with self.assertRaises(ValidacionError):
+            clinica.agendar_turno(
+                "12345678", "12345", "Pediatría", datetime(2020, 2, 24, 9, 0)
+            )
+        receta = clinica.emitir_receta("12345678", "12345", ["Paracetamol"])
+        self.assertEqual(receta.obtener_fecha(), datetime(2020, 3, 1, 8, 0))
+        reloj.avanzar(timedelta(days=1))
+        receta = clinica.emitir_receta("12345678", "12345", ["Paracetamol"])
+        self.assertEqual(receta.obtener_fecha(), datetime(2020, 3, 2, 8, 0))
+
     def test_error_paciente_no_existe_receta(self):
         self.clinica.agregar_medico(self.medico)
 
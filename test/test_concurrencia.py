@@ -0,0 +1,118 @@
+import sys
+import unittest
+from datetime import datetime, timedelta
+from threading import Barrier, Thread
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.errors.custom_exception import CustomException
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabados", "domingos"]
+HILOS = 8
+MEDICOS = 4
+HORARIOS = 25
+
+
+class TestClinicaConcurrente(unittest.TestCase):
+    def setUp(self):
+        # Cambios de hilo frecuentes para que las carreras aparezcan si las hay.
+        self.intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.repositorio = RepositorioSQLite()
+        self.clinica = Clinica({}, {}, [], {}, self.repositorio)
+        for i in range(HILOS):
+            self.clinica.agregar_paciente(
+                Paciente(f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+            )
+        for i in range(MEDICOS):
+            medico = Medico(f"Medico {i}", f"m{i}")
+            medico.agregar_especialidad(Especialidad("Clínica", list(DIAS)))
+            self.clinica.agregar_medico(medico)
+        self.clinica.habilitar_concurrencia()
+        self.inicio = (datetime.now() + timedelta(days=1)).replace(
+            hour=8, minute=0, second=0, microsecond=0
+        )
+
+    def tearDown(self):
+        sys.setswitchinterval(self.intervalo)
+        self.repositorio.cerrar()
+
+    def ejecutar_en_hilos(self, tarea):
+        barrera = Barrier(HILOS)
+        errores = []
+
+        def correr(indice):
+            barrera.wait()
+            try:
+                tarea(indice)
+            except Exception as e:  # pragma: no cover - se informa en el assert
+                errores.append(e)
+
+        hilos = [Thread(target=correr, args=(i,)) for i in range(HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        self.assertEqual(errores, [])
+
+    def test_cada_horario_se_agenda_una_sola_vez(self):
+        exitos: list[list[tuple[str, datetime]]] = [[] for _ in range(HILOS)]
+
+        def agendar(indice):
+            dni = str(10_000_000 + indice)
+            for h in range(HORARIOS):
+                for m in range(MEDICOS):
+                    fecha_hora = self.inicio + timedelta(minutes=30 * h)
+                    try:
+                        self.clinica.agendar_turno(dni, f"m{m}", "Clínica", fecha_hora)
+                    except CustomException:
+                        continue
+                    exitos[indice].append((f"m{m}", fecha_hora))
+
+        self.ejecutar_en_hilos(agendar)
+        agendados = [clave for lista in exitos for clave in lista]
+        self.assertEqual(len(agendados), MEDICOS * HORARIOS)
+        self.assertEqual(len(set(agendados)), MEDICOS * HORARIOS)
+        self.assertEqual(len(self.clinica.obtener_turnos()), MEDICOS * HORARIOS)
+        for indice in range(HILOS):
+            historia = self.clinica.obtener_historia_clinica(str(10_000_000 + indice))
+            self.assertEqual(len(historia.obtener_turnos()), len(exitos[indice]))
+        for m in range(MEDICOS):
+            self.assertEqual(
+                len(self.clinica.obtener_turnos_de_medico(f"m{m}")), HORARIOS
+            )
+        recuperada = Clinica.desde_repositorio(self.repositorio)
+        self.assertEqual(len(recuperada.obtener_turnos()), MEDICOS * HORARIOS)
+
+    def test_agendar_y_cancelar_en_paralelo(self):
+        self.clinica.habilitar_disponibilidad()
+
+        def agendar_y_cancelar(indice):
+            dni = str(10_000_000 + indice)
+            matricula = f"m{indice % MEDICOS}"
+            for h in range(HORARIOS):
+                fecha_hora = self.inicio + timedelta(minutes=30 * h)
+                try:
+                    self.clinica.agendar_turno(dni, matricula, "Clínica", fecha_hora)
+                except CustomException:
+                    continue
+                if h % 2:
+                    self.clinica.cancelar_turno(matricula, fecha_hora)
+                self.clinica.buscar_horarios_libres("Clínica", self.inicio, 5)
+
+        self.ejecutar_en_hilos(agendar_y_cancelar)
+        pares = (HORARIOS + 1) // 2
+        self.assertEqual(len(self.clinica.obtener_turnos()), MEDICOS * pares)
+        libres = self.clinica.buscar_horarios_libres("Clínica", self.inicio, 1)
+        self.assertEqual(libres[0][0], self.inicio + timedelta(minutes=30))
+
+    def test_habilitar_concurrencia_es_idempotente(self):
+        self.clinica.habilitar_concurrencia()
+        self.clinica.agendar_turno("10000000", "m0", "Clínica", self.inicio)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
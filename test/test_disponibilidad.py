@@ -0,0 +1,112 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.models.disponibilidad import MotorDisponibilidad
+from src.persistencia.hidratacion import hidratar_turno
+from src.errors.custom_exception import ValidacionError
+
+# 02/06/2025 fue lunes.
+LUNES = date(2025, 6, 2)
+
+
+class TestMotorDisponibilidad(unittest.TestCase):
+    def setUp(self):
+        self.paciente = Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+        self.ana = Medico("Ana Gómez", "m1")
+        self.ana.agregar_especialidad(Especialidad("Cardiología", ["lunes"]))
+        self.luis = Medico("Luis Díaz", "m2")
+        self.luis.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.turnos: dict[tuple[str, date], list] = {}
+        self.motor = MotorDisponibilidad(
+            lambda matricula, dia: self.turnos.get((matricula, dia), []),
+            timedelta(minutes=30),
+            time(9, 0),
+            time(11, 0),
+        )
+        self.motor.registrar_medico(self.ana)
+        self.motor.registrar_medico(self.luis)
+        self.codigo = self.ana.obtener_especialidades()[0].obtener_codigo()
+
+    def agendar(self, medico, fecha_hora):
+        turno = hidratar_turno(self.paciente, medico, fecha_hora, "Cardiología")
+        clave = (medico.obtener_matricula(), fecha_hora.date())
+        self.turnos.setdefault(clave, []).append(turno)
+        self.motor.ocupar(turno)
+        return turno
+
+    def horarios(self, desde, cantidad):
+        return [
+            (fecha_hora, medico.obtener_matricula())
+            for fecha_hora, medico in self.motor.buscar_horarios_libres(
+                self.codigo, desde, cantidad
+            )
+        ]
+
+    def test_recorre_dias_y_medicos(self):
+        desde = datetime.combine(LUNES, time(10, 0))
+        self.assertEqual(
+            self.horarios(desde, 4),
+            [
+                (datetime(2025, 6, 2, 10, 0), "m1"),
+                (datetime(2025, 6, 2, 10, 30), "m1"),
+                (datetime(2025, 6, 3, 9, 0), "m2"),
+                (datetime(2025, 6, 3, 9, 30), "m2"),
+            ],
+        )
+
+    def test_turnos_ocupan_franjas(self):
+        desde = datetime.combine(LUNES, time(0, 0))
+        self.horarios(desde, 1)  # arma la máscara del día antes de agendar
+        self.agendar(self.ana, datetime(2025, 6, 2, 9, 0))
+        self.agendar(self.ana, datetime(2025, 6, 2, 9, 45))
+        self.assertEqual(
+            self.horarios(desde, 1), [(datetime(2025, 6, 2, 10, 30), "m1")]
+        )
+        self.agendar(self.ana, datetime(2025, 6, 2, 10, 30))
+        self.assertEqual(self.horarios(desde, 1), [(datetime(2025, 6, 3, 9, 0), "m2")])
+
+    def test_liberar_vuelve_a_armar_el_dia(self):
+        desde = datetime.combine(LUNES, time(0, 0))
+        turno = self.agendar(self.ana, datetime(2025, 6, 2, 9, 0))
+        self.assertEqual(self.horarios(desde, 1), [(datetime(2025, 6, 2, 9, 30), "m1")])
+        self.turnos[("m1", LUNES)].remove(turno)
+        self.motor.liberar(turno)
+        self.assertEqual(self.horarios(desde, 1), [(datetime(2025, 6, 2, 9, 0), "m1")])
+
+    def test_nueva_especialidad_se_registra(self):
+        self.ana.agregar_especialidad(Especialidad("Clínica", ["martes"]))
+        self.motor.registrar_medico(self.ana)
+        desde = datetime.combine(LUNES + timedelta(days=1), time(0, 0))
+        self.assertEqual(
+            [m for _, m in self.horarios(desde, 4)], ["m2", "m2", "m2", "m2"]
+        )
+
+    def test_busqueda_no_pasa_de_la_fecha_maxima(self):
+        # 27/12/9999 es lunes: solo quedan ese lunes y el martes siguiente.
+        desde = datetime(9999, 12, 27, 0, 0)
+        self.assertEqual(
+            self.horarios(desde, 10),
+            [
+                (datetime(9999, 12, 27, 9, 0), "m1"),
+                (datetime(9999, 12, 27, 9, 30), "m1"),
+                (datetime(9999, 12, 27, 10, 0), "m1"),
+                (datetime(9999, 12, 27, 10, 30), "m1"),
+                (datetime(9999, 12, 28, 9, 0), "m2"),
+                (datetime(9999, 12, 28, 9, 30), "m2"),
+                (datetime(9999, 12, 28, 10, 0), "m2"),
+                (datetime(9999, 12, 28, 10, 30), "m2"),
+            ],
+        )
+        self.assertEqual(self.horarios(datetime(9999, 12, 31, 9, 0), 1), [])
+
+    def test_horario_invalido(self):
+        with self.assertRaises(ValidacionError):
+            MotorDisponibilidad(lambda m, d: [], timedelta(0))
+        with self.assertRaises(ValidacionError):
+            MotorDisponibilidad(lambda m, d: [], apertura=time(18), cierre=time(8))
+
+
+if __name__ == "__main__":
+    unittest.main()
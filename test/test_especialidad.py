@@ -47,6 +47,15 @@ class TestEspecialidad(unittest.TestCase):
         esp = Especialidad("Pediatría", ["lunes", "miércoles"])
         self.assertFalse(esp.verificar_dia("viernes"))
 
+    def test_verificar_numero_dia(self):
+        esp = Especialidad("Pediatría", ["Lunes", "miércoles", "sábado"])
+        self.assertEqual(esp.obtener_mascara_dias(), 0b0100101)
+        self.assertTrue(esp.verificar_numero_dia(0))
+        self.assertTrue(esp.verificar_numero_dia(2))
+        self.assertTrue(esp.verificar_numero_dia(5))
+        self.assertFalse(esp.verificar_numero_dia(6))
+        self.assertTrue(esp.verificar_dia("sabados"))
+
 
 if __name__ == "__main__":
     unittest.main()
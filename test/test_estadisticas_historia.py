@@ -0,0 +1,151 @@
+import random
+import unittest
+from collections import Counter
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.models.estadisticas_historia import Frecuencias
+from src.utils.reloj import RelojCongelado
+from src.utils.vocabulario import MEDICAMENTOS
+
+DNIS = ["10000001", "10000002", "10000003"]
+NOMBRES_MEDICAMENTOS = [
+    "Amoxicilina",
+    "Ibuprofeno",
+    "ibuprofeno",
+    "Paracetamol",
+    "PARACETAMOL",
+    "Omeprazol",
+]
+
+
+def mas_frecuente(contador: Counter):
+    return min(contador, key=lambda c: (-contador[c], c), default=None)
+
+
+def nombre_de_medicamento(codigo):
+    return None if codigo is None else MEDICAMENTOS.obtener_nombre(codigo)
+
+
+def recalcular(historias) -> dict:
+    """
+    Resumen calculado recorriendo las historias completas.
+    """
+    turnos = [t for h in historias for t in h.ver_turnos()]
+    recetas = [r for h in historias for r in h.ver_recetas()]
+    especialidades = Counter(t.obtener_codigo_especialidad() for t in turnos)
+    codigo = mas_frecuente(especialidades)
+    return {
+        "cantidad_turnos": len(turnos),
+        "especialidad_mas_frecuente": (
+            None
+            if codigo is None
+            else next(
+                t.obtener_especialidad()
+                for t in turnos
+                if t.obtener_codigo_especialidad() == codigo
+            )
+        ),
+        "cantidad_recetas": len(recetas),
+        "medicamento_mas_recetado": nombre_de_medicamento(
+            mas_frecuente(
+                Counter(
+                    codigo
+                    for r in recetas
+                    for codigo in {
+                        MEDICAMENTOS.obtener_codigo(m) for m in r.obtener_medicamentos()
+                    }
+                )
+            )
+        ),
+    }
+
+
+class TestEstadisticasHistoria(unittest.TestCase):
+    def setUp(self):
+        self.inicio = datetime(2020, 3, 2, 9, 0)
+        self.clinica = Clinica({}, {}, [], {}, reloj=RelojCongelado(self.inicio))
+        for dni in DNIS:
+            self.clinica.agregar_paciente(Paciente("Juan", dni, datetime(1990, 1, 1)))
+        medico = Medico("Ana Gómez", "12345")
+        medico.agregar_especialidad(
+            Especialidad("Pediatría", ["lunes", "martes", "miercoles"])
+        )
+        medico.agregar_especialidad(
+            Especialidad("Cardiología", ["jueves", "viernes", "sabados", "domingos"])
+        )
+        self.clinica.agregar_medico(medico)
+
+    def test_frecuencias_desempata_por_clave(self):
+        frecuencias = Frecuencias()
+        frecuencias.sumar("b")
+        frecuencias.sumar("a")
+        self.assertEqual(frecuencias.obtener_maximo(), "a")
+        frecuencias.sumar("b")
+        self.assertEqual(frecuencias.obtener_maximo(), "b")
+        frecuencias.restar("b")
+        frecuencias.restar("b")
+        self.assertEqual(frecuencias.obtener_maximo(), "a")
+        frecuencias.restar("a")
+        self.assertIsNone(frecuencias.obtener_maximo())
+
+    def test_coinciden_con_el_recalculo(self):
+        azar = random.Random(7)
+        agendados = []
+        for _ in range(600):
+            accion = azar.random()
+            dni = azar.choice(DNIS)
+            if accion < 0.5:
+                fecha_hora = self.inicio + timedelta(hours=azar.randrange(2000))
+                if fecha_hora in agendados:
+                    continue
+                especialidad = (
+                    "Pediatría" if fecha_hora.weekday() < 3 else "Cardiología"
+                )
+                self.clinica.agendar_turno(dni, "12345", especialidad, fecha_hora)
+                agendados.append(fecha_hora)
+            elif accion < 0.7 and agendados:
+                fecha_hora = agendados.pop(azar.randrange(len(agendados)))
+                self.clinica.cancelar_turno("12345", fecha_hora)
+            else:
+                medicamentos = azar.sample(NOMBRES_MEDICAMENTOS, azar.randint(1, 3))
+                self.clinica.emitir_receta(dni, "12345", medicamentos)
+
+            if azar.random() < 0.1:
+                historias = [self.clinica.obtener_historia_clinica(d) for d in DNIS]
+                for historia in historias:
+                    resumen = historia.obtener_resumen()
+                    ultimo = resumen.pop("ultimo_turno")
+                    self.assertEqual(resumen, recalcular([historia]))
+                    turnos = historia.ver_turnos()
+                    self.assertEqual(
+                        ultimo, turnos[-1].obtener_fecha_hora() if turnos else None
+                    )
+                general = self.clinica.obtener_resumen_general()
+                self.assertEqual(general.pop("cantidad_pacientes"), len(DNIS))
+                self.assertEqual(general, recalcular(historias))
+
+    def test_medicamentos_sin_distinguir_mayusculas(self):
+        for medicamentos in (["Ibuprofeno"], ["ibuprofeno"], ["Paracetamol"]):
+            self.clinica.emitir_receta(DNIS[0], "12345", medicamentos)
+        resumen = self.clinica.obtener_resumen_general()
+        self.assertEqual(resumen["medicamento_mas_recetado"].casefold(), "ibuprofeno")
+        self.assertEqual(
+            self.clinica.contar_recetas_por_medicamento()[
+                resumen["medicamento_mas_recetado"]
+            ],
+            2,
+        )
+
+    def test_resumen_vacio(self):
+        resumen = self.clinica.obtener_historia_clinica(DNIS[0]).obtener_resumen()
+        self.assertEqual(resumen["cantidad_turnos"], 0)
+        self.assertIsNone(resumen["especialidad_mas_frecuente"])
+        self.assertIsNone(resumen["medicamento_mas_recetado"])
+        self.assertIsNone(resumen["ultimo_turno"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from datetime import datetime
+from src.errors.custom_exception import ValidacionError
+from src.utils.fechas import (
+    DiaSemana,
+    formatear_fecha,
+    formatear_fecha_hora,
+    generar_fechas_recurrentes,
+    obtener_numero_dia,
+)
+
+
+class TestFechas(unittest.TestCase):
+    def test_formatear_fecha(self):
+        self.assertEqual(formatear_fecha(datetime(2025, 6, 3)), "03/06/2025")
+        self.assertEqual(
+            formatear_fecha_hora(datetime(2025, 6, 3, 9, 5)), "03/06/2025 09:05"
+        )
+
+    def test_obtener_numero_dia(self):
+        self.assertEqual(obtener_numero_dia("lunes"), 0)
+        self.assertEqual(obtener_numero_dia(" Miércoles "), 2)
+        self.assertEqual(obtener_numero_dia("sabados"), 5)
+        self.assertEqual(obtener_numero_dia("domingo"), 6)
+        self.assertIsNone(obtener_numero_dia("feriado"))
+
+    def test_dia_semana(self):
+        self.assertIs(obtener_numero_dia("Sábado"), DiaSemana.SABADO)
+        self.assertEqual(DiaSemana(datetime(2025, 6, 4).weekday()), DiaSemana.MIERCOLES)
+        self.assertEqual(DiaSemana.DOMINGO.obtener_nombre(), "domingos")
+
+    def test_generar_fechas_recurrentes(self):
+        # 04/06/2025 es miércoles
+        inicio = datetime(2025, 6, 4, 8, 30)
+        fechas = generar_fechas_recurrentes(inicio, datetime(2025, 6, 16), [0, 2, 4])
+        self.assertEqual(
+            fechas,
+            [
+                datetime(2025, 6, 4, 8, 30),
+                datetime(2025, 6, 6, 8, 30),
+                datetime(2025, 6, 9, 8, 30),
+                datetime(2025, 6, 11, 8, 30),
+                datetime(2025, 6, 13, 8, 30),
+            ],
+        )
+
+    def test_generar_fechas_recurrentes_cada_dos_semanas(self):
+        inicio = datetime(2025, 6, 2, 10, 0)
+        fechas = generar_fechas_recurrentes(inicio, datetime(2025, 7, 1), [0], 2)
+        self.assertEqual(
+            fechas,
+            [
+                datetime(2025, 6, 2, 10, 0),
+                datetime(2025, 6, 16, 10, 0),
+                datetime(2025, 6, 30, 10, 0),
+            ],
+        )
+
+    def test_generar_fechas_recurrentes_valida_argumentos(self):
+        inicio = datetime(2025, 6, 2, 10, 0)
+        for cada_semanas in (0, -1):
+            with self.assertRaises(ValidacionError):
+                generar_fechas_recurrentes(
+                    inicio, datetime(2025, 7, 1), [0], cada_semanas
+                )
+        for dia in (7, -1):
+            with self.assertRaises(ValidacionError):
+                generar_fechas_recurrentes(inicio, datetime(2025, 7, 1), [0, dia])
+
+
+if __name__ == "__main__":
+    unittest.main()
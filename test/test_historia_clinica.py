@@ -5,7 +5,7 @@ from src.models.paciente import Paciente
 from src.models.medico import Medico
 from src.models.turno import Turno
 from src.models.receta import Receta
-from src.errors.custom_exception import TipoDeDatoInvalidoError
+from src.errors.custom_exception import TipoDeDatoInvalidoError, ValidacionError
 
 
 class TestHistoriaClinica(unittest.TestCase):
@@ -49,6 +49,57 @@ class TestHistoriaClinica(unittest.TestCase):
         with self.assertRaises(TipoDeDatoInvalidoError):
             hc.agregar_receta("no_receta")
 
+    def historia_con_turnos(self, cantidad):
+        hc = HistoriaClinica(self.paciente)
+        base = (datetime.now() + timedelta(days=1)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        for i in reversed(range(cantidad)):
+            hc.agregar_turno(
+                Turno(self.paciente, self.medico, base + timedelta(days=i), "Pediatría")
+            )
+        return hc, base
+
+    def test_turnos_ordenados_por_fecha(self):
+        hc, base = self.historia_con_turnos(3)
+        fechas = [t.obtener_fecha_hora() for t in hc.obtener_turnos()]
+        self.assertEqual(fechas, sorted(fechas))
+
+    def test_iterar_lineas(self):
+        hc, base = self.historia_con_turnos(3)
+        hc.agregar_receta(self.receta)
+        lineas = list(hc.iterar_lineas())
+        self.assertEqual(len(lineas), 7)
+        self.assertTrue(lineas[0].startswith("Historia Clínica de"))
+        self.assertEqual(lineas[1], "--- Turnos ---")
+        self.assertEqual(lineas[2], hc.obtener_turnos()[0].obtener_resumen())
+        self.assertEqual(lineas[5], "--- Recetas ---")
+        self.assertIn("Paracetamol", lineas[6])
+
+    def test_iterar_lineas_filtrado_y_mas_recientes_primero(self):
+        hc, base = self.historia_con_turnos(5)
+        turnos = hc.obtener_turnos()
+        lineas = list(
+            hc.iterar_lineas(
+                desde=base + timedelta(days=1),
+                hasta=base + timedelta(days=4),
+                mas_recientes_primero=True,
+            )
+        )
+        self.assertEqual(
+            lineas[2:5], [t.obtener_resumen() for t in reversed(turnos[1:4])]
+        )
+        self.assertEqual(lineas[6], "Sin recetas")
+
+    def test_obtener_pagina(self):
+        hc, base = self.historia_con_turnos(10)
+        self.assertEqual(len(hc.obtener_pagina(1, 5)), 5)
+        self.assertEqual(hc.obtener_pagina(2, 5), list(hc.iterar_lineas())[5:10])
+        self.assertEqual(len(hc.obtener_pagina(3, 5)), 4)
+        self.assertEqual(hc.obtener_pagina(4, 5), [])
+        with self.assertRaises(ValidacionError):
+            hc.obtener_pagina(0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.utils.importacion import leer_registros, medico_desde_registro
+from src.errors.custom_exception import ValidacionError
+from src.errors.excepciones_clinica import (
+    PacienteYaRegistradoError,
+    MedicoYaRegistradoError,
+)
+
+
+class TestImportacion(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica({}, {}, [], {})
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def escribir(self, nombre, contenido):
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+
+    def test_importar_pacientes_desde_csv(self):
+        ruta = self.escribir(
+            "pacientes.csv",
+            "nombre,dni,fecha_nacimiento\n"
+            "Juan Perez,12345678,01-01-1990\n"
+            "Ana Gomez,87654321,15-05-1985\n",
+        )
+        resultado = self.clinica.importar_pacientes(leer_registros(ruta))
+        self.assertEqual(resultado.obtener_cantidad_importados(), 2)
+        self.assertEqual(resultado.obtener_errores(), [])
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 2)
+        self.assertEqual(
+            len(self.clinica.obtener_historia_clinica("87654321").obtener_turnos()), 0
+        )
+
+    def test_importar_pacientes_informa_errores_por_fila(self):
+        self.clinica.agregar_paciente(
+            Paciente("Existente", "11111111", datetime(1980, 1, 1))
+        )
+        registros = [
+            {
+                "nombre": "Juan Perez",
+                "dni": "12345678",
+                "fecha_nacimiento": "01-01-1990",
+            },
+            {"nombre": "Repetido", "dni": "12345678", "fecha_nacimiento": "01-01-1990"},
+            {
+                "nombre": "Ya estaba",
+                "dni": "11111111",
+                "fecha_nacimiento": "01-01-1990",
+            },
+            {"nombre": "Sin fecha", "dni": "22222222"},
+            {"nombre": "Fecha mala", "dni": "33333333", "fecha_nacimiento": "1990"},
+            {"nombre": "", "dni": "44444444", "fecha_nacimiento": "01-01-1990"},
+        ]
+        resultado = self.clinica.importar_pacientes(registros)
+        self.assertEqual(resultado.obtener_cantidad_importados(), 1)
+        errores = resultado.obtener_errores()
+        self.assertEqual([fila for fila, _ in errores], [2, 3, 4, 5, 6])
+        self.assertIsInstance(errores[0][1], PacienteYaRegistradoError)
+        self.assertIsInstance(errores[1][1], PacienteYaRegistradoError)
+        self.assertIsInstance(errores[2][1], ValidacionError)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 2)
+
+    def test_importar_medicos_desde_jsonl(self):
+        ruta = self.escribir(
+            "medicos.jsonl",
+            '{"nombre": "Ana Gomez", "matricula": "m1", '
+            '"especialidades": [{"tipo": "pediatria", "dias": ["lunes"]}]}\n'
+            "\n"
+            '{"nombre": "Luis Diaz", "matricula": "m2", '
+            '"especialidades": "cardiologia:martes,jueves;clinica:viernes"}\n'
+            '{"nombre": "Repetido", "matricula": "m1"}\n',
+        )
+        resultado = self.clinica.importar_medicos(leer_registros(ruta))
+        self.assertEqual(resultado.obtener_cantidad_importados(), 2)
+        self.assertEqual(len(resultado.obtener_errores()), 1)
+        self.assertIsInstance(
+            resultado.obtener_errores()[0][1], MedicoYaRegistradoError
+        )
+        medico = self.clinica.obtener_medico_por_matricula("m2")
+        self.assertEqual(medico.obtener_especialidad_para_dia("jueves"), "cardiologia")
+        self.assertEqual(medico.obtener_especialidad_para_dia("viernes"), "clinica")
+
+    def test_lineas_jsonl_invalidas_son_errores_de_fila(self):
+        ruta = self.escribir(
+            "pacientes.jsonl",
+            '{"nombre": "Juan Perez", "dni": "12345678", '
+            '"fecha_nacimiento": "01-01-1990"}\n'
+            '{"nombre": "Cortado", "dni": \n'
+            "5\n"
+            '["no", "es", "un", "objeto"]\n'
+            '{"nombre": "Ana Gomez", "dni": "87654321", '
+            '"fecha_nacimiento": "15-05-1985"}\n',
+        )
+        resultado = self.clinica.importar_pacientes(leer_registros(ruta))
+        self.assertEqual(resultado.obtener_cantidad_importados(), 2)
+        errores = resultado.obtener_errores()
+        self.assertEqual([fila for fila, _ in errores], [2, 3, 4])
+        for _, error in errores:
+            self.assertIsInstance(error, ValidacionError)
+
+    def test_registro_que_no_es_objeto(self):
+        resultado = self.clinica.importar_medicos(
+            [5, {"nombre": "Ana Gomez", "matricula": "m1"}]
+        )
+        self.assertEqual(resultado.obtener_cantidad_importados(), 1)
+        self.assertIsInstance(resultado.obtener_errores()[0][1], ValidacionError)
+
+    def test_especialidades_con_formato_invalido_son_errores_de_fila(self):
+        resultado = self.clinica.importar_medicos(
+            [
+                {"nombre": "Ana", "matricula": "m1", "especialidades": 5},
+                {"nombre": "Ana", "matricula": "m2", "especialidades": {"a": 1}},
+                {"nombre": "Ana", "matricula": "m3", "especialidades": [5]},
+                {"nombre": "Ana Gomez", "matricula": "m4"},
+            ]
+        )
+        self.assertEqual(resultado.obtener_cantidad_importados(), 1)
+        errores = resultado.obtener_errores()
+        self.assertEqual([fila for fila, _ in errores], [1, 2, 3])
+        for _, error in errores:
+            self.assertIsInstance(error, ValidacionError)
+
+    def test_especialidad_sin_dias(self):
+        with self.assertRaises(ValidacionError):
+            medico_desde_registro(
+                {"nombre": "Ana", "matricula": "m1", "especialidades": "pediatria"}
+            )
+
+    def test_formato_no_soportado(self):
+        with self.assertRaises(ValidacionError):
+            leer_registros("pacientes.xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import random
+import unittest
+from datetime import date, datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.receta import Receta
+from src.models.indice_medicamentos import IndiceMedicamentos
+from src.utils.reloj import RelojCongelado
+
+MEDICAMENTOS = ["Amoxicilina", "Ibuprofeno", "Paracetamol", "Omeprazol"]
+
+
+class TestIndiceMedicamentos(unittest.TestCase):
+    def setUp(self):
+        self.paciente = Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+        self.medico = Medico("Ana Gómez", "12345")
+
+    def receta(self, medicamentos, dia):
+        return Receta.desde_datos_confiables(
+            self.paciente, self.medico, medicamentos, datetime(2025, 6, dia, 10)
+        )
+
+    def test_consulta_por_medicamento_y_rango(self):
+        indice = IndiceMedicamentos()
+        primera = self.receta(["Paracetamol", "Ibuprofeno"], 3)
+        segunda = self.receta(["paracetamol ", "PARACETAMOL"], 1)
+        tercera = self.receta(["Ibuprofeno"], 20)
+        for receta in (primera, segunda, tercera):
+            indice.agregar_receta(receta)
+        self.assertEqual(list(indice.iterar_recetas("PARACETAMOL")), [segunda, primera])
+        self.assertEqual(
+            list(
+                indice.iterar_recetas("Ibuprofeno", date(2025, 6, 3), date(2025, 6, 20))
+            ),
+            [primera],
+        )
+        self.assertEqual(list(indice.iterar_recetas("Aspirina")), [])
+        self.assertEqual(
+            indice.contar_recetas("Paracetamol", hasta=date(2025, 6, 2)), 1
+        )
+        self.assertEqual(
+            indice.contar_por_medicamento(desde=date(2025, 6, 2)),
+            {"Paracetamol": 1, "Ibuprofeno": 2},
+        )
+
+    def test_clinica_coincide_con_recorrer_las_historias(self):
+        inicio = datetime(2025, 1, 1, 9, 0)
+        reloj = RelojCongelado(inicio)
+        clinica = Clinica({}, {}, [], {}, reloj=reloj)
+        dnis = [str(10_000_000 + i) for i in range(20)]
+        for dni in dnis:
+            clinica.agregar_paciente(Paciente("Paciente", dni, datetime(1990, 1, 1)))
+        clinica.agregar_medico(self.medico)
+        azar = random.Random(3)
+        for _ in range(90):
+            clinica.emitir_recetas_lote(
+                [
+                    (azar.choice(dnis), "12345", azar.sample(MEDICAMENTOS, 2))
+                    for _ in range(azar.randint(0, 4))
+                ]
+            )
+            reloj.avanzar(timedelta(days=1))
+
+        hasta = reloj.ahora().date()
+        desde = hasta - timedelta(days=30)
+        recetas = [
+            r
+            for dni in dnis
+            for r in clinica.obtener_historia_clinica(dni).ver_recetas()
+            if desde <= r.obtener_fecha().date() < hasta
+        ]
+        for medicamento in MEDICAMENTOS:
+            esperadas = [r for r in recetas if medicamento in r.obtener_medicamentos()]
+            obtenidas = clinica.obtener_recetas_con_medicamento(
+                medicamento.upper(), desde, hasta
+            )
+            self.assertCountEqual(obtenidas, esperadas)
+            self.assertCountEqual(
+                clinica.obtener_pacientes_con_medicamento(medicamento, desde, hasta),
+                {r.obtener_paciente() for r in esperadas},
+            )
+        self.assertEqual(
+            sum(clinica.contar_recetas_por_medicamento(desde, hasta).values()),
+            2 * len(recetas),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
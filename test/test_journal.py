@@ -0,0 +1,207 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.journal import Journal
+from src.persistencia.archivo_turnos import ArchivoTurnos
+from src.utils.reloj import RelojCongelado
+from src.errors.custom_exception import ValidacionError
+from src.errors.excepciones_clinica import PersistenciaError, TurnoOcupadoError
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = self.directorio.name
+        self.journales = []
+        self.lunes = (datetime.now() + timedelta(days=1)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        while self.lunes.weekday() != 0:
+            self.lunes += timedelta(days=1)
+
+    def tearDown(self):
+        for journal in self.journales:
+            journal.cerrar()
+        self.directorio.cleanup()
+
+    def abrir(self, **opciones):
+        journal = Journal(self.ruta, **opciones)
+        self.journales.append(journal)
+        return journal, journal.recuperar()
+
+    def poblar(self, clinica):
+        clinica.agregar_paciente(
+            Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+        )
+        clinica.agregar_medico(Medico("Ana Gómez", "12345"))
+        clinica.agregar_especialidad_a_medico(
+            "12345", Especialidad("Pediatría", ["lunes"])
+        )
+        clinica.agendar_turno("12345678", "12345", "Pediatría", self.lunes)
+        clinica.agendar_turnos_lote(
+            "12345678",
+            "12345",
+            "Pediatría",
+            [self.lunes + timedelta(weeks=i) for i in range(1, 4)],
+        )
+        clinica.emitir_receta("12345678", "12345", ["Paracetamol"])
+
+    def verificar_estado(self, clinica):
+        self.assertEqual(len(clinica.obtener_pacientes()), 1)
+        medico = clinica.obtener_medico_por_matricula("12345")
+        self.assertEqual(medico.obtener_especialidad_para_dia("lunes"), "Pediatría")
+        self.assertEqual(len(clinica.obtener_turnos()), 4)
+        historia = clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 4)
+        self.assertEqual(
+            historia.obtener_recetas()[0].obtener_medicamentos(), ["Paracetamol"]
+        )
+        with self.assertRaises(TurnoOcupadoError):
+            clinica.validar_turno_no_duplicado("12345", self.lunes)
+
+    def test_recuperacion_sin_cierre(self):
+        _, clinica = self.abrir(politica_fsync="siempre")
+        self.poblar(clinica)
+        _, recuperada = self.abrir()
+        self.verificar_estado(recuperada)
+
+    def test_recuperacion_desde_snapshot_y_cola(self):
+        journal, clinica = self.abrir(politica_fsync="nunca", snapshot_cada=3)
+        self.poblar(clinica)
+        journal.cerrar()
+        self.assertTrue(os.path.exists(os.path.join(self.ruta, "snapshot.json")))
+        with open(os.path.join(self.ruta, "journal.jsonl"), encoding="utf-8") as f:
+            self.assertLess(len(f.readlines()), 8)
+        _, recuperada = self.abrir()
+        self.verificar_estado(recuperada)
+
+    def test_registros_incluidos_en_snapshot_no_se_reaplican(self):
+        journal, clinica = self.abrir(politica_fsync="siempre")
+        self.poblar(clinica)
+        ruta_journal = os.path.join(self.ruta, "journal.jsonl")
+        with open(ruta_journal, "rb") as f:
+            anterior = f.read()
+        journal.guardar_snapshot()
+        journal.cerrar()
+        # Caída entre el reemplazo del snapshot y el vaciado del journal.
+        with open(ruta_journal, "wb") as f:
+            f.write(anterior)
+        _, recuperada = self.abrir()
+        self.verificar_estado(recuperada)
+
+    def test_linea_incompleta_se_descarta(self):
+        journal, clinica = self.abrir(politica_fsync="siempre")
+        self.poblar(clinica)
+        journal.cerrar()
+        with open(os.path.join(self.ruta, "journal.jsonl"), "ab") as f:
+            f.write(b'{"op":"paciente","dni":"876')
+        _, recuperada = self.abrir()
+        self.verificar_estado(recuperada)
+
+    def test_escrituras_despues_de_linea_incompleta_se_recuperan(self):
+        journal, clinica = self.abrir(politica_fsync="siempre")
+        self.poblar(clinica)
+        journal.cerrar()
+        with open(os.path.join(self.ruta, "journal.jsonl"), "ab") as f:
+            f.write(b'{"op":"pacie')
+        journal, recuperada = self.abrir(politica_fsync="siempre")
+        for dni in ("22222222", "33333333"):
+            recuperada.agregar_paciente(Paciente("Otro", dni, datetime(1990, 1, 1)))
+        journal.cerrar()
+        _, recuperada = self.abrir()
+        self.assertEqual(len(recuperada.obtener_pacientes()), 3)
+        self.assertEqual(len(recuperada.obtener_turnos()), 4)
+
+    def test_linea_corrupta_en_el_medio_no_se_descarta(self):
+        journal, clinica = self.abrir(politica_fsync="siempre")
+        self.poblar(clinica)
+        journal.cerrar()
+        ruta_journal = os.path.join(self.ruta, "journal.jsonl")
+        with open(ruta_journal, "rb") as f:
+            lineas = f.readlines()
+        lineas[1] = b'{"op":"medi\n'
+        with open(ruta_journal, "wb") as f:
+            f.writelines(lineas)
+        with self.assertRaises(PersistenciaError):
+            self.abrir()
+        with open(ruta_journal, "rb") as f:
+            self.assertEqual(f.readlines(), lineas)
+
+    def test_politica_grupo_sincroniza_recien_con_el_cambio_siguiente(self):
+        journal, clinica = self.abrir(tamano_grupo=100, intervalo_grupo=0.01)
+        with mock.patch("os.fsync") as fsync:
+            clinica.agregar_paciente(
+                Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+            )
+            time.sleep(0.02)
+            # Vencido el intervalo, el cambio sigue pendiente.
+            fsync.assert_not_called()
+            clinica.agregar_paciente(
+                Paciente("Ana Gomez", "87654321", datetime(1985, 1, 1))
+            )
+            self.assertEqual(fsync.call_count, 1)
+            journal.sincronizar()
+            self.assertEqual(fsync.call_count, 2)
+
+    def test_cancelacion_se_recupera(self):
+        journal, clinica = self.abrir(politica_fsync="siempre", snapshot_cada=3)
+        self.poblar(clinica)
+        clinica.cancelar_turno("12345", self.lunes + timedelta(weeks=1))
+        _, recuperada = self.abrir()
+        self.assertEqual(len(recuperada.obtener_turnos()), 3)
+        historia = recuperada.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 3)
+        recuperada.validar_turno_no_duplicado("12345", self.lunes + timedelta(weeks=1))
+
+    def test_turnos_pasados_se_recuperan(self):
+        journal, clinica = self.abrir(politica_fsync="siempre")
+        clinica.agregar_paciente(
+            Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+        )
+        clinica.agregar_medico(Medico("Ana Gómez", "12345"))
+        journal.cerrar()
+        with open(os.path.join(self.ruta, "journal.jsonl"), "ab") as f:
+            f.write(
+                b'{"op":"turno","dni":"12345678","matricula":"12345",'
+                b'"fecha_hora":"2020-03-02T10:00:00","especialidad":"Pediatr\\u00eda",'
+                b'"n":3}\n'
+            )
+        _, recuperada = self.abrir()
+        turnos = recuperada.obtener_historia_clinica("12345678").obtener_turnos()
+        self.assertEqual(turnos[0].obtener_fecha_hora(), datetime(2020, 3, 2, 10, 0))
+
+    def test_snapshot_incluye_turnos_archivados(self):
+        journal, clinica = self.abrir(politica_fsync="siempre")
+        self.poblar(clinica)
+        journal.cerrar()
+        reloj = RelojCongelado(self.lunes + timedelta(weeks=2))
+        journal = Journal(self.ruta)
+        self.journales.append(journal)
+        clinica = journal.recuperar(reloj)
+        clinica.habilitar_archivo(ArchivoTurnos(os.path.join(self.ruta, "archivo")))
+        self.assertEqual(clinica.archivar_turnos(), 2)
+        self.assertEqual(len(clinica.obtener_turnos()), 2)
+        journal.guardar_snapshot()
+        _, recuperada = self.abrir()
+        self.verificar_estado(recuperada)
+
+    def test_escrituras_agrupadas_se_recuperan(self):
+        journal, clinica = self.abrir(politica_fsync="siempre")
+        with clinica.agrupar_escrituras():
+            self.poblar(clinica)
+        _, recuperada = self.abrir()
+        self.verificar_estado(recuperada)
+
+    def test_politica_invalida(self):
+        with self.assertRaises(ValidacionError):
+            Journal(self.ruta, politica_fsync="a_veces")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import io
+import json
+import unittest
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.cli.lote import ejecutar_lote
+
+
+class TestEjecutarLote(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica({}, {}, [], {})
+        self.lunes = (datetime.now() + timedelta(days=1)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        while self.lunes.weekday() != 0:
+            self.lunes += timedelta(days=1)
+
+    def comando(self, op, **argumentos):
+        return json.dumps({"op": op, "args": argumentos})
+
+    def test_ejecuta_comandos_e_informa_errores(self):
+        turno = {
+            "dni": "12345678",
+            "matricula": "12345",
+            "especialidad": "Pediatría",
+            "fecha_hora": self.lunes.isoformat(),
+        }
+        lineas = [
+            "# alta de datos",
+            self.comando(
+                "agregar_paciente",
+                nombre="Juan Perez",
+                dni="12345678",
+                fecha_nacimiento="1990-01-01",
+            ),
+            self.comando(
+                "agregar_medico",
+                nombre="Ana Gómez",
+                matricula="12345",
+                especialidades=[{"tipo": "Pediatría", "dias": ["lunes"]}],
+            ),
+            "",
+            self.comando("agendar_turno", **turno),
+            self.comando("agendar_turno", **turno),
+            "{no es json",
+            json.dumps({"id": "x", "op": "desconocida"}),
+        ]
+        salida = io.StringIO()
+        estadisticas = ejecutar_lote(self.clinica, lineas, salida)
+
+        respuestas = [json.loads(l) for l in salida.getvalue().splitlines()]
+        self.assertEqual([r["linea"] for r in respuestas], [2, 3, 5, 6, 7, 8])
+        self.assertEqual([r["ok"] for r in respuestas], [True] * 3 + [False] * 3)
+        self.assertEqual(respuestas[3]["error"], "TurnoOcupadoError")
+        self.assertEqual(respuestas[5]["id"], "x")
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+
+        self.assertEqual(estadisticas.obtener_cantidad(), 6)
+        self.assertEqual(estadisticas.obtener_cantidad_errores(), 3)
+        self.assertEqual(
+            estadisticas.obtener_errores_por_tipo(),
+            {
+                "TurnoOcupadoError": 1,
+                "ValidacionError": 1,
+                "OperacionDesconocidaError": 1,
+            },
+        )
+        resumen = estadisticas.obtener_resumen()
+        self.assertTrue(resumen[0].startswith("Comandos: 6 - Errores: 3"))
+        self.assertTrue(any("agendar_turno: 2" in linea for linea in resumen))
+
+    def test_error_inesperado_no_detiene_el_lote(self):
+        def fallar(*_):
+            raise RuntimeError("falla interna")
+
+        self.clinica.obtener_medicos = fallar
+        lineas = [
+            self.comando("obtener_medicos"),
+            self.comando(
+                "agregar_paciente",
+                nombre="Juan Perez",
+                dni="12345678",
+                fecha_nacimiento="1990-01-01",
+            ),
+        ]
+        salida = io.StringIO()
+        estadisticas = ejecutar_lote(self.clinica, lineas, salida)
+
+        respuestas = [json.loads(l) for l in salida.getvalue().splitlines()]
+        self.assertEqual([r["ok"] for r in respuestas], [False, True])
+        self.assertIn("falla interna", respuestas[0]["mensaje"])
+        self.assertEqual(estadisticas.obtener_cantidad_errores(), 1)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -41,6 +41,13 @@ class TestMedico(unittest.TestCase):
         medico.agregar_especialidad(esp)
         self.assertIn("Pediatría", str(medico))
 
+    def test_texto_se_actualiza_al_agregar_especialidad(self):
+        medico = Medico("Ana Gómez", "12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.assertIs(str(medico), str(medico))
+        medico.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.assertTrue(str(medico).endswith("Especialidades: Pediatría, Cardiología"))
+
     def test_agregar_especialidad_invalida(self):
         medico = Medico("Ana Gómez", "12345")
         with self.assertRaises(TipoDeDatoInvalidoError):
@@ -53,6 +60,15 @@ class TestMedico(unittest.TestCase):
         self.assertEqual(medico.obtener_especialidad_para_dia("LUNES"), "Pediatría")
         self.assertIsNone(medico.obtener_especialidad_para_dia("viernes"))
 
+    def test_obtener_especialidad_para_numero_dia(self):
+        medico = Medico("Ana Gómez", "12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "martes"]))
+        medico.agregar_especialidad(Especialidad("Cardiología", ["martes", "jueves"]))
+        self.assertEqual(medico.obtener_especialidad_para_numero_dia(0), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_numero_dia(1), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_numero_dia(3), "Cardiología")
+        self.assertIsNone(medico.obtener_especialidad_para_numero_dia(6))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.servicio.operaciones import obtener_operacion, responder
+
+
+class TestOperaciones(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica({}, {}, [], {})
+        self.lunes = (datetime.now() + timedelta(days=1)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        while self.lunes.weekday() != 0:
+            self.lunes += timedelta(days=1)
+        self.ok(
+            "agregar_paciente",
+            nombre="Juan Perez",
+            dni="12345678",
+            fecha_nacimiento="1990-01-01",
+        )
+        self.ok(
+            "agregar_medico",
+            nombre="Ana Gómez",
+            matricula="12345",
+            especialidades=[{"tipo": "Pediatría", "dias": ["lunes"]}],
+        )
+
+    def ok(self, op, **argumentos):
+        respuesta = responder(self.clinica, {"op": op, "args": argumentos})
+        self.assertTrue(respuesta["ok"], respuesta)
+        return respuesta["resultado"]
+
+    def error(self, solicitud):
+        respuesta = responder(self.clinica, solicitud)
+        self.assertFalse(respuesta["ok"])
+        return respuesta["error"]
+
+    def test_agendar_y_consultar(self):
+        turno = self.ok(
+            "agendar_turno",
+            dni="12345678",
+            matricula="12345",
+            especialidad="Pediatría",
+            fecha_hora=self.lunes.isoformat(),
+        )
+        self.assertEqual(turno["fecha_hora"], self.lunes.isoformat())
+        self.ok("emitir_receta", dni="12345678", matricula="12345", medicamentos=["A"])
+        historia = self.ok("obtener_historia_clinica", dni="12345678")
+        self.assertEqual(historia["paciente"]["nombre"], "Juan Perez")
+        self.assertEqual(historia["turnos"], [turno])
+        self.assertEqual(historia["recetas"][0]["medicamentos"], ["A"])
+        self.assertEqual(
+            self.ok("obtener_turnos_de_fecha", fecha=self.lunes.date().isoformat()),
+            [turno],
+        )
+        libres = self.ok(
+            "buscar_horarios_libres",
+            especialidad="Pediatría",
+            desde=self.lunes.isoformat(),
+            cantidad=1,
+        )
+        self.assertEqual(libres[0]["matricula"], "12345")
+        self.assertNotEqual(libres[0]["fecha_hora"], self.lunes.isoformat())
+        self.ok("cancelar_turno", matricula="12345", fecha_hora=self.lunes.isoformat())
+        self.assertEqual(self.ok("obtener_turnos"), [])
+
+    def test_errores_se_informan_en_la_respuesta(self):
+        self.assertEqual(self.error({"op": "borrar_todo"}), "OperacionDesconocidaError")
+        self.assertEqual(self.error(["agendar_turno"]), "ValidacionError")
+        self.assertEqual(
+            self.error({"op": "obtener_historia_clinica", "args": {}}),
+            "ValidacionError",
+        )
+        self.assertEqual(
+            self.error({"op": "obtener_historia_clinica", "args": {"dni": "99999999"}}),
+            "PacienteNoEncontradoError",
+        )
+        self.assertEqual(
+            self.error(
+                {
+                    "op": "agendar_turno",
+                    "args": {
+                        "dni": "12345678",
+                        "matricula": "12345",
+                        "especialidad": "Pediatría",
+                        "fecha_hora": "mañana",
+                    },
+                }
+            ),
+            "ValidacionError",
+        )
+
+    def test_fecha_hora_con_zona_horaria_se_rechaza(self):
+        fecha_hora = self.lunes.isoformat() + "+00:00"
+        for op, argumentos in (
+            (
+                "agendar_turno",
+                {
+                    "dni": "12345678",
+                    "matricula": "12345",
+                    "especialidad": "Pediatría",
+                    "fecha_hora": fecha_hora,
+                },
+            ),
+            (
+                "buscar_horarios_libres",
+                {"especialidad": "Pediatría", "desde": fecha_hora},
+            ),
+        ):
+            self.assertEqual(
+                self.error({"op": op, "args": argumentos}), "ValidacionError"
+            )
+
+    def test_id_se_repite_en_la_respuesta(self):
+        respuesta = responder(self.clinica, {"id": 7, "op": "obtener_medicos"})
+        self.assertEqual(respuesta["id"], 7)
+        self.assertEqual(respuesta["resultado"][0]["matricula"], "12345")
+
+    def test_claves_de_serializacion(self):
+        argumentos = {"dni": "1", "matricula": "M1"}
+        self.assertEqual(
+            obtener_operacion("agendar_turno").obtener_clave(argumentos), "medico:M1"
+        )
+        self.assertEqual(
+            obtener_operacion("emitir_receta").obtener_clave(argumentos), "paciente:1"
+        )
+        self.assertIsNone(obtener_operacion("obtener_turnos").obtener_clave({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,16 @@ class TestPaciente(unittest.TestCase):
         self.assertEqual(paciente.obtener_dni(), "12345678")
         self.assertIn("Juan Perez", str(paciente))
         self.assertIn("12345678", str(paciente))
+        self.assertEqual(paciente.obtener_nombre(), "Juan Perez")
+        self.assertFalse(hasattr(paciente, "__dict__"))
+
+    def test_desde_datos_confiables(self):
+        paciente = Paciente.desde_datos_confiables(
+            "Juan Perez", "12345678", datetime(1990, 1, 1)
+        )
+        self.assertEqual(
+            str(paciente), str(Paciente("Juan Perez", "12345678", datetime(1990, 1, 1)))
+        )
 
     def test_nombre_no_texto(self):
         with self.assertRaises(TipoDeDatoInvalidoError):
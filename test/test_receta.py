@@ -18,6 +18,14 @@ class TestReceta(unittest.TestCase):
         self.assertIn("Juan Perez", str(receta))
         self.assertIn("Ana Gómez", str(receta))
 
+    def test_desde_datos_confiables_conserva_la_fecha(self):
+        fecha = datetime(2020, 3, 2, 9, 0)
+        receta = Receta.desde_datos_confiables(
+            self.paciente, self.medico, ["Paracetamol"], fecha
+        )
+        self.assertEqual(receta.obtener_fecha(), fecha)
+        self.assertIn("Fecha: 02/03/2020", str(receta))
+
     def test_paciente_no_valido(self):
         with self.assertRaises(TipoDeDatoInvalidoError):
             Receta("no_paciente", self.medico, ["Paracetamol"])
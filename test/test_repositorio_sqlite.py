@@ -0,0 +1,182 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.persistencia.hidratacion import hidratar_turno
+from src.errors.excepciones_clinica import PersistenciaError, TurnoOcupadoError
+
+
+class TestRepositorioSQLite(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+        self.repositorio = RepositorioSQLite(self.ruta)
+        self.clinica = Clinica.desde_repositorio(self.repositorio)
+        self.clinica.agregar_paciente(
+            Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+        )
+        medico = Medico("Ana Gómez", "12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.lunes = (datetime.now() + timedelta(days=1)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        while self.lunes.weekday() != 0:
+            self.lunes += timedelta(days=1)
+
+    def tearDown(self):
+        self.repositorio.cerrar()
+        self.directorio.cleanup()
+
+    def reabrir(self):
+        self.repositorio.cerrar()
+        self.repositorio = RepositorioSQLite(self.ruta)
+        return Clinica.desde_repositorio(self.repositorio)
+
+    def test_datos_persisten_entre_ejecuciones(self):
+        self.clinica.agregar_especialidad_a_medico(
+            "12345", Especialidad("Cardiología", ["martes"])
+        )
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", self.lunes)
+        self.clinica.emitir_receta("12345678", "12345", ["Paracetamol", "Ibuprofeno"])
+
+        clinica = self.reabrir()
+        self.assertEqual(clinica.obtener_pacientes()[0].obtener_nombre(), "Juan Perez")
+        medico = clinica.obtener_medico_por_matricula("12345")
+        self.assertEqual(medico.obtener_especialidad_para_dia("lunes"), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Cardiología")
+        self.assertEqual(len(clinica.obtener_turnos()), 1)
+
+        historia = clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(historia.obtener_turnos(), clinica.obtener_turnos())
+        recetas = historia.obtener_recetas()
+        self.assertEqual(len(recetas), 1)
+        self.assertEqual(
+            recetas[0].obtener_medicamentos(), ["Paracetamol", "Ibuprofeno"]
+        )
+        with self.assertRaises(TurnoOcupadoError):
+            clinica.agendar_turno("12345678", "12345", "Pediatría", self.lunes)
+
+    def test_consultas_generales_incluyen_historias_sin_hidratar(self):
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", self.lunes)
+        self.clinica.emitir_receta("12345678", "12345", ["Paracetamol"])
+        clinica = self.reabrir()
+        pacientes = clinica.obtener_pacientes_con_medicamento("paracetamol")
+        self.assertEqual([p.obtener_dni() for p in pacientes], ["12345678"])
+        resumen = clinica.obtener_resumen_general()
+        self.assertEqual(resumen["cantidad_turnos"], 1)
+        self.assertEqual(resumen["medicamento_mas_recetado"], "Paracetamol")
+        clinica.emitir_receta("12345678", "12345", ["Ibuprofeno", "Ibuprofeno"])
+        clinica.emitir_receta("12345678", "12345", ["Ibuprofeno"])
+        resumen = clinica.obtener_resumen_general()
+        self.assertEqual(resumen["cantidad_recetas"], 3)
+        self.assertEqual(resumen["medicamento_mas_recetado"], "Ibuprofeno")
+
+    def test_cancelacion_persiste(self):
+        self.clinica.agendar_turno("12345678", "12345", "Pediatría", self.lunes)
+        self.clinica.cancelar_turno("12345", self.lunes)
+
+        clinica = self.reabrir()
+        self.assertEqual(clinica.obtener_turnos(), [])
+        self.assertEqual(
+            clinica.obtener_historia_clinica("12345678").obtener_turnos(), []
+        )
+        clinica.agendar_turno("12345678", "12345", "Pediatría", self.lunes)
+
+    def test_turnos_pasados_solo_se_cargan_en_la_historia(self):
+        paciente = self.clinica.obtener_pacientes()[0]
+        medico = self.clinica.obtener_medico_por_matricula("12345")
+        self.repositorio.guardar_turno(
+            hidratar_turno(paciente, medico, datetime(2020, 3, 2, 10, 0), "Pediatría")
+        )
+
+        clinica = self.reabrir()
+        self.assertEqual(clinica.obtener_turnos(), [])
+        turnos = clinica.obtener_historia_clinica("12345678").obtener_turnos()
+        self.assertEqual(len(turnos), 1)
+        self.assertEqual(turnos[0].obtener_fecha_hora(), datetime(2020, 3, 2, 10, 0))
+
+    def test_nuevo_turno_no_duplica_historia_hidratada(self):
+        self.clinica.emitir_receta("12345678", "12345", ["Paracetamol"])
+        clinica = self.reabrir()
+        clinica.agendar_turno("12345678", "12345", "Pediatría", self.lunes)
+        historia = clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 1)
+        self.assertEqual(len(historia.obtener_recetas()), 1)
+
+    def test_importacion_y_lote_se_persisten(self):
+        self.clinica.importar_pacientes(
+            [{"nombre": "Ana", "dni": "87654321", "fecha_nacimiento": "01-01-1990"}]
+        )
+        self.clinica.agendar_turnos_lote(
+            "87654321",
+            "12345",
+            "Pediatría",
+            [self.lunes, self.lunes + timedelta(weeks=1)],
+        )
+        self.clinica.emitir_recetas_lote(
+            [("87654321", "12345", ["A"]), ("87654321", "12345", ["B"])]
+        )
+        clinica = self.reabrir()
+        self.assertEqual(len(clinica.obtener_pacientes()), 2)
+        historia = clinica.obtener_historia_clinica("87654321")
+        self.assertEqual(len(historia.obtener_turnos()), 2)
+        self.assertEqual(len(historia.obtener_recetas()), 2)
+
+    def test_escrituras_agrupadas_se_confirman_al_salir(self):
+        paciente = self.clinica.obtener_pacientes()[0]
+        with self.clinica.agrupar_escrituras():
+            self.clinica.agendar_turno("12345678", "12345", "Pediatría", self.lunes)
+            with self.assertRaises(PersistenciaError):
+                self.repositorio.guardar_paciente(paciente)
+            with self.clinica.agrupar_escrituras():
+                self.clinica.emitir_receta("12345678", "12345", ["Paracetamol"])
+            otra = RepositorioSQLite(self.ruta)
+            self.assertEqual(otra.cargar_turnos_desde(self.lunes, {}, {}), [])
+            otra.cerrar()
+
+        clinica = self.reabrir()
+        self.assertEqual(len(clinica.obtener_turnos()), 1)
+        historia = clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_recetas()), 1)
+
+    def test_grupo_de_otro_hilo_no_demora_la_confirmacion(self):
+        abierto, cerrar = threading.Event(), threading.Event()
+
+        def grupo_lento():
+            with self.repositorio.agrupar_escrituras():
+                abierto.set()
+                cerrar.wait()
+
+        hilo = threading.Thread(target=grupo_lento)
+        hilo.start()
+        abierto.wait()
+        # El grupo que sale espera la confirmación de la tanda, que recién ocurre
+        # cuando el otro hilo cierra el suyo.
+        threading.Timer(0.1, cerrar.set).start()
+        with self.repositorio.agrupar_escrituras():
+            self.repositorio.guardar_paciente(
+                Paciente("Ana Gomez", "87654321", datetime(1985, 1, 1))
+            )
+        self.assertTrue(cerrar.is_set())
+        conexion = sqlite3.connect(self.ruta)
+        (cantidad,) = conexion.execute("SELECT COUNT(*) FROM pacientes").fetchone()
+        conexion.close()
+        self.assertEqual(cantidad, 2)
+        hilo.join()
+
+    def test_error_de_almacenamiento(self):
+        paciente = self.clinica.obtener_pacientes()[0]
+        with self.assertRaises(PersistenciaError):
+            self.repositorio.guardar_paciente(paciente)
+
+
+if __name__ == "__main__":
+    unittest.main()
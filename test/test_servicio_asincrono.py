@@ -0,0 +1,139 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.servicio.servicio_asincrono import ServicioClinica
+from src.errors.excepciones_clinica import (
+    OperacionDesconocidaError,
+    TurnoOcupadoError,
+)
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabados", "domingos"]
+PACIENTES = 50
+MEDICOS = 5
+HORARIOS = 40
+
+
+class TestServicioClinica(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+        self.repositorio = RepositorioSQLite(self.ruta)
+        self.clinica = Clinica({}, {}, [], {}, self.repositorio)
+        for i in range(PACIENTES):
+            self.clinica.agregar_paciente(
+                Paciente(f"Paciente {i}", str(10_000_000 + i), datetime(1990, 1, 1))
+            )
+        for i in range(MEDICOS):
+            medico = Medico(f"Medico {i}", f"m{i}")
+            medico.agregar_especialidad(Especialidad("Clínica", list(DIAS)))
+            self.clinica.agregar_medico(medico)
+        self.servicio = ServicioClinica(self.clinica, tamano_lote=16)
+        self.inicio = (datetime.now() + timedelta(days=1)).replace(
+            hour=8, minute=0, second=0, microsecond=0
+        )
+
+    async def asyncTearDown(self):
+        await self.servicio.cerrar()
+
+    def tearDown(self):
+        self.repositorio.cerrar()
+        self.directorio.cleanup()
+
+    async def test_miles_de_pedidos_concurrentes(self):
+        pedidos = [
+            (str(10_000_000 + p), f"m{m}", self.inicio + timedelta(minutes=30 * h))
+            for p in range(PACIENTES)
+            for m in range(MEDICOS)
+            for h in range(HORARIOS)
+            if (p + h) % 5 == 0
+        ]
+        self.assertGreater(len(pedidos), 1000)
+        resultados = await asyncio.gather(
+            *(
+                self.servicio.agendar_turno(dni, matricula, "Clínica", fecha_hora)
+                for dni, matricula, fecha_hora in pedidos
+            ),
+            return_exceptions=True,
+        )
+        agendados = [r for r in resultados if isinstance(r, dict)]
+        rechazados = [r for r in resultados if not isinstance(r, dict)]
+        self.assertTrue(all(isinstance(r, TurnoOcupadoError) for r in rechazados))
+        claves = {(t["matricula"], t["fecha_hora"]) for t in agendados}
+        self.assertEqual(len(agendados), MEDICOS * HORARIOS)
+        self.assertEqual(len(claves), MEDICOS * HORARIOS)
+        self.assertEqual(len(self.clinica.obtener_turnos()), MEDICOS * HORARIOS)
+
+        otra = RepositorioSQLite(self.ruta)
+        recuperada = Clinica.desde_repositorio(otra)
+        self.assertEqual(len(recuperada.obtener_turnos()), MEDICOS * HORARIOS)
+        otra.cerrar()
+
+    async def test_pedidos_de_un_medico_se_aplican_en_orden(self):
+        fecha_hora = self.inicio
+        resultados = await asyncio.gather(
+            self.servicio.agendar_turno("10000000", "m0", "Clínica", fecha_hora),
+            self.servicio.cancelar_turno("m0", fecha_hora),
+            self.servicio.agendar_turno("10000001", "m0", "Clínica", fecha_hora),
+        )
+        self.assertEqual(resultados[2]["dni"], "10000001")
+        historia = await self.servicio.obtener_historia_clinica("10000001")
+        self.assertEqual(len(historia["turnos"]), 1)
+        receta = await self.servicio.emitir_receta("10000001", "m0", ["Ibuprofeno"])
+        self.assertEqual(receta["medicamentos"], ["Ibuprofeno"])
+
+    async def test_errores_de_la_clinica_se_propagan(self):
+        with self.assertRaises(OperacionDesconocidaError):
+            await self.servicio.ejecutar("borrar_todo")
+        respuesta = await self.servicio.responder(
+            {"id": "a", "op": "obtener_historia_clinica", "args": {"dni": "1"}}
+        )
+        self.assertEqual(respuesta["id"], "a")
+        self.assertEqual(respuesta["error"], "PacienteNoEncontradoError")
+
+    async def test_socket_json_por_linea(self):
+        servidor = await self.servicio.servir()
+        puerto = servidor.sockets[0].getsockname()[1]
+        lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+        solicitudes = [
+            {
+                "id": h,
+                "op": "agendar_turno",
+                "args": {
+                    "dni": "10000000",
+                    "matricula": "m1",
+                    "especialidad": "Clínica",
+                    "fecha_hora": (
+                        self.inicio + timedelta(minutes=30 * (h % 10))
+                    ).isoformat(),
+                },
+            }
+            for h in range(20)
+        ]
+        for solicitud in solicitudes:
+            escritor.write(json.dumps(solicitud).encode() + b"\n")
+        escritor.write(b"no es json\n")
+        escritor.write_eof()
+        respuestas = [json.loads(linea) async for linea in lector]
+        escritor.close()
+        servidor.close()
+        await servidor.wait_closed()
+
+        self.assertEqual(len(respuestas), 21)
+        por_id = {r["id"]: r for r in respuestas if "id" in r}
+        self.assertEqual(sorted(por_id), list(range(20)))
+        self.assertEqual(sum(r["ok"] for r in por_id.values()), 10)
+        self.assertTrue(all(r["ok"] for i, r in por_id.items() if i < 10))
+        sin_id = [r for r in respuestas if "id" not in r]
+        self.assertEqual(sin_id[0]["error"], "ValidacionError")
+
+
+if __name__ == "__main__":
+    unittest.main()
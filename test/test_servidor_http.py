@@ -0,0 +1,237 @@
+import http.client
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from threading import Event, Thread
+from src.models.clinica import Clinica
+from src.models.paciente import Paciente
+from src.models.medico import Medico
+from src.models.especialidad import Especialidad
+from src.persistencia.repositorio_sqlite import RepositorioSQLite
+from src.servicio.servidor_http import ServidorClinica
+
+DIAS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabados", "domingos"]
+
+
+class TestServidorHTTP(unittest.TestCase):
+    def setUp(self):
+        self.clinica = Clinica({}, {}, [], {})
+        self.clinica.agregar_paciente(
+            Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+        )
+        medico = Medico("Ana Gómez", "12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", list(DIAS)))
+        self.clinica.agregar_medico(medico)
+        self.inicio = (datetime.now() + timedelta(days=1)).replace(
+            hour=9, minute=0, second=0, microsecond=0
+        )
+        self.servidor = ServidorClinica(self.clinica, puerto=0)
+        self.hilo = Thread(target=self.servidor.serve_forever)
+        self.hilo.start()
+        self.conexion = http.client.HTTPConnection(
+            *self.servidor.server_address, timeout=5
+        )
+
+    def tearDown(self):
+        self.conexion.close()
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.hilo.join()
+
+    def pedir(self, metodo, ruta, cuerpo=None):
+        datos = None if cuerpo is None else json.dumps(cuerpo).encode()
+        self.conexion.request(
+            metodo, ruta, body=datos, headers={"Content-Type": "application/json"}
+        )
+        respuesta = self.conexion.getresponse()
+        return respuesta, respuesta.read()
+
+    def agendar(self, hora: int):
+        return self.pedir(
+            "POST",
+            "/operaciones/agendar_turno",
+            {
+                "dni": "12345678",
+                "matricula": "12345",
+                "especialidad": "Pediatría",
+                "fecha_hora": (self.inicio + timedelta(hours=hora)).isoformat(),
+            },
+        )
+
+    def test_operacion_y_errores(self):
+        respuesta, cuerpo = self.agendar(0)
+        self.assertEqual(respuesta.status, 200)
+        self.assertEqual(json.loads(cuerpo)["resultado"]["matricula"], "12345")
+        respuesta, cuerpo = self.agendar(0)
+        self.assertEqual(respuesta.status, 409)
+        self.assertEqual(json.loads(cuerpo)["error"], "TurnoOcupadoError")
+        respuesta, cuerpo = self.pedir(
+            "POST", "/operaciones/obtener_historia_clinica", {"dni": "1"}
+        )
+        self.assertEqual(respuesta.status, 404)
+        respuesta, _ = self.pedir("POST", "/operaciones/borrar_todo", {})
+        self.assertEqual(respuesta.status, 404)
+        respuesta, cuerpo = self.pedir("POST", "/operaciones/agendar_turno", [1])
+        self.assertEqual(respuesta.status, 400)
+        self.assertEqual(json.loads(cuerpo)["error"], "ValidacionError")
+
+    def test_error_inesperado_responde_500(self):
+        def fallar(*_):
+            raise RuntimeError("falla interna")
+
+        self.clinica.obtener_medicos = fallar
+        self.clinica.obtener_historia_clinica = fallar
+        respuesta, cuerpo = self.pedir("GET", "/medicos")
+        self.assertEqual(respuesta.status, 500)
+        self.assertIn("falla interna", json.loads(cuerpo)["mensaje"])
+        respuesta, cuerpo = self.pedir(
+            "POST", "/operaciones/obtener_historia_clinica", {"dni": "12345678"}
+        )
+        self.assertEqual(respuesta.status, 500)
+        self.assertFalse(json.loads(cuerpo)["ok"])
+        respuesta, cuerpo = self.pedir(
+            "POST", "/lote", [{"id": 1, "op": "obtener_medicos"}]
+        )
+        self.assertEqual(respuesta.status, 200)
+        self.assertFalse(json.loads(cuerpo)[0]["ok"])
+        # La conexión sigue utilizable.
+        respuesta, _ = self.agendar(0)
+        self.assertEqual(respuesta.status, 200)
+
+    def test_conexion_se_reutiliza(self):
+        self.agendar(0)
+        socket = self.conexion.sock
+        for hora in range(1, 20):
+            respuesta, _ = self.agendar(hora)
+            self.assertEqual(respuesta.status, 200)
+        self.assertIs(self.conexion.sock, socket)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 20)
+
+    def test_lote(self):
+        solicitudes = [
+            {
+                "id": i,
+                "op": "agendar_turno",
+                "args": {
+                    "dni": "12345678",
+                    "matricula": "12345",
+                    "especialidad": "Pediatría",
+                    "fecha_hora": (self.inicio + timedelta(hours=i % 3)).isoformat(),
+                },
+            }
+            for i in range(5)
+        ] + [{"id": "h", "op": "obtener_historia_clinica", "args": {"dni": "12345678"}}]
+        respuesta, cuerpo = self.pedir("POST", "/lote", solicitudes)
+        self.assertEqual(respuesta.status, 200)
+        respuestas = json.loads(cuerpo)
+        self.assertEqual([r["id"] for r in respuestas], [0, 1, 2, 3, 4, "h"])
+        self.assertEqual(
+            [r["ok"] for r in respuestas], [True] * 3 + [False] * 2 + [True]
+        )
+        self.assertEqual(len(respuestas[-1]["resultado"]["turnos"]), 3)
+
+    def test_listados_en_ndjson(self):
+        for hora in range(3):
+            self.agendar(hora)
+        self.clinica.agendar_turnos_lote(
+            "12345678",
+            "12345",
+            "Pediatría",
+            [self.inicio + timedelta(days=d) for d in range(1, 3000)],
+        )
+        respuesta, cuerpo = self.pedir("GET", "/turnos")
+        self.assertEqual(respuesta.status, 200)
+        self.assertEqual(respuesta.getheader("Transfer-Encoding"), "chunked")
+        turnos = [json.loads(linea) for linea in cuerpo.splitlines()]
+        self.assertEqual(len(turnos), 3002)
+
+        dia = self.inicio.date().isoformat()
+        respuesta, cuerpo = self.pedir("GET", f"/turnos?fecha={dia}")
+        self.assertEqual(len(cuerpo.splitlines()), 3)
+        respuesta, cuerpo = self.pedir("GET", "/medicos")
+        self.assertEqual(json.loads(cuerpo)["nombre"], "Ana Gómez")
+        respuesta, _ = self.pedir("GET", "/turnos?fecha=ayer")
+        self.assertEqual(respuesta.status, 400)
+        respuesta, _ = self.pedir("GET", "/nada")
+        self.assertEqual(respuesta.status, 404)
+
+
+class TestServidorHTTPConRepositorio(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+        self.repositorio = RepositorioSQLite(self.ruta)
+        self.clinica = Clinica.desde_repositorio(self.repositorio)
+        self.clinica.agregar_paciente(
+            Paciente("Juan Perez", "12345678", datetime(1990, 1, 1))
+        )
+        medico = Medico("Ana Gómez", "12345")
+        medico.agregar_especialidad(Especialidad("Pediatría", list(DIAS)))
+        self.clinica.agregar_medico(medico)
+        self.servidor = ServidorClinica(self.clinica, puerto=0)
+        self.hilo = Thread(target=self.servidor.serve_forever)
+        self.hilo.start()
+
+    def tearDown(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.hilo.join()
+        self.repositorio.cerrar()
+        self.directorio.cleanup()
+
+    def contar_turnos_guardados(self):
+        conexion = sqlite3.connect(self.ruta)
+        (cantidad,) = conexion.execute("SELECT COUNT(*) FROM turnos").fetchone()
+        conexion.close()
+        return cantidad
+
+    def test_operacion_responde_despues_de_confirmar_con_lote_abierto(self):
+        abierto, cerrar = Event(), Event()
+
+        def lote_abierto():
+            # El grupo que abre /lote mientras ejecuta sus solicitudes.
+            with self.clinica.agrupar_escrituras():
+                abierto.set()
+                cerrar.wait()
+
+        lote = Thread(target=lote_abierto)
+        lote.start()
+        abierto.wait()
+        guardados = []
+
+        def agendar():
+            conexion = http.client.HTTPConnection(
+                *self.servidor.server_address, timeout=5
+            )
+            fecha_hora = (datetime.now() + timedelta(days=1)).replace(
+                hour=9, minute=0, second=0, microsecond=0
+            )
+            argumentos = {
+                "dni": "12345678",
+                "matricula": "12345",
+                "especialidad": "Pediatría",
+                "fecha_hora": fecha_hora.isoformat(),
+            }
+            conexion.request(
+                "POST", "/operaciones/agendar_turno", json.dumps(argumentos)
+            )
+            respuesta = conexion.getresponse()
+            respuesta.read()
+            guardados.append((respuesta.status, self.contar_turnos_guardados()))
+            conexion.close()
+
+        pedido = Thread(target=agendar)
+        pedido.start()
+        pedido.join(0.2)
+        cerrar.set()
+        lote.join()
+        pedido.join()
+        # Cuando llega la respuesta, el turno ya es visible desde otra conexión.
+        self.assertEqual(guardados, [(200, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from src.models.turno import Turno
 from src.models.paciente import Paciente
 from src.models.medico import Medico
+from src.models.especialidad import Especialidad
 from src.errors.custom_exception import ValidacionError, TipoDeDatoInvalidoError
 
 
@@ -14,11 +15,28 @@ class TestTurno(unittest.TestCase):
 
     def test_creacion_turno_valido(self):
         turno = Turno(self.paciente, self.medico, self.fecha_futura, "Pediatría")
+        self.assertEqual(turno.obtener_paciente(), self.paciente)
         self.assertEqual(turno.obtener_medico(), self.medico)
         self.assertEqual(turno.obtener_fecha_hora(), self.fecha_futura)
         self.assertIn("Pediatría", str(turno))
         self.assertIn("Juan Perez", str(turno))
         self.assertIn("Ana Gómez", str(turno))
+        self.assertFalse(hasattr(turno, "__dict__"))
+
+    def test_texto_refleja_cambios_del_medico(self):
+        turno = Turno(self.paciente, self.medico, self.fecha_futura, "Pediatría")
+        self.assertIn(self.fecha_futura.strftime("%d/%m/%Y %H:%M"), str(turno))
+        self.medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.assertIn("Especialidades: Pediatría |", str(turno))
+
+    def test_desde_datos_confiables_acepta_turnos_pasados(self):
+        fecha_pasada = datetime(2020, 3, 2, 9, 0)
+        turno = Turno.desde_datos_confiables(
+            self.paciente, self.medico, fecha_pasada, "Pediatría"
+        )
+        self.assertEqual(turno.obtener_fecha_hora(), fecha_pasada)
+        self.assertEqual(turno.obtener_especialidad(), "Pediatría")
+        self.assertIn("02/03/2020 09:00", str(turno))
 
     def test_paciente_no_valido(self):
         with self.assertRaises(TipoDeDatoInvalidoError):
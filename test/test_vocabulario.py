@@ -0,0 +1,30 @@
+import unittest
+from src.utils.vocabulario import RegistroEspecialidades
+
+
+class TestRegistroEspecialidades(unittest.TestCase):
+    def setUp(self):
+        self.registro = RegistroEspecialidades()
+
+    def test_mismo_codigo_sin_distinguir_mayusculas(self):
+        codigo = self.registro.registrar("Pediatría")
+        self.assertEqual(self.registro.registrar(" PEDIATRÍA "), codigo)
+        self.assertEqual(self.registro.obtener_codigo("pediatría"), codigo)
+        self.assertEqual(len(self.registro), 1)
+
+    def test_conserva_el_primer_nombre_internado(self):
+        codigo = self.registro.registrar("Cardiología")
+        self.registro.registrar("cardiología")
+        self.assertEqual(self.registro.obtener_nombre(codigo), "Cardiología")
+        self.assertIs(
+            self.registro.obtener_nombre(codigo),
+            self.registro.obtener_nombre(self.registro.registrar("CARDIOLOGÍA")),
+        )
+
+    def test_nombre_desconocido(self):
+        self.assertIsNone(self.registro.obtener_codigo("Traumatología"))
+        self.assertEqual(len(self.registro), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()